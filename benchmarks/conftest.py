@@ -0,0 +1,142 @@
+# benchmarks/conftest.py
+# Запуск: pytest benchmarks [--bench-rounds=5] [--bench-threshold=0.2] [--bench-update-baseline]
+import os
+from datetime import date, datetime, timedelta
+from pathlib import Path
+import pytest
+from playwright.sync_api import Browser
+from pages.authentication_page import AuthenticationPage
+from settings import get_config, load_env
+from utils.api_client import ApiClient, ApiError
+from utils.benchmark import (DEFAULT_BASELINE_PATH, DEFAULT_THRESHOLD, FlowBenchmark, find_regressions,
+                             load_baseline, save_results)
+from utils.logger import logger
+from utils.token_cache import TokenCache
+
+load_env()
+
+RESULTS_PATH = Path(__file__).resolve().parent / "results" / "latest.json"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks", "Замеры пользовательских сценариев")
+    group.addoption("--bench-rounds", type=int, default=int(os.getenv("BENCH_ROUNDS", 5)),
+                    help="Количество замеряемых прогонов сценария")
+    group.addoption("--bench-warmup", type=int, default=int(os.getenv("BENCH_WARMUP", 1)),
+                    help="Количество прогревочных прогонов, которые не учитываются")
+    group.addoption("--bench-threshold", type=float, default=float(os.getenv("BENCH_THRESHOLD", DEFAULT_THRESHOLD)),
+                    help="Допустимый рост медианы относительно базовой линии (0.2 = 20%%)")
+    group.addoption("--bench-metrics", default=os.getenv("BENCH_METRICS", "duration"),
+                    help="Метрики через запятую, по которым ищется регрессия (duration,lcp,api_max)")
+    group.addoption("--bench-baseline", default=str(DEFAULT_BASELINE_PATH), help="Путь к JSON с базовой линией")
+    group.addoption("--bench-update-baseline", action="store_true",
+                    help="Записать результаты прогона как новую базовую линию вместо сравнения")
+
+
+@pytest.fixture(scope="session")
+def bench_results(request):
+    results = {}
+    yield results
+    if not results:
+        return
+    save_results(RESULTS_PATH, results)
+    logger.info(f"Результаты замеров сохранены в {RESULTS_PATH}")
+    if request.config.getoption("--bench-update-baseline"):
+        path = Path(request.config.getoption("--bench-baseline"))
+        baseline = load_baseline(path)
+        baseline.update(results)
+        save_results(path, baseline)
+        logger.info(f"Базовая линия обновлена: {path}")
+
+
+@pytest.fixture(scope="function")
+def benchmark(request, bench_results):
+    config = request.config
+    baseline_path = Path(config.getoption("--bench-baseline"))
+    update = config.getoption("--bench-update-baseline")
+    # Без базовой линии порог регрессии ничего не проверяет: такой прогон должен падать, а не проходить молча
+    if not update and not baseline_path.exists():
+        pytest.fail(f"Нет базовой линии {baseline_path}: запишите её прогоном с --bench-update-baseline")
+    baseline = load_baseline(baseline_path)
+    metrics = [item.strip() for item in config.getoption("--bench-metrics").split(",") if item.strip()]
+
+    def run(name: str, prepare, action, page_of=None, navigates: bool = False) -> dict:
+        flow = FlowBenchmark(name, config.getoption("--bench-rounds"), config.getoption("--bench-warmup"))
+        summary = flow.run(prepare, action, page_of, navigates)
+        bench_results[name] = summary
+        duration = summary["metrics"]["duration"]
+        logger.info(f"Сценарий {name}: медиана {duration['p50']:.3f}s, p95 {duration['p95']:.3f}s, раундов {summary['rounds']}")
+        if update:
+            return summary
+        if name not in baseline:
+            pytest.fail(f"В {baseline_path} нет сценария {name}: обновите базовую линию через --bench-update-baseline")
+        regressions = find_regressions(summary, baseline[name], config.getoption("--bench-threshold"), metrics)
+        if regressions:
+            pytest.fail(f"Регрессия сценария {name}:\n" + "\n".join(regressions))
+        return summary
+
+    return run
+
+
+@pytest.fixture(scope="session")
+def credentials():
+    return {"email": get_config().email, "password": get_config().password}
+
+
+@pytest.fixture(scope="session")
+def bench_storage_state(browser: Browser, credentials):
+    context = browser.new_context(ignore_https_errors=True)
+    auth_page = AuthenticationPage(context.new_page())
+    auth_page.navigate()
+    auth_page.login(credentials["email"], credentials["password"], expect_success=True)
+    state = context.storage_state()
+    context.close()
+    return state
+
+
+@pytest.fixture(scope="session")
+def bench_api_client(credentials):
+    entry = TokenCache().get_or_login(get_config().api_url, credentials["email"], credentials["password"])
+    client = ApiClient(get_config().api_url, entry["token"])
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def bench_project(bench_api_client: ApiClient):
+    # Проект с цепочкой задач: граф не пустой, доска и список загружают одинаковый объём данных
+    project = bench_api_client.create_project(f"Benchmark Project {datetime.now().strftime('%Y%m%d%H%M%S%f')}",
+                                              "Создан для замеров")
+    previous = None
+    for index in range(5):
+        start = date.today() + timedelta(days=index)
+        task = bench_api_client.create_task(project["id"], f"Benchmark Task {index}", start_date=start,
+                                            due_date=start + timedelta(days=1),
+                                            dependencies=[previous["id"]] if previous else ())
+        previous = task
+    yield project
+    try:
+        bench_api_client.delete_project(project["id"])
+    except ApiError as e:
+        logger.warning(f"Не удалось удалить проект {project['id']}: {e}")
+
+
+@pytest.fixture(scope="function")
+def fresh_page(browser: Browser):
+    # Каждый раунд получает новую страницу, предыдущий контекст закрывается
+    opened = []
+
+    def factory(storage_state=None):
+        while opened:
+            opened.pop().close()
+        context = browser.new_context(storage_state=storage_state, ignore_https_errors=True)
+        opened.append(context)
+        return context.new_page()
+
+    yield factory
+    while opened:
+        opened.pop().close()
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: замер пользовательского сценария")
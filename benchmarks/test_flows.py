@@ -0,0 +1,69 @@
+# benchmarks/test_flows.py
+from datetime import date, datetime, timedelta
+import allure
+import pytest
+from pages.authentication_page import AuthenticationPage
+from pages.dashboard_page import DashboardPage
+from pages.project_view_page import ProjectViewPage
+
+
+@pytest.mark.benchmark
+@allure.title("Замер: вход через форму авторизации")
+def test_login_flow(benchmark, fresh_page, credentials):
+    def prepare():
+        return AuthenticationPage(fresh_page()).navigate()
+
+    def action(auth_page: AuthenticationPage):
+        auth_page.login(credentials["email"], credentials["password"], expect_success=True)
+        DashboardPage(auth_page.page).wait_until_ready()
+
+    benchmark("login", prepare, action, page_of=lambda auth_page: auth_page.page)
+
+
+@pytest.mark.benchmark
+@allure.title("Замер: открытие дашборда")
+def test_open_dashboard_flow(benchmark, fresh_page, bench_storage_state):
+    def prepare():
+        return DashboardPage(fresh_page(bench_storage_state))
+
+    benchmark("open_dashboard", prepare, lambda dashboard: dashboard.navigate(),
+              page_of=lambda dashboard: dashboard.page, navigates=True)
+
+
+@pytest.mark.benchmark
+@allure.title("Замер: открытие проекта с дашборда")
+def test_open_project_flow(benchmark, fresh_page, bench_storage_state, bench_project):
+    def prepare():
+        return DashboardPage(fresh_page(bench_storage_state)).navigate()
+
+    def action(dashboard: DashboardPage):
+        dashboard.open_project(bench_project["name"])
+        dashboard.page.wait_for_url(f"**/projects/{bench_project['id']}", timeout=30000)
+        ProjectViewPage(dashboard.page).wait_until_ready()
+
+    benchmark("open_project", prepare, action, page_of=lambda dashboard: dashboard.page)
+
+
+@pytest.mark.benchmark
+@allure.title("Замер: создание задачи через форму")
+def test_create_task_flow(benchmark, fresh_page, bench_storage_state, bench_project):
+    def prepare():
+        project_page = ProjectViewPage(fresh_page(bench_storage_state)).navigate_to_project(bench_project["id"])
+        start = date.today()
+        return project_page.open_new_task_form().fill_task_form(
+            f"Benchmark UI Task {datetime.now().strftime('%H%M%S%f')}",
+            start.isoformat(), (start + timedelta(days=2)).isoformat()
+        )
+
+    benchmark("create_task", prepare, lambda project_page: project_page.submit_task_form(),
+              page_of=lambda project_page: project_page.page)
+
+
+@pytest.mark.benchmark
+@allure.title("Замер: переключение проекта на вид графа")
+def test_switch_to_graph_flow(benchmark, fresh_page, bench_storage_state, bench_project):
+    def prepare():
+        return ProjectViewPage(fresh_page(bench_storage_state)).navigate_to_project(bench_project["id"])
+
+    benchmark("switch_to_graph", prepare, lambda project_page: project_page.switch_view("Graph"),
+              page_of=lambda project_page: project_page.page)
@@ -0,0 +1,117 @@
+# loadtest/__main__.py
+# Нагрузочный прогон API:
+#   python -m loadtest --users 10,50,100 --duration 60 [--signup] [--scenario update_task_status=3] [--json out.json]
+# Каждое значение --users — отдельный этап, по росту p95 и ошибок между этапами видно точку насыщения
+import argparse
+import asyncio
+import json
+import random
+import string
+import sys
+import requests
+from loadtest.runner import run_stage
+from loadtest.scenarios import SCENARIOS, parse_weights
+from settings import get_config
+from utils.api_client import ApiClient, ApiError
+from utils.data_factory import build_project
+from utils.logger import logger
+from utils.token_cache import TokenCache
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="Нагрузочный прогон REST API сервера")
+    parser.add_argument("--api-url", default=get_config().api_url or None, help="URL API вместе с префиксом /api")
+    parser.add_argument("--users", default="10", help="Число виртуальных пользователей, через запятую — этапы")
+    parser.add_argument("--duration", type=float, default=30, help="Длительность этапа, с")
+    parser.add_argument("--ramp-up", type=float, default=0, help="Время, за которое стартуют все пользователи этапа, с")
+    parser.add_argument("--think-time", type=float, default=0, help="Средняя пауза между запросами пользователя, с")
+    parser.add_argument("--timeout", type=float, default=30, help="Таймаут одного запроса, с")
+    parser.add_argument("--scenario", action="append", metavar="NAME=WEIGHT",
+                        help=f"Вес сценария ({', '.join(SCENARIOS)}), можно повторять")
+    parser.add_argument("--signup", action="store_true",
+                        help="Зарегистрировать отдельный аккаунт на каждого пользователя вместо общего EMAIL")
+    parser.add_argument("--tasks", type=int, default=30, help="Задач в тестовом проекте каждого аккаунта")
+    parser.add_argument("--keep-data", action="store_true", help="Не удалять созданные проекты после прогона")
+    parser.add_argument("--seed", type=int, default=None, help="Seed выбора сценариев")
+    parser.add_argument("--json", dest="json_path", help="Сохранить отчёт в JSON")
+    parser.add_argument("--max-error-rate", type=float, default=None,
+                        help="Завершиться с кодом 1, если доля ошибок на любом этапе выше порога")
+    return parser.parse_args(argv)
+
+
+def signup_account(api_url: str) -> dict:
+    suffix = "".join(random.choices(string.ascii_lowercase + string.digits, k=10))
+    email, password = f"load_{suffix}@mail.ru", "q1w2e3r4t5Y"
+    response = requests.post(f"{api_url}/auth/signup",
+                             json={"username": f"Load{suffix}", "email": email, "password": password}, timeout=10)
+    response.raise_for_status()
+    return {"email": email, "password": password, "token": response.json()["token"]}
+
+
+def prepare_accounts(args, count: int) -> list:
+    if args.signup:
+        logger.info(f"Регистрация {count} аккаунтов для нагрузки")
+        accounts = [signup_account(args.api_url) for _ in range(count)]
+    else:
+        email, password = get_config().email, get_config().password
+        entry = TokenCache().get_or_login(args.api_url, email, password)
+        accounts = [{"email": email, "password": password, "token": entry["token"]}]
+    for account in accounts:
+        # Проект с зависимостями, чтобы запросы задач и зависимостей возвращали реальный объём данных
+        with ApiClient(args.api_url, account["token"]) as client:
+            bulk = build_project(client, args.tasks, name=f"Load Project {account['email']}")
+        account.update(project_id=bulk.project_id, task_ids=bulk.task_ids)
+    return accounts
+
+
+def cleanup(args, accounts: list):
+    for account in accounts:
+        with ApiClient(args.api_url, account["token"]) as client:
+            try:
+                client.delete_project(account["project_id"])
+            except ApiError as e:
+                logger.warning(f"Не удалось удалить проект {account['project_id']}: {e}")
+
+
+def print_stage(stage: dict):
+    print(f"\n=== {stage['users']} пользователей: {stage['requests']} запросов за {stage['elapsed']:.1f} с, "
+          f"{stage['throughput']:.1f} rps, ошибок {stage['error_rate'] * 100:.2f}% ===")
+    if stage["login_failures"]:
+        print(f"Не авторизованы {stage['login_failures']} из {stage['users']} пользователей, этап прошёл без них")
+    print(f"{'маршрут':52} {'rps':>8} {'p50, мс':>9} {'p95, мс':>9} {'p99, мс':>9} {'ошибки':>8}")
+    rows = sorted(stage["routes"].items()) + [("POST /api/auth/login (старт)", stage["login"])]
+    for route, data in rows:
+        print(f"{route[:52]:52} {data['throughput']:8.1f} {data['p50'] * 1000:9.1f} {data['p95'] * 1000:9.1f} "
+              f"{data['p99'] * 1000:9.1f} {data['error_rate'] * 100:7.2f}%")
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if not args.api_url:
+        print("Не задан API_URL (--api-url или переменная окружения)", file=sys.stderr)
+        return 2
+    weights = parse_weights(args.scenario)
+    stages = [int(users) for users in args.users.split(",")]
+    accounts = prepare_accounts(args, max(stages) if args.signup else 1)
+    report = {"weights": weights, "stages": []}
+    try:
+        for users in stages:
+            stage = asyncio.run(run_stage(args.api_url, accounts, users, args.duration, weights,
+                                          args.ramp_up, args.think_time, args.timeout, args.seed))
+            report["stages"].append(stage)
+            print_stage(stage)
+    finally:
+        if not args.keep_data:
+            cleanup(args, accounts)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    # Ошибки авторизации тоже считаются: этап, где никто не вошёл, не должен выглядеть успешным
+    error_rates = [max(stage["error_rate"], stage["login"]["error_rate"]) for stage in report["stages"]]
+    if args.max_error_rate is not None and any(rate > args.max_error_rate for rate in error_rates):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
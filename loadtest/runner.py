@@ -0,0 +1,135 @@
+# loadtest/runner.py
+import asyncio
+import json
+import random
+import time
+from collections import Counter, defaultdict
+import aiohttp
+from loadtest.scenarios import pick
+from utils.logger import logger
+from utils.stats import summarize
+
+LOGIN_ROUTE = "POST /api/auth/login"
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(Counter)
+
+    def record(self, route: str, latency: float, status):
+        # status — HTTP-код или имя исключения, если ответа не было
+        self.latencies[route].append(latency)
+        if not isinstance(status, int) or status >= 400:
+            self.errors[route][status] += 1
+
+    def record_error(self, route: str, status):
+        # Ошибка после уже записанного ответа (например, неразборчивое тело): латентность не дублируется
+        self.errors[route][status] += 1
+
+    def report(self, elapsed: float) -> dict:
+        routes = {}
+        for route, latencies in self.latencies.items():
+            errors = sum(self.errors[route].values())
+            routes[route] = {
+                **summarize(latencies, quantiles=(50, 95, 99)),
+                "throughput": len(latencies) / elapsed if elapsed else 0,
+                "errors": errors,
+                "error_rate": errors / len(latencies),
+                "error_statuses": {str(status): count for status, count in self.errors[route].items()},
+            }
+        return routes
+
+
+class VirtualUser:
+    def __init__(self, index: int, session: aiohttp.ClientSession, api_url: str, account: dict,
+                 recorder: Recorder, seed=None):
+        self.index = index
+        self.session = session
+        self.api_url = api_url.rstrip("/")
+        self.email = account["email"]
+        self.password = account["password"]
+        self.project_id = account["project_id"]
+        self.task_ids = account["task_ids"]
+        self.recorder = recorder
+        self.random = random.Random(None if seed is None else seed + index)
+        self.headers = {}
+
+    async def call(self, method: str, path: str, route: str, **kwargs):
+        started = time.perf_counter()
+        status = None
+        try:
+            async with self.session.request(method, f"{self.api_url}{path}", headers=self.headers, **kwargs) as response:
+                status = response.status
+                body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status = type(e).__name__
+            body = None
+        finally:
+            self.recorder.record(route, time.perf_counter() - started, status)
+        return status, body
+
+    async def login(self):
+        status, body = await self.call("POST", "/auth/login", LOGIN_ROUTE,
+                                       json={"email": self.email, "password": self.password})
+        if status != 200:
+            raise RuntimeError(f"Виртуальный пользователь {self.index} не авторизован: {status}")
+        try:
+            token = json.loads(body)["token"]
+        except (ValueError, KeyError, TypeError) as e:
+            self.recorder.record_error(LOGIN_ROUTE, type(e).__name__)
+            raise RuntimeError(f"Виртуальный пользователь {self.index}: в ответе авторизации нет токена") from e
+        self.headers = {"Authorization": f"Bearer {token}"}
+
+    async def run(self, weights: dict, deadline: float, start_delay: float, think_time: float):
+        await asyncio.sleep(start_delay)
+        loop = asyncio.get_running_loop()
+        while loop.time() < deadline:
+            await pick(self.random, weights)(self)
+            if think_time:
+                await asyncio.sleep(self.random.uniform(0, 2 * think_time))
+
+
+async def run_stage(api_url: str, accounts: list, users: int, duration: float, weights: dict,
+                    ramp_up: float = 0, think_time: float = 0, timeout: float = 30, seed=None) -> dict:
+    """Один этап нагрузки: users виртуальных пользователей в течение duration секунд."""
+    login_recorder = Recorder()
+    recorder = Recorder()
+    connector = aiohttp.TCPConnector(limit=users)
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=timeout)) as session:
+        vus = [VirtualUser(i, session, api_url, accounts[i % len(accounts)], login_recorder, seed) for i in range(users)]
+        logger.info(f"Авторизация {users} виртуальных пользователей")
+        login_started = time.perf_counter()
+        # Неудачный вход уже записан в login_recorder: такой пользователь выбывает, этап продолжается
+        outcomes = await asyncio.gather(*(vu.login() for vu in vus), return_exceptions=True)
+        login_elapsed = time.perf_counter() - login_started
+        failed = [(vu, outcome) for vu, outcome in zip(vus, outcomes) if isinstance(outcome, Exception)]
+        for vu, outcome in failed:
+            logger.warning(f"Пользователь {vu.index} исключён из этапа: {outcome}")
+        vus = [vu for vu, outcome in zip(vus, outcomes) if not isinstance(outcome, Exception)]
+        for vu in vus:
+            vu.recorder = recorder
+
+        logger.info(f"Нагрузка: {len(vus)} из {users} пользователей, {duration} с")
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        deadline = loop.time() + duration
+        await asyncio.gather(*(
+            vu.run(weights, deadline, ramp_up * vu.index / users, think_time) for vu in vus
+        ))
+        elapsed = time.perf_counter() - started
+
+    routes = recorder.report(elapsed)
+    total = sum(route["count"] for route in routes.values())
+    errors = sum(route["errors"] for route in routes.values())
+    return {
+        "users": users,
+        "active_users": len(vus),
+        "login_failures": len(failed),
+        "elapsed": elapsed,
+        "requests": total,
+        "throughput": total / elapsed if elapsed else 0,
+        "error_rate": errors / total if total else 0,
+        "login": login_recorder.report(login_elapsed)[LOGIN_ROUTE],
+        "routes": routes,
+    }
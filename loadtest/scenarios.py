@@ -0,0 +1,54 @@
+# loadtest/scenarios.py
+# Сценарии нагрузки: один запрос к реальному маршруту сервера на сценарий.
+# Имя маршрута в отчёте — шаблон пути, чтобы запросы к разным проектам попадали в одну строку
+import random
+
+# Значения совпадают с перечислением TaskStatus в client/src/app/types/types.ts
+TASK_STATUSES = ("To Do", "In Progress", "Under Review", "Completed")
+
+
+async def list_projects(user):
+    await user.call("GET", "/projects", "GET /api/projects")
+
+
+async def project_tasks(user):
+    await user.call("GET", f"/tasks/{user.project_id}", "GET /api/tasks/:projectId")
+
+
+async def project_dependencies(user):
+    await user.call("GET", f"/projects/{user.project_id}/tasks/dependencies",
+                    "GET /api/projects/:projectId/tasks/dependencies")
+
+
+async def update_task_status(user):
+    task_id = user.random.choice(user.task_ids)
+    await user.call("PATCH", f"/tasks/{task_id}/status", "PATCH /api/tasks/:taskId/status",
+                    json={"status": user.random.choice(TASK_STATUSES)})
+
+
+# Имя сценария -> (функция, вес по умолчанию). Чтение преобладает, как в UI
+SCENARIOS = {
+    "list_projects": (list_projects, 4),
+    "project_tasks": (project_tasks, 4),
+    "project_dependencies": (project_dependencies, 2),
+    "update_task_status": (update_task_status, 1),
+}
+
+
+def parse_weights(items) -> dict:
+    # Переопределения вида name=weight, вес 0 исключает сценарий
+    weights = {name: weight for name, (_, weight) in SCENARIOS.items()}
+    for item in items or ():
+        name, _, value = item.partition("=")
+        if name not in SCENARIOS:
+            raise ValueError(f"Неизвестный сценарий: {name}, допустимые: {', '.join(SCENARIOS)}")
+        weights[name] = int(value)
+    if not any(weights.values()):
+        raise ValueError("Все сценарии отключены нулевыми весами")
+    return weights
+
+
+def pick(rng: random.Random, weights: dict):
+    names = [name for name, weight in weights.items() if weight > 0]
+    name = rng.choices(names, weights=[weights[n] for n in names])[0]
+    return SCENARIOS[name][0]
@@ -0,0 +1,57 @@
+# pages/aio/authentication_page.py
+from playwright.async_api import Page
+from pages.aio.base_page import BasePage
+from pages.aio.dashboard_page import DashboardPage
+from pages.authentication_page import AuthenticationLocators
+from settings import Config
+from utils.instrumentation import page_action
+
+
+class AuthenticationPage(AuthenticationLocators, BasePage):
+    def __init__(self, page: Page, config: Config = None, user: str = None):
+        super().__init__(page, config, user)
+        self.url = f"{self.BASE_URL}/authentication"
+        self.email_input = page.locator(self.EMAIL_INPUT)
+        self.password_input = page.locator(self.PASSWORD_INPUT)
+        self.submit_button = page.locator(self.SUBMIT_BUTTON)
+        self.error_message = page.locator(self.ERROR_MESSAGE)
+        self.signup_link = page.locator(self.SIGNUP_LINK)
+        self.signup_header = page.locator(self.SIGNUP_HEADER)
+        self.signup_name_input = page.locator(self.SIGNUP_NAME_INPUT)
+        self.signup_email_input = page.locator(self.SIGNUP_EMAIL_INPUT)
+        self.signup_phone_input = page.locator(self.SIGNUP_PHONE_INPUT)
+        self.signup_password_input = page.locator(self.SIGNUP_PASSWORD_INPUT)
+        self.signup_confirm_password_input = page.locator(self.SIGNUP_CONFIRM_PASSWORD_INPUT)
+        self.signup_submit_button = page.locator(self.SIGNUP_SUBMIT_BUTTON)
+
+    @page_action
+    async def login(self, email: str, password: str, expect_success=True):
+        self.log(f"Авторизация с email {email}")
+        await self.email_input.fill(email)
+        await self.password_input.fill(password)
+        await self.submit_button.click()
+        if not expect_success:
+            return self
+        await self.page.wait_for_url(f"{self.BASE_URL}/dashboard", timeout=60000)
+        return DashboardPage(self.page, self.config, self.user)
+
+    @page_action
+    async def open_signup_form(self):
+        await self.signup_link.click()
+        await self.signup_header.wait_for(state="visible", timeout=10000)
+        return self
+
+    @page_action
+    async def signup(self, name: str, email: str, phone: str, password: str, confirm_password: str,
+                     expect_success=True):
+        self.log(f"Регистрация {email}")
+        await self.signup_name_input.fill(name)
+        await self.signup_email_input.fill(email)
+        await self.signup_phone_input.fill(phone)
+        await self.signup_password_input.fill(password)
+        await self.signup_confirm_password_input.fill(confirm_password)
+        await self.signup_submit_button.click()
+        if not expect_success:
+            return self
+        await self.page.wait_for_url(f"{self.BASE_URL}/dashboard", timeout=60000)
+        return DashboardPage(self.page, self.config, self.user)
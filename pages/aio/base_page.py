@@ -0,0 +1,62 @@
+# pages/aio/base_page.py
+# Async-версии страниц на playwright.async_api: один процесс ведёт десятки пользователей одновременно.
+# Селекторы и контракт готовности берутся из тех же классов *Locators, что и у sync-страниц.
+# allure.step здесь не используется: шаги параллельных корутин перемешались бы в одном стеке allure,
+# поэтому действия различаются по префиксу пользователя в логе, а длительности пишет page_action.
+from contextlib import AsyncExitStack
+from playwright.async_api import Page
+from pages.base_page import BasePage as SyncBasePage
+from settings import Config, current
+from utils.instrumentation import page_action
+from utils.logger import logger
+
+
+class BasePage:
+    READY_RESPONSES = ()
+    READY_SELECTOR = None
+    READY_TIMEOUT = 30000
+
+    def __init__(self, page: Page, config: Config = None, user: str = None):
+        self.page = page
+        self.config = config or current()
+        self.BASE_URL = self.config.base_url
+        self.API_URL = self.config.api_url
+        page.set_default_timeout(self.config.timeout)
+        self.user = user
+        self.log_prefix = f"[{user}] " if user else ""
+
+    def log(self, message: str):
+        logger.info(f"{self.log_prefix}{message}")
+
+    @page_action
+    async def navigate_to(self, url: str):
+        self.log(f"Переход на {url}")
+        own_url = self._is_own_url(url)
+        async with AsyncExitStack() as stack:
+            if own_url:
+                for pattern in self.READY_RESPONSES:
+                    await stack.enter_async_context(self.page.expect_response(
+                        lambda response, pattern=pattern: SyncBasePage._response_matches(response, pattern),
+                        timeout=self.READY_TIMEOUT
+                    ))
+            await self.page.goto(url, wait_until="domcontentloaded" if own_url else "load", timeout=self.config.navigation_timeout)
+        if own_url:
+            await self.wait_until_ready()
+        self.log(f"Успешно перешёл на {url}")
+
+    async def navigate(self):
+        await self.navigate_to(self.url)
+        return self
+
+    @page_action
+    async def wait_until_ready(self):
+        if self.READY_SELECTOR:
+            await self.page.wait_for_selector(self.READY_SELECTOR, state="visible", timeout=self.READY_TIMEOUT)
+        return self
+
+    @page_action
+    async def wait_for_selector(self, selector: str, timeout: int = 60000):
+        await self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+
+    def _is_own_url(self, url: str) -> bool:
+        return SyncBasePage._is_own_url(self, url)
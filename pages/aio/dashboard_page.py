@@ -0,0 +1,55 @@
+# pages/aio/dashboard_page.py
+from playwright.async_api import Page
+from pages.aio.base_page import BasePage
+from pages.dashboard_page import DashboardLocators
+from settings import Config
+from utils.instrumentation import page_action
+
+
+class DashboardPage(DashboardLocators, BasePage):
+    def __init__(self, page: Page, config: Config = None, user: str = None):
+        super().__init__(page, config, user)
+        self.url = f"{self.BASE_URL}/dashboard"
+        self.plus_button = page.locator(self.PLUS_BUTTON)
+        self.project_list = page.locator(self.PROJECT_LIST)
+        self.profile_selector = page.locator(self.PROFILE_SELECTOR)
+        self.logout_option = page.locator(self.LOGOUT_OPTION)
+
+    @page_action
+    async def click_plus_button(self):
+        await self.wait_for_selector(self.PLUS_BUTTON, timeout=30000)
+        await self.plus_button.click()
+        await self.wait_for_selector(self.CREATE_PROJECT_FORM, timeout=30000)
+        self.log("Форма создания проекта открыта")
+        return self
+
+    @page_action
+    async def delete_first_project(self):
+        await self.page.locator(self.PROJECT_MENU).first.click()
+        await self.page.locator(self.DELETE_OPTION).click()
+        self.log("Первый проект удалён")
+        return await self.project_list.first.text_content()
+
+    @page_action
+    async def open_project(self, project_name: str):
+        selector = f"text={project_name}"
+        await self.wait_for_selector(selector, timeout=30000)
+        await self.page.locator(selector).click()
+        self.log(f"Открыт проект: {project_name}")
+        return self
+
+    @page_action
+    async def is_loaded(self):
+        await self.page.wait_for_url(f"{self.BASE_URL}/dashboard", timeout=30000)
+        return self.page.url == f"{self.BASE_URL}/dashboard"
+
+    @page_action
+    async def logout(self):
+        await self.profile_selector.wait_for(state="visible", timeout=10000)
+        await self.profile_selector.click()
+        await self.logout_option.wait_for(state="visible", timeout=10000)
+        await self.logout_option.click()
+        await self.page.wait_for_url(f"{self.BASE_URL}/authentication", timeout=30000)
+        from pages.aio.authentication_page import AuthenticationPage
+        self.log("Выход из системы выполнен")
+        return AuthenticationPage(self.page, self.config, self.user)
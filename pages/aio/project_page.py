@@ -0,0 +1,85 @@
+# pages/aio/project_page.py
+from playwright.async_api import Page
+from pages.aio.base_page import BasePage
+from pages.project_page import ProjectLocators
+from settings import Config
+from utils.instrumentation import page_action
+
+
+class ProjectPage(ProjectLocators, BasePage):
+    def __init__(self, page: Page, config: Config = None, user: str = None):
+        super().__init__(page, config, user)
+        self.url = f"{self.BASE_URL}/dashboard"
+        self.project_name_input = page.locator(self.PROJECT_NAME_INPUT)
+        self.description_input = page.locator(self.DESCRIPTION_INPUT)
+        self.start_date_input = page.locator(self.START_DATE_INPUT)
+        self.end_date_input = page.locator(self.END_DATE_INPUT)
+        self.status_select = page.locator(self.STATUS_SELECT)
+        self.create_button = page.locator(self.CREATE_BUTTON)
+        self.cancel_button = page.locator(self.CANCEL_BUTTON)
+
+    @page_action
+    async def fill_project_name(self, name: str):
+        await self.wait_for_selector(self.PROJECT_NAME_INPUT, timeout=30000)
+        await self.project_name_input.fill(name)
+        return self
+
+    @page_action
+    async def fill_description(self, description: str):
+        await self.wait_for_selector(self.DESCRIPTION_INPUT, timeout=30000)
+        await self.description_input.fill(description)
+        return self
+
+    @page_action
+    async def fill_start_date(self, date: str):
+        await self.wait_for_selector(self.START_DATE_INPUT, timeout=30000)
+        await self.start_date_input.fill(date)
+        return self
+
+    @page_action
+    async def fill_end_date(self, date: str):
+        await self.wait_for_selector(self.END_DATE_INPUT, timeout=30000)
+        await self.end_date_input.fill(date)
+        return self
+
+    @page_action
+    async def fill_status(self, status: str):
+        await self.wait_for_selector(self.STATUS_SELECT, timeout=30000)
+        await self.status_select.select_option(status)
+        return self
+
+    @page_action
+    async def submit_create_project(self):
+        await self.wait_for_selector(self.ENABLED_CREATE_BUTTON, timeout=30000)
+        await self.create_button.click()
+        self.log("Форма создания проекта отправлена")
+        return self
+
+    @page_action
+    async def create_project(self, name: str, description: str, start_date: str, end_date: str, status: str = None):
+        # Заполнение и отправка формы одним действием: удобно в сценариях с множеством пользователей
+        await self.fill_project_name(name)
+        await self.fill_description(description)
+        await self.fill_start_date(start_date)
+        await self.fill_end_date(end_date)
+        if status:
+            await self.fill_status(status)
+        return await self.submit_create_project()
+
+    @page_action
+    async def cancel_create_form(self):
+        await self.cancel_button.click()
+        return self
+
+    @page_action
+    async def is_create_form_visible(self):
+        return await self.project_name_input.is_visible()
+
+    @page_action
+    async def is_project_visible(self, project_name: str):
+        await self.wait_for_selector(f"text='{project_name}'", timeout=30000)
+        return await self.page.locator(f"text='{project_name}'").is_visible()
+
+    @page_action
+    async def is_create_button_enabled(self):
+        return await self.create_button.is_enabled()
@@ -1,45 +1,91 @@
 # pages/authentication_page.py
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 from pages.base_page import BasePage
+from settings import Config
 import allure
+from utils.diagnostics import checkpoint
+from utils.instrumentation import page_action
 from utils.logger import logger
 from pages.dashboard_page import DashboardPage
 import random
 import string
 
-class AuthenticationPage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
+class AuthenticationLocators:
+    # Селекторы и контракт готовности, общие для sync- и async-версии страницы (pages/aio)
+    READY_SELECTOR = "input[placeholder='Enter your email']"
+    # Форма авторизации
+    EMAIL_INPUT = "input[placeholder='Enter your email']"
+    PASSWORD_INPUT = "input[placeholder='Enter your password']"
+    SUBMIT_BUTTON = "button:has-text('Sign In')"
+    ERROR_MESSAGE = "div.text-red-500:has-text('Invalid credentials'), div.text-red-500:has-text('Account locked'), div.text-red-500:has-text('Please fill in all fields')"
+    SIGNIN_HEADER = "h2.text-2xl.font-semibold.text-center.text-primary-600:has-text('Sign In')"
+    # Форма регистрации
+    SIGNUP_LINK = "span.text-primary-600.font-bold.cursor-pointer:has-text('Sign Up')"
+    SIGNUP_HEADER = "h2.text-2xl.font-semibold.text-center.text-primary-600:has-text('Sign Up')"
+    SIGNUP_NAME_INPUT = "input#name"
+    SIGNUP_EMAIL_INPUT = "input#email"
+    SIGNUP_PHONE_INPUT = "input#phone"
+    SIGNUP_PASSWORD_INPUT = "input#password"
+    SIGNUP_CONFIRM_PASSWORD_INPUT = "input#confirmPassword"
+    SIGNUP_SUBMIT_BUTTON = "button.w-full:has-text('Sign Up')"
+    # Ссылка-переключатель Sign In/Sign Up: есть на обеих формах, переключение пересоздаёт компонент формы
+    SWITCH_FORM_LINK = "span.text-primary-600.font-bold.cursor-pointer"
+    SIGNUP_ERROR_MESSAGE = "p.text-red-500:has-text('All fields are required'), p.text-red-500:has-text('Passwords do not match')"
+
+
+class AuthenticationPage(AuthenticationLocators, BasePage):
+    def __init__(self, page: Page, config: Config = None):
+        super().__init__(page, config)
         self.url = f"{self.BASE_URL}/authentication"
         # Селекторы для формы авторизации
-        self.email_input = page.locator("input[placeholder='Enter your email']")
-        self.password_input = page.locator("input[placeholder='Enter your password']")
-        self.submit_button = page.locator("button:has-text('Sign In')")
-        self.error_message = page.locator("div.text-red-500:has-text('Invalid credentials'), div.text-red-500:has-text('Account locked'), div.text-red-500:has-text('Please fill in all fields')")
+        self.email_input = page.locator(self.EMAIL_INPUT)
+        self.password_input = page.locator(self.PASSWORD_INPUT)
+        self.submit_button = page.locator(self.SUBMIT_BUTTON)
+        self.error_message = page.locator(self.ERROR_MESSAGE)
         # Селекторы для формы регистрации
-        self.signup_link = page.locator("span.text-primary-600.font-bold.cursor-pointer:has-text('Sign Up')")
-        self.signup_header = page.locator("h2.text-2xl.font-semibold.text-center.text-primary-600:has-text('Sign Up')")
-        self.signup_name_input = page.locator("input#name")
-        self.signup_email_input = page.locator("input#email")
-        self.signup_phone_input = page.locator("input#phone")
-        self.signup_password_input = page.locator("input#password")
-        self.signup_confirm_password_input = page.locator("input#confirmPassword")
-        self.signup_submit_button = page.locator("button.w-full:has-text('Sign Up')")
-        self.signup_error_message = page.locator("p.text-red-500:has-text('All fields are required'), p.text-red-500:has-text('Passwords do not match')")
-
+        self.signup_link = page.locator(self.SIGNUP_LINK)
+        self.signup_header = page.locator(self.SIGNUP_HEADER)
+        self.signup_name_input = page.locator(self.SIGNUP_NAME_INPUT)
+        self.signup_email_input = page.locator(self.SIGNUP_EMAIL_INPUT)
+        self.signup_phone_input = page.locator(self.SIGNUP_PHONE_INPUT)
+        self.signup_password_input = page.locator(self.SIGNUP_PASSWORD_INPUT)
+        self.signup_confirm_password_input = page.locator(self.SIGNUP_CONFIRM_PASSWORD_INPUT)
+        self.signup_submit_button = page.locator(self.SIGNUP_SUBMIT_BUTTON)
+        self.signup_error_message = page.locator(self.SIGNUP_ERROR_MESSAGE)
+
+    @page_action
     @allure.step("Переход на страницу авторизации")
     def navigate(self, url=None):
         target_url = url if url else self.url
         logger.info(f"Переход на {target_url}")
+        # Для /authentication видимость полей проверяется контрактом готовности
+        self.navigate_to(target_url)
+        return self
+
+    @page_action
+    @allure.step("Сброс формы авторизации")
+    def reset(self, signup: bool = False):
+        # Поля и ошибки хранятся в состоянии компонентов SignIn/Signup, и переключение формы
+        # пересоздаёт компонент: форма очищается без перезагрузки. Страница открывается заново,
+        # только если она ушла с /authentication или переключатель не сработал
+        if not self._is_own_url(self.page.url):
+            self.navigate()
+            return self.open_signup_form() if signup else self
+        forms = {False: self.page.locator(self.SIGNIN_HEADER), True: self.signup_header}
         try:
-            self.navigate_to(target_url)
-            if not url:  # Только для /authentication ждём видимости полей
-                self.email_input.wait_for(state="visible", timeout=60000)
-        except Exception as e:
-            logger.error(f"Не удалось перейти на страницу: {e}")
-            self.take_screenshot(f"navigation_error_{target_url.split('/')[-1]}.png")
-            allure.attach.file(f"navigation_error_{target_url.split('/')[-1]}.png", name="Скриншот ошибки навигации", attachment_type=allure.attachment_type.PNG)
-            raise
+            on_signup = self.signup_header.is_visible()
+            if on_signup == signup:
+                # Нужна та же форма: уходим на другую и возвращаемся
+                self.page.locator(self.SWITCH_FORM_LINK).click(timeout=5000)
+                forms[not on_signup].wait_for(state="visible", timeout=5000)
+            self.page.locator(self.SWITCH_FORM_LINK).click(timeout=5000)
+            forms[signup].wait_for(state="visible", timeout=5000)
+            logger.info("Форма сброшена без перезагрузки")
+        except PlaywrightTimeoutError as e:
+            logger.warning(f"Не удалось сбросить форму на месте, перезагрузка страницы: {e}")
+            self.navigate()
+            if signup:
+                self.open_signup_form()
         return self
 
     @allure.step("Проверка загрузки страницы авторизации")
@@ -59,20 +105,15 @@ class AuthenticationPage(BasePage):
         self.password_input.fill(password)
         return self
 
+    @page_action
     @allure.step("Отправка формы авторизации")
     def submit_login(self, expect_success=True):
         self.submit_button.click()
         if expect_success:
-            try:
-                self.page.wait_for_url(f"{self.BASE_URL}/dashboard", timeout=60000)
-                return DashboardPage(self.page)
-            except PlaywrightTimeoutError as e:
-                logger.error(f"Не удалось перейти на дашборд: {e}")
-                allure.attach(self.page.content(), name="post_submit_login.html", attachment_type=allure.attachment_type.HTML)
-                raise
-        else:
-            logger.info("Запись содержимого страницы после неудачной попытки входа")
-            allure.attach(self.page.content(), name="failed_login_attempt.html", attachment_type=allure.attachment_type.HTML)
+            self.page.wait_for_url(f"{self.BASE_URL}/dashboard", timeout=60000)
+            return DashboardPage(self.page, self.config)
+        # HTML снимается диагностикой только при падении теста, а не на каждой ожидаемой ошибке
+        checkpoint("failed_login_attempt.png", self.page)
         return self
 
     @allure.step("Авторизация с email {email} и паролем")
@@ -81,16 +122,12 @@ class AuthenticationPage(BasePage):
         self.fill_password(password)
         return self.submit_login(expect_success=expect_success)
 
+    @page_action
     @allure.step("Открытие формы регистрации")
     def open_signup_form(self):
         self.signup_link.click()
-        try:
-            self.signup_header.wait_for(state="visible", timeout=10000)
-            logger.info("Форма регистрации открыта")
-        except PlaywrightTimeoutError as e:
-            logger.error(f"Форма регистрации не открыта: {e}")
-            allure.attach(self.page.content(), name="signup_form_error.html", attachment_type=allure.attachment_type.HTML)
-            raise
+        self.signup_header.wait_for(state="visible", timeout=10000)
+        logger.info("Форма регистрации открыта")
         return self
 
     @allure.step("Ввод имени: {name}")
@@ -118,21 +155,15 @@ class AuthenticationPage(BasePage):
         self.signup_confirm_password_input.fill(password)
         return self
 
+    @page_action
     @allure.step("Отправка формы регистрации")
     def submit_signup(self, expect_success=True):
         self.signup_submit_button.click()
         if expect_success:
-            try:
-                self.page.wait_for_url(f"{self.BASE_URL}/dashboard", timeout=60000)
-                logger.info("Успешный переход на дашборд после регистрации")
-                return DashboardPage(self.page)
-            except PlaywrightTimeoutError as e:
-                logger.error(f"Не удалось перейти на дашборд: {e}")
-                allure.attach(self.page.content(), name="post_submit_signup.html", attachment_type=allure.attachment_type.HTML)
-                raise
-        else:
-            logger.info("Запись содержимого страницы после неудачной попытки регистрации")
-            allure.attach(self.page.content(), name="failed_signup_attempt.html", attachment_type=allure.attachment_type.HTML)
+            self.page.wait_for_url(f"{self.BASE_URL}/dashboard", timeout=60000)
+            logger.info("Успешный переход на дашборд после регистрации")
+            return DashboardPage(self.page, self.config)
+        checkpoint("failed_signup_attempt.png", self.page)
         return self
 
     @allure.step("Регистрация с данными")
@@ -1,44 +1,83 @@
 # pages/base_page.py
+from contextlib import ExitStack
+from fnmatch import fnmatch
 from playwright.sync_api import Page
+from settings import Config, current
+from utils.dom_snapshot import Snapshot, take_snapshot, wait_for_snapshot
+from utils.instrumentation import page_action
 from utils.logger import logger
-from dotenv import load_dotenv
 import allure
-import os
 
 
-load_dotenv()
-
 class BasePage:
-    BASE_URL = os.getenv("BASE_URL")
-    API_URL = os.getenv("API_URL")
+    # Контракт готовности страницы (переопределяется в наследниках):
+    # READY_RESPONSES — шаблоны URL запросов API, ответы на которые должны прийти после перехода;
+    # READY_SELECTOR — элемент, видимость которого означает, что страница отрисована.
+    READY_RESPONSES = ()
+    READY_SELECTOR = None
+    READY_TIMEOUT = 30000
 
-    def __init__(self, page):
+    def __init__(self, page, config: Config = None):
         self.page = page
+        # Конфиг внедряется фикстурой app_config; без него — конфиг текущей сессии
+        self.config = config or current()
+        self.BASE_URL = self.config.base_url
+        self.API_URL = self.config.api_url
+        page.set_default_timeout(self.config.timeout)
 
+    @page_action
     @allure.step("Переход на URL: {url}")
     def navigate_to(self, url: str):
         logger.info(f"Переход на {url}")
-        try:
-            self.page.goto(url, wait_until="networkidle", timeout=60000)
-            logger.info(f"Успешно перешёл на {url}")
-        except Exception as e:
-            logger.error(f"Не удалось перейти на {url}: {e}")
-            allure.attach(self.page.content(), name="navigation_error.html", attachment_type=allure.attachment_type.HTML)
-            allure.attach(self.page.screenshot(), name="navigation_error.png", attachment_type=allure.attachment_type.PNG)
-            raise
+        # Контракт относится к собственному URL страницы, для остальных адресов ждём событие load
+        own_url = self._is_own_url(url)
+        with ExitStack() as stack:
+            if own_url:
+                for pattern in self.READY_RESPONSES:
+                    stack.enter_context(self.page.expect_response(
+                        lambda response, pattern=pattern: self._response_matches(response, pattern),
+                        timeout=self.READY_TIMEOUT
+                    ))
+            self.page.goto(url, wait_until="domcontentloaded" if own_url else "load", timeout=self.config.navigation_timeout)
+        if own_url:
+            self.wait_until_ready()
+        logger.info(f"Успешно перешёл на {url}")
+
+    def navigate(self):
+        self.navigate_to(self.url)
+        return self
+
+    @page_action
+    @allure.step("Ожидание готовности страницы")
+    def wait_until_ready(self):
+        if self.READY_SELECTOR:
+            self.page.wait_for_selector(self.READY_SELECTOR, state="visible", timeout=self.READY_TIMEOUT)
+        return self
 
+    @page_action
     @allure.step("Ожидание видимости элемента")
     def wait_for_selector(self, selector: str, timeout: int = 60000):
         logger.info(f"Ожидание элемента: {selector}")
-        try:
-            self.page.wait_for_selector(selector, state="visible", timeout=timeout)
-        except Exception as e:
-            logger.error(f"Элемент {selector} не найден: {e}")
-            allure.attach(self.page.content(), name="selector_error.html", attachment_type=allure.attachment_type.HTML)
-            allure.attach(self.page.screenshot(), name="selector_error.png", attachment_type=allure.attachment_type.PNG)
-            raise
+        self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+
+    @page_action
+    @allure.step("Снимок состояния элементов")
+    def snapshot(self, spec: dict, attributes=(), until=None, timeout: int = None) -> Snapshot:
+        # Видимость, текст, атрибуты и число совпадений для всех селекторов spec за один evaluate;
+        # с until снимок повторяется, пока until(snapshot) не вернёт True
+        if until is None:
+            return take_snapshot(self.page, spec, attributes)
+        return wait_for_snapshot(self.page, spec, until, attributes, timeout=timeout or self.READY_TIMEOUT)
 
     @allure.step("Сохранение скриншота")
     def take_screenshot(self, filename: str):
         logger.info(f"Сохранение скриншота: {filename}")
-        self.page.screenshot(path=filename)
\ No newline at end of file
+        self.page.screenshot(path=filename)
+
+    def _is_own_url(self, url: str) -> bool:
+        own = getattr(self, "url", None)
+        return bool(own) and url.split("?")[0].rstrip("/") == own.rstrip("/")
+
+    @staticmethod
+    def _response_matches(response, pattern: str) -> bool:
+        return response.request.method == "GET" and fnmatch(response.url.split("?")[0], pattern)
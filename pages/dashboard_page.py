@@ -1,145 +1,126 @@
 # pages/dashboard_page.py
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from settings import Config
 import allure
 from utils.logger import logger
-from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from utils.instrumentation import page_action
+from pages.members_page import MembersPage
+from pages.messages_page import MessagesPage
+from pages.tasks_page import TasksPage
 
-class DashboardPage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
+class DashboardLocators:
+    # Селекторы и контракт готовности, общие для sync- и async-версии страницы (pages/aio)
+    READY_RESPONSES = ("*/api/projects", "*/api/tasks/")
+    PLUS_BUTTON = "button:has(svg.lucide.lucide-plus)"
+    CREATE_PROJECT_FORM = "form.mt-6.flex.flex-col.gap-4"
+    PROJECT_LIST = ".relative.flex.items-center.w-full"
+    PROJECT_MENU = "div.flex.items-center.w-full >> svg.lucide-ellipsis"
+    DELETE_OPTION = 'p.text-red-500:text("Delete")'
+    PROFILE_SELECTOR = "div.relative:has(svg.lucide-chevron-down), button[role='button']:has-text('Profile')"
+    LOGOUT_OPTION = "text=Logout"
+
+
+class DashboardPage(DashboardLocators, BasePage):
+    def __init__(self, page: Page, config: Config = None):
+        super().__init__(page, config)
         self.url = f"{self.BASE_URL}/dashboard"
-        self.plus_button = page.locator("button:has(svg.lucide.lucide-plus)")
-        self.project_list = page.locator(".relative.flex.items-center.w-full")
-        self.profile_selector = page.locator("div.relative:has(svg.lucide-chevron-down), button[role='button']:has-text('Profile')")
-        self.logout_option = page.locator("text=Logout")
+        self.plus_button = page.locator(self.PLUS_BUTTON)
+        self.project_list = page.locator(self.PROJECT_LIST)
+        self.profile_selector = page.locator(self.PROFILE_SELECTOR)
+        self.logout_option = page.locator(self.LOGOUT_OPTION)
 
+    @page_action
     @allure.step("Открытие формы создания проекта")
     def click_plus_button(self):
         logger.info("Ожидание видимости кнопки плюс")
-        plus_button_selector = "button:has(svg.lucide.lucide-plus)"
-        try:
-            self.wait_for_selector(plus_button_selector, timeout=30000)
-            self.plus_button.click()
-            logger.info("Клик по кнопке плюс выполнен")
-        except PlaywrightTimeoutError as e:
-            logger.error(f"Кнопка плюс не найдена: {e}")
-            allure.attach(self.page.content(), name="plus_button_error.html", attachment_type=allure.attachment_type.HTML)
-            allure.attach(self.page.screenshot(), name="plus_button_error.png", attachment_type=allure.attachment_type.PNG)
-            raise
+        self.wait_for_selector(self.PLUS_BUTTON, timeout=30000)
+        self.plus_button.click()
+        logger.info("Клик по кнопке плюс выполнен")
         logger.info("Ожидание формы создания проекта")
-        form_selector = "form.mt-6.flex.flex-col.gap-4"
-        try:
-            self.wait_for_selector(form_selector, timeout=30000)
-            logger.info("Форма создания проекта загружена")
-        except PlaywrightTimeoutError as e:
-            logger.error(f"Форма не найдена: {e}")
-            allure.attach(self.page.content(), name="form_error.html", attachment_type=allure.attachment_type.HTML)
-            allure.attach(self.page.screenshot(), name="form_error.png", attachment_type=allure.attachment_type.PNG)
-            raise
+        self.wait_for_selector(self.CREATE_PROJECT_FORM, timeout=30000)
+        logger.info("Форма создания проекта загружена")
         return self
 
+    @page_action
     @allure.step("Удаление первого проекта в списке")
     def delete_first_project(self):
         logger.info("Удаление первого проекта")
-        try:
-            self.page.locator('div.flex.items-center.w-full >> svg.lucide-ellipsis').first.click()
-            self.page.locator('p.text-red-500:text("Delete")').click()
-            logger.info("Первый проект удалён")
-            return self.page.locator(".relative.flex.items-center.w-full").first.text_content()
-        except PlaywrightTimeoutError as e:
-            logger.error(f"Не удалось удалить проект: {e}")
-            allure.attach(self.page.content(), name="delete_project_error.html", attachment_type=allure.attachment_type.HTML)
-            allure.attach(self.page.screenshot(), name="delete_project_error.png", attachment_type=allure.attachment_type.PNG)
-            raise
+        self.page.locator(self.PROJECT_MENU).first.click()
+        self.page.locator(self.DELETE_OPTION).click()
+        logger.info("Первый проект удалён")
+        return self.project_list.first.text_content()
+
+    @page_action
+    @allure.step("Удаление проекта: {project_name}")
+    def delete_project(self, project_name: str):
+        # Удаляется строка с заданным названием, а не первая в списке: при параллельном прогоне
+        # под общим пользователем первым может оказаться проект другого воркера
+        logger.info(f"Удаление проекта: {project_name}")
+        row = self.project_list.filter(has=self.page.get_by_text(project_name, exact=True))
+        row.locator("svg.lucide-ellipsis").click()
+        row.locator(self.DELETE_OPTION).click()
+        row.wait_for(state="detached", timeout=30000)
+        logger.info(f"Проект {project_name} удалён")
+        return self
 
+    @page_action
     @allure.step("Открытие проекта по названию")
     def open_project(self, project_name: str):
         logger.info(f"Открытие проекта: {project_name}")
-        try:
-            project_selector = f"text={project_name}"
-            self.wait_for_selector(project_selector, timeout=30000)
-            self.page.locator(project_selector).click()
-            logger.info(f"Клик по проекту: {project_name}")
-        except PlaywrightTimeoutError as e:
-            logger.error(f"Не удалось открыть проект: {e}")
-            allure.attach(self.page.content(), name="open_project_error.html", attachment_type=allure.attachment_type.HTML)
-            allure.attach(self.page.screenshot(), name="open_project_error.png", attachment_type=allure.attachment_type.PNG)
-            raise
+        project_selector = f"text={project_name}"
+        self.wait_for_selector(project_selector, timeout=30000)
+        self.page.locator(project_selector).click()
+        logger.info(f"Клик по проекту: {project_name}")
         return self
 
+    @page_action
     @allure.step("Переход в раздел сообщений")
     def go_to_messages(self):
         logger.info("Переход в раздел сообщений")
-        try:
-            self.navigate_to(f"{self.BASE_URL}/messages")
-            self.page.wait_for_url(f"{self.BASE_URL}/messages", timeout=30000)
-            logger.info("Раздел сообщений загружен")
-        except PlaywrightTimeoutError as e:
-            logger.error(f"Не удалось перейти в раздел сообщений: {e}")
-            allure.attach(self.page.content(), name="messages_error.html", attachment_type=allure.attachment_type.HTML)
-            allure.attach(self.page.screenshot(), name="messages_error.png", attachment_type=allure.attachment_type.PNG)
-            raise
+        MessagesPage(self.page, self.config).navigate()
+        self.page.wait_for_url(f"{self.BASE_URL}/messages", timeout=30000)
+        logger.info("Раздел сообщений загружен")
         return self
 
+    @page_action
     @allure.step("Переход в раздел участников")
     def go_to_members(self):
         logger.info("Переход в раздел участников")
-        try:
-            self.navigate_to(f"{self.BASE_URL}/members")
-            self.page.wait_for_url(f"{self.BASE_URL}/members", timeout=30000)
-            logger.info("Раздел участников загружен")
-        except PlaywrightTimeoutError as e:
-            logger.error(f"Не удалось перейти в раздел участников: {e}")
-            allure.attach(self.page.content(), name="members_error.html", attachment_type=allure.attachment_type.HTML)
-            allure.attach(self.page.screenshot(), name="members_error.png", attachment_type=allure.attachment_type.PNG)
-            raise
+        MembersPage(self.page, self.config).navigate()
+        self.page.wait_for_url(f"{self.BASE_URL}/members", timeout=30000)
+        logger.info("Раздел участников загружен")
         return self
 
+    @page_action
     @allure.step("Переход в раздел задач")
     def go_to_tasks(self):
         logger.info("Переход в раздел задач")
-        try:
-            self.navigate_to(f"{self.BASE_URL}/tasks")
-            self.page.wait_for_url(f"{self.BASE_URL}/tasks", timeout=30000)
-            logger.info("Раздел задач загружен")
-        except PlaywrightTimeoutError as e:
-            logger.error(f"Не удалось перейти в раздел задач: {e}")
-            allure.attach(self.page.content(), name="tasks_error.html", attachment_type=allure.attachment_type.HTML)
-            allure.attach(self.page.screenshot(), name="tasks_error.png", attachment_type=allure.attachment_type.PNG)
-            raise
+        TasksPage(self.page, self.config).navigate()
+        self.page.wait_for_url(f"{self.BASE_URL}/tasks", timeout=30000)
+        logger.info("Раздел задач загружен")
         return self
 
+    @page_action
     @allure.step("Проверка загрузки дашборда")
     def is_loaded(self):
         logger.info("Проверка загрузки дашборда")
-        try:
-            self.page.wait_for_url(f"{self.BASE_URL}/dashboard", timeout=30000)
-            return self.page.url == f"{self.BASE_URL}/dashboard"
-        except PlaywrightTimeoutError as e:
-            logger.error(f"Дашборд не загружен: {e}")
-            allure.attach(self.page.content(), name="dashboard_load_error.html", attachment_type=allure.attachment_type.HTML)
-            allure.attach(self.page.screenshot(), name="dashboard_load_error.png", attachment_type=allure.attachment_type.PNG)
-            raise
+        self.page.wait_for_url(f"{self.BASE_URL}/dashboard", timeout=30000)
+        return self.page.url == f"{self.BASE_URL}/dashboard"
 
+    @page_action
     @allure.step("Выполнение выхода из системы")
     def logout(self):
-        try:
-            logger.info("Ожидание видимости селектора профиля")
-            self.profile_selector.wait_for(state="visible", timeout=10000)
-            logger.info("Клик по селектору профиля")
-            self.profile_selector.click()
-            logger.info("Ожидание видимости опции выхода")
-            self.logout_option.wait_for(state="visible", timeout=10000)
-            logger.info("Клик по опции выхода")
-            self.logout_option.click()
-            logger.info("Ожидание страницы авторизации")
-            self.page.wait_for_url(f"{self.BASE_URL}/authentication", timeout=30000)
-        except PlaywrightTimeoutError as e:
-            logger.error(f"Выход не удался: {e}")
-            allure.attach(self.page.content(), name="logout_error.html", attachment_type=allure.attachment_type.HTML)
-            allure.attach(self.page.screenshot(), name="logout_error.png", attachment_type=allure.attachment_type.PNG)
-            raise
+        logger.info("Ожидание видимости селектора профиля")
+        self.profile_selector.wait_for(state="visible", timeout=10000)
+        logger.info("Клик по селектору профиля")
+        self.profile_selector.click()
+        logger.info("Ожидание видимости опции выхода")
+        self.logout_option.wait_for(state="visible", timeout=10000)
+        logger.info("Клик по опции выхода")
+        self.logout_option.click()
+        logger.info("Ожидание страницы авторизации")
+        self.page.wait_for_url(f"{self.BASE_URL}/authentication", timeout=30000)
         from pages.authentication_page import AuthenticationPage
         logger.info(f"Перенаправлено на: {self.page.url}")
-        return AuthenticationPage(self.page)
\ No newline at end of file
+        return AuthenticationPage(self.page, self.config)
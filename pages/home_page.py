@@ -1,19 +1,22 @@
 from playwright.sync_api import Page
 from pages.base_page import BasePage
 import allure
-from settings import BASE_URL
+from settings import Config
 from utils.logger import logger
 
 class HomePage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
-        self.url = BASE_URL
+    # Корень отрисовывает дашборд
+    READY_RESPONSES = ("*/api/projects", "*/api/tasks/")
+
+    def __init__(self, page: Page, config: Config = None):
+        super().__init__(page, config)
+        self.url = self.BASE_URL
 
 
     @allure.step("Переход на главную страницу")
     def navigate(self):
         logger.info(f"Переход на главную страницу: {self.url}")
-        self.page.goto(self.url, wait_until="networkidle", timeout=60000)
+        self.navigate_to(self.url)
         logger.info(f"Текущий URL: {self.page.url}")
         return self
 
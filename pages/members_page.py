@@ -2,15 +2,20 @@
 import allure
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from settings import Config
 from utils.logger import logger
 
 class MembersPage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    READY_RESPONSES = ("*/api/teams",)
+    READY_SELECTOR = "h1:has-text('My Teams')"
+
+    def __init__(self, page: Page, config: Config = None):
+        super().__init__(page, config)
         self.url = f"{self.BASE_URL}/members"
 
     @allure.step("Проверка загрузки страницы участников")
     def is_loaded(self):
         logger.info(f"Проверка URL страницы участников: {self.page.url}")
-        self.page.wait_for_url(self.url, wait_until="networkidle", timeout=60000)
+        self.page.wait_for_url(self.url, wait_until="domcontentloaded", timeout=60000)
+        self.wait_until_ready()
         return self.page.url == self.url
\ No newline at end of file
@@ -2,11 +2,14 @@
 import allure
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from settings import Config
 from utils.logger import logger
 
 class MessagesPage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    READY_RESPONSES = ("*/api/teams",)
+
+    def __init__(self, page: Page, config: Config = None):
+        super().__init__(page, config)
         self.url = f"{self.BASE_URL}/messages"
 
     @allure.step("Проверка загрузки страницы сообщений")
@@ -2,20 +2,66 @@
 import allure
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from settings import Config
+from utils.form_driver import FormDriver
+from utils.instrumentation import page_action
 from utils.logger import logger
 
 class ProjectViewPage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    READY_RESPONSES = ("*/api/projects/*", "*/api/tasks/*")
+    # Колонка To Do на доске задач
+    READY_SELECTOR = "div.border-green-400"
 
+    def __init__(self, page: Page, config: Config = None):
+        super().__init__(page, config)
+        self.url = None
+
+    @page_action
     @allure.step("Переход на страницу проекта")
     def navigate_to_project(self, project_id: str):
         logger.info(f"Переход на проект с ID: {project_id}")
-        try:
-            project_url = f"{self.BASE_URL}/projects/{project_id}"
-            self.navigate_to(project_url)
-        except Exception as e:
-            logger.error(f"Не удалось перейти на страницу проекта: {e}")
-            allure.attach(self.page.content(), name="navigation_error.html", attachment_type=allure.attachment_type.HTML)
-            allure.attach(self.page.screenshot(), name="navigation_error.png", attachment_type=allure.attachment_type.PNG)
-            raise
\ No newline at end of file
+        self.url = f"{self.BASE_URL}/projects/{project_id}"
+        self.navigate_to(self.url)
+        return self
+
+    @page_action
+    @allure.step("Открытие формы создания задачи")
+    def open_new_task_form(self):
+        self.page.locator("div.border-green-400 button:has(svg.lucide-plus)").click()
+        self.page.locator("h1:has-text('Create new Task')").wait_for(state="visible", timeout=15000)
+        return self
+
+    @page_action
+    @allure.step("Заполнение формы задачи: {title}")
+    def fill_task_form(self, title: str, start_date: str, due_date: str, description: str = "Test task description",
+                       tags: str = "test", points: int = 1):
+        FormDriver(self.page, timeout=self.READY_TIMEOUT).fill({
+            "input[placeholder='Task Title']": title,
+            "textarea[placeholder='Task Description']": description,
+            "input[placeholder='Tags (comma separated)']": tags,
+            "input[placeholder='Start Date']": start_date,
+            "input[placeholder='Due Date']": due_date,
+            "input[placeholder='Story Points']": points,
+        })
+        return self
+
+    @page_action
+    @allure.step("Отправка формы создания задачи")
+    def submit_task_form(self):
+        with self.page.expect_response(
+            lambda response: response.request.method == "POST" and "/api/tasks/" in response.url,
+            timeout=self.READY_TIMEOUT
+        ):
+            self.page.locator("button[type='submit']:has-text('Create New Task')").click()
+        self.page.locator("text=Task created successfully!").wait_for(state="visible", timeout=self.READY_TIMEOUT)
+        logger.info("Задача создана через форму")
+        return self
+
+    @page_action
+    @allure.step("Переключение вида проекта: {view}")
+    def switch_view(self, view: str):
+        # view — подпись вкладки: Board, List или Graph
+        self.page.locator(f"button:text-is('{view}')").click()
+        if view == "Graph":
+            self.page.locator(".react-flow__node").first.wait_for(state="visible", timeout=self.READY_TIMEOUT)
+        return self
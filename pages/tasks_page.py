@@ -1,8 +1,15 @@
 from pages.base_page import BasePage
+from settings import Config
 import allure
 from utils.logger import logger
 
 class TasksPage(BasePage):
+    READY_RESPONSES = ("*/api/tasks/",)
+    READY_SELECTOR = "h1:has-text('My Tasks')"
+
+    def __init__(self, page, config: Config = None):
+        super().__init__(page, config)
+        self.url = f"{self.BASE_URL}/tasks"
 
     @allure.step("Проверка загрузки страницы задач")
     def is_loaded(self):
@@ -1,8 +1,84 @@
-from dotenv import load_dotenv
+# settings.py
+# Единая конфигурация прогона. Окружение и .env читаются один раз за процесс (get_config),
+# опции командной строки pytest накладываются в фикстуре app_config, которая делает конфиг текущим.
+# Переопределение для воркера xdist: <ИМЯ>_<ВОРКЕР>, например BASE_URL_GW1=http://localhost:3001 —
+# так воркеры гоняют набор против разных экземпляров приложения.
+import dataclasses
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+from dotenv import load_dotenv
+from utils.workers import get_worker_count, get_worker_id
+
+
+@lru_cache(maxsize=None)
+def load_env() -> bool:
+    # .env не перекрывает переменные, уже заданные в окружении
+    return load_dotenv()
+
+
+def _env(name: str, default=None, worker_id: str = None):
+    worker = (worker_id or get_worker_id()).upper()
+    return os.getenv(f"{name}_{worker}", os.getenv(name, default))
+
+
+def _flag(value) -> bool:
+    return str(value).lower() in ("1", "true", "yes")
+
+
+@dataclass(frozen=True)
+class Config:
+    base_url: str
+    api_url: str
+    email: Optional[str] = None
+    password: Optional[str] = None
+    backend: str = "real"
+    mock_api_port: int = 8000
+    # Таймауты Playwright по умолчанию для страниц, мс
+    timeout: int = 30000
+    navigation_timeout: int = 60000
+    worker_id: str = "master"
+    workers: int = 1
+    user_per_worker: bool = False
+
+    @classmethod
+    def from_env(cls, worker_id: str = None) -> "Config":
+        load_env()
+        worker_id = worker_id or get_worker_id()
+        return cls(
+            base_url=(_env("BASE_URL", "", worker_id) or "").rstrip("/"),
+            api_url=(_env("API_URL", "", worker_id) or "").rstrip("/"),
+            email=_env("EMAIL", None, worker_id),
+            password=_env("PASSWORD", None, worker_id),
+            backend=_env("BACKEND", "real", worker_id),
+            mock_api_port=int(_env("MOCK_API_PORT", 8000, worker_id)),
+            timeout=int(_env("TIMEOUT", 30000, worker_id)),
+            navigation_timeout=int(_env("NAVIGATION_TIMEOUT", 60000, worker_id)),
+            worker_id=worker_id,
+            workers=get_worker_count(),
+            user_per_worker=_flag(_env("USER_PER_WORKER", "", worker_id)),
+        )
+
+    def replace(self, **changes) -> "Config":
+        return dataclasses.replace(self, **changes)
+
+
+@lru_cache(maxsize=None)
+def get_config() -> Config:
+    """Конфиг из окружения и .env, без учёта опций pytest."""
+    return Config.from_env()
+
+
+_current = None
+
+
+def activate(config: Config) -> Config:
+    global _current
+    _current = config
+    return config
 
-load_dotenv()
 
-EMAIL = os.getenv("EMAIL")
-PASSWORD = os.getenv("PASSWORD")
-BASE_URL = os.getenv("BASE_URL")
\ No newline at end of file
+def current() -> Config:
+    # Конфиг сессии pytest, если фикстура app_config уже отработала, иначе — из окружения
+    return _current or get_config()
@@ -3,89 +3,462 @@ import pytest
 import requests
 import os
 import json
-from dotenv import load_dotenv
+import re
+from datetime import datetime
+from pathlib import Path
 from playwright.sync_api import Browser, Page
-from pages.base_page import BasePage
 from pages.dashboard_page import DashboardPage
 from pages.authentication_page import AuthenticationPage
-from utils.logger import logger
+from utils import browser_server
+from utils.api_client import ApiClient, ApiError
+from utils.context_pool import ContextPool
+from utils.data_factory import BulkProject, build_project
+from utils.har import DEFAULT_HAR_DIR, HAR_MODES, REPLAY_TOKEN, HarSession
+from utils.diagnostics import DEFAULT_MAX_BYTES, LEVELS, DiagnosticsRecorder, current
+from utils.logger import add_json_file, current_test_log, logger, set_test_id, start_test
+from utils.mock_api import DEFAULT_EMAIL as MOCK_DEFAULT_EMAIL, DEFAULT_PASSWORD as MOCK_DEFAULT_PASSWORD, MockApiServer
+from utils.network import NetworkRouter, router_from_marker
+from utils.page_reuse import REUSE_MODES, SharedPage, reuse_key
+from utils.token_cache import TokenCache
+from utils.workers import get_worker_id, storage_state_path
 import allure
+from settings import Config, activate, get_config, load_env
 
-load_dotenv()
+load_env()
 
 
-@pytest.fixture(scope="module")
-def authenticated_context(browser: Browser):
-    logger.info("Настройка контекста с авторизацией через API")
-    api_base_url = BasePage.API_URL
-    email = os.getenv("EMAIL")
-    password = os.getenv("PASSWORD")
-    logger.info(f"API_URL: {api_base_url}, EMAIL: {email}")
+def pytest_addoption(parser):
+    parser.addoption(
+        "--user-per-worker",
+        action="store_true",
+        default=get_config().user_per_worker,
+        help="Регистрировать отдельного пользователя для каждого воркера pytest-xdist"
+    )
+    parser.addoption(
+        "--diagnostics",
+        default=os.getenv("DIAGNOSTICS", "failure"),
+        choices=LEVELS,
+        help="Уровень диагностики: failure — артефакты только при падении, trace — плюс trace, steps — скриншот на каждом шаге"
+    )
+    parser.addoption(
+        "--diagnostics-max-bytes",
+        type=int,
+        default=int(os.getenv("DIAGNOSTICS_MAX_BYTES", DEFAULT_MAX_BYTES)),
+        help="Лимит размера вложений на один тест (байт)"
+    )
+    parser.addoption(
+        "--block-resources",
+        default=os.getenv("BLOCK_RESOURCES", ""),
+        help="Типы ресурсов через запятую, которые блокируются по умолчанию (image,font,media)"
+    )
+    parser.addoption(
+        "--cache-static",
+        action="store_true",
+        default=os.getenv("CACHE_STATIC", "").lower() in ("1", "true", "yes"),
+        help="Отдавать повторную статику _next/static из кэша в памяти"
+    )
+    parser.addoption(
+        "--backend",
+        default=get_config().backend,
+        choices=("real", "mock"),
+        help="real — сервер по API_URL, mock — сервер в памяти из utils/mock_api.py"
+    )
+    parser.addoption(
+        "--mock-api-port",
+        type=int,
+        default=get_config().mock_api_port,
+        help="Порт mock API: клиент должен быть собран с NEXT_PUBLIC_API_BASE_URL на этот порт"
+    )
+    parser.addoption(
+        "--har",
+        default=os.getenv("HAR_MODE", "off"),
+        choices=HAR_MODES,
+        help="Для тестов с маркером har: record — записать трафик API в HAR, replay — отдавать API из HAR"
+    )
+    parser.addoption(
+        "--browser-server",
+        default=os.getenv("BROWSER_SERVER", "auto"),
+        choices=("auto", "off"),
+        help="auto — подключаться к тёплому браузеру (python -m utils.browser_server start), если он запущен"
+    )
+    parser.addoption(
+        "--page-reuse",
+        default=os.getenv("PAGE_REUSE", "params"),
+        choices=REUSE_MODES,
+        help="params — параметризованные случаи одного теста с фикстурой shared_page работают на одной странице"
+    )
+    parser.addoption(
+        "--log-dir",
+        default=os.getenv("LOG_DIR", ".logs"),
+        help="Каталог JSON-логов: <воркер>.jsonl за весь прогон и failed/ с полным логом упавших тестов"
+    )
+    parser.addoption(
+        "--har-dir",
+        default=os.getenv("HAR_DIR", str(DEFAULT_HAR_DIR)),
+        help="Каталог с HAR-файлами тестов"
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+    # Артефакты снимаются до teardown фикстур, пока страницы ещё открыты
+    recorder = current()
+    if report.failed and report.when in ("setup", "call") and recorder is not None:
+        recorder.on_failure()
+    if report.failed:
+        dump_test_log(item, report.when)
+
+
+def dump_test_log(item, when: str):
+    # Полный лог теста из кольцевого буфера — только для упавших тестов
+    body = current_test_log()
+    if not body:
+        return
+    name = f"log_{when}.jsonl"
+    safe_name = re.sub(r"[^\w.-]+", "_", item.nodeid)
+    path = Path(item.config.getoption("--log-dir")) / "failed" / f"{safe_name}_{when}.jsonl"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(body, encoding="utf-8")
+    recorder = current()
+    if recorder is not None:
+        recorder.attach(body, name, allure.attachment_type.JSON)
+    else:
+        allure.attach(body, name=name, attachment_type=allure.attachment_type.JSON)
+
+
+def pytest_runtest_logstart(nodeid, location):
+    start_test(nodeid)
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    set_test_id(None)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def diagnostics(request):
+    recorder = DiagnosticsRecorder(
+        request.node.nodeid,
+        request.config.getoption("--diagnostics"),
+        request.config.getoption("--diagnostics-max-bytes")
+    ).activate()
+    yield recorder
+    recorder.deactivate()
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "network(block=[...], cache_static=False): маршрутизация запросов контекста")
+    config.addinivalue_line("markers", "har: тест может работать на записанных ответах API (--har=record|replay)")
+    add_json_file(Path(config.getoption("--log-dir")) / f"{get_worker_id()}.jsonl")
+    # Mock API поднимается один раз в главном процессе: воркеры xdist стартуют позже,
+    # наследуют MOCK_API_URL и ходят в тот же сервер, что и клиент
+    if config.getoption("--backend") == "mock" and not hasattr(config, "workerinput"):
+        server = MockApiServer(port=config.getoption("--mock-api-port")).start()
+        server.store.add_user(*mock_credentials())
+        # Ключ подписи новый при каждом старте: токены прошлых прогонов сервер отвергнет
+        TokenCache().invalidate_api(server.api_url)
+        os.environ["MOCK_API_URL"] = server.api_url
+        config._mock_api = server
+    config._app_config = activate(build_app_config(config))
+
+
+def build_app_config(config) -> Config:
+    # Опции командной строки поверх окружения; конфиг неизменяем и общий для всей сессии
+    app_config = get_config().replace(
+        backend=config.getoption("--backend"),
+        mock_api_port=config.getoption("--mock-api-port"),
+        user_per_worker=config.getoption("--user-per-worker"),
+    )
+    if app_config.backend == "mock":
+        email, password = mock_credentials()
+        app_config = app_config.replace(api_url=os.environ["MOCK_API_URL"], email=email, password=password)
+    return app_config
+
+
+def mock_credentials() -> tuple:
+    config = get_config()
+    if config.email and config.password:
+        return config.email, config.password
+    return MOCK_DEFAULT_EMAIL, MOCK_DEFAULT_PASSWORD
+
+
+def pytest_unconfigure(config):
+    server = getattr(config, "_mock_api", None)
+    if server is not None:
+        server.stop()
+
+
+@pytest.fixture(scope="session")
+def app_config(request) -> Config:
+    return request.config._app_config
+
+
+@pytest.fixture(scope="session")
+def backend_api_url(app_config: Config) -> str:
+    return app_config.api_url
+
+
+def token_from_storage_state(state: dict) -> str:
+    for origin in state.get("origins", []):
+        for item in origin.get("localStorage", []):
+            if item["name"] == "persist:root":
+                return json.loads(json.loads(item["value"])["auth"])["token"]
+    raise AssertionError("В состоянии авторизации нет токена")
+
+
+def user_from_storage_state(state: dict) -> dict:
+    for origin in state.get("origins", []):
+        for item in origin.get("localStorage", []):
+            if item["name"] == "persist:root":
+                user = json.loads(json.loads(item["value"])["auth"])["user"] or {}
+                return {key: user.get(key) for key in ("userId", "username", "email", "profilePictureUrl")}
+    return {}
+
+
+def build_storage_state(base_url: str, token: str, user: dict, refresh_token: str = None) -> dict:
+    return {
+        "cookies": [
+            {
+                "name": "jwt",
+                "value": refresh_token or token,
+                "url": base_url,
+                "sameSite": "Strict",
+                "secure": True
+            }
+        ],
+        "origins": [
+            {
+                "origin": base_url,
+                "localStorage": [
+                    {"name": "authToken", "value": token},
+                    {
+                        "name": "persist:root",
+                        "value": json.dumps({
+                            "global": json.dumps({"isSidebarOpen": True, "isModalOpen": False, "isTaskDetailsModalOpen": False, "task": False}),
+                            "auth": json.dumps({"user": user, "token": token}),
+                            "_persist": json.dumps({"version": -1, "rehydrated": True})
+                        })
+                    }
+                ]
+            }
+        ]
+    }
+
+
+@pytest.fixture(scope="session")
+def browser(launch_browser, browser_type, browser_type_launch_args, request):
+    # Переопределение фикстуры pytest-playwright: тёплый браузер вместо запуска на каждый прогон
+    browser = None
+    if request.config.getoption("--browser-server") == "auto":
+        browser = browser_server.connect(browser_type, headless=browser_type_launch_args.get("headless", True))
+    if browser is None:
+        browser = launch_browser()
+    yield browser
+    # У подключённого браузера close() закрывает только контексты этого прогона
+    browser.close()
+
+
+@pytest.fixture(scope="session")
+def worker_credentials(browser: Browser, app_config: Config):
+    worker_id = app_config.worker_id
+    if not app_config.user_per_worker:
+        logger.info(f"Воркер {worker_id} использует общего пользователя")
+        return {"email": app_config.email, "password": app_config.password, "storage_state": None}
+
+    logger.info(f"Регистрация отдельного пользователя для воркера {worker_id}")
+    context = browser.new_context(ignore_https_errors=True)
+    page = context.new_page()
+    auth_page = AuthenticationPage(page, app_config)
+    email = f"{worker_id}_{auth_page.generate_random_email()}"
+    password = "q1w2e3r4t5Y"
+    with allure.step(f"Зарегистрировать пользователя для воркера {worker_id}"):
+        auth_page.navigate()
+        auth_page.open_signup_form()
+        auth_page.signup(auth_page.generate_random_name(), email, auth_page.generate_random_phone(), password, password, expect_success=True)
+    state = context.storage_state(path=str(storage_state_path(worker_id)))
+    context.close()
+    logger.info(f"Пользователь {email} зарегистрирован для воркера {worker_id}")
+    return {"email": email, "password": password, "storage_state": state}
+
+
+@pytest.fixture(scope="session")
+def auth_storage_state(browser: Browser, worker_credentials, backend_api_url, app_config: Config):
+    if worker_credentials["storage_state"]:
+        return worker_credentials["storage_state"]
+    logger.info("Получение состояния авторизации через API")
+    api_base_url = backend_api_url
+    email = worker_credentials["email"]
+    password = worker_credentials["password"]
+    logger.info(f"API_URL: {api_base_url}, EMAIL: {email}, воркер: {get_worker_id()}")
 
     try:
-        response = requests.post(
-            f"{api_base_url}/auth/login",
-            json={"email": email, "password": password},
-            headers={"Content-Type": "application/json"},
-            timeout=10
-        )
-        response.raise_for_status()
-        logger.info(f"Ответ API: {response.text}")
-        response_data = response.json()
-        token = response_data.get("token")
-        user = response_data.get("user")
-        if not token or not user:
-            logger.error("Нет токена или данных пользователя в ответе API")
-            raise AssertionError("Нет токена или данных пользователя в ответе API")
+        with allure.step("Авторизация через API"):
+            entry = TokenCache().get_or_login(api_base_url, email, password)
     except requests.exceptions.RequestException as e:
         logger.error(f"Ошибка API-запроса: {e}")
-        if e.response:
-            logger.error(f"Ответ сервера: {e.response.text}")
+        if e.response is not None:
+            logger.error(f"Ответ сервера: {e.response.status_code} {e.response.text[:500]}")
         logger.info("Переход на UI-авторизацию как запасной вариант")
         context = browser.new_context(ignore_https_errors=True)
         page = context.new_page()
-        auth_page = AuthenticationPage(page)
+        auth_page = AuthenticationPage(page, app_config)
         with allure.step("Открыть страницу авторизации"):
             auth_page.navigate()
         with allure.step("Выполнить вход"):
             auth_page.login(email, password, expect_success=True)
-        context.storage_state(path="state.json")
-        page.close()
-        yield context
+        state = context.storage_state(path=str(storage_state_path()))
         context.close()
-        logger.info("Контекст с авторизацией закрыт")
+        return state
+
+    return build_storage_state(app_config.base_url, entry["token"], entry["user"], entry.get("refresh_token"))
+
+
+@pytest.fixture(scope="function")
+def network_router(request) -> NetworkRouter:
+    block = [item.strip() for item in request.config.getoption("--block-resources").split(",") if item.strip()]
+    return router_from_marker(request.node.get_closest_marker("network"), block, request.config.getoption("--cache-static"))
+
+
+@pytest.fixture(scope="function")
+def context(context, network_router: NetworkRouter, diagnostics: DiagnosticsRecorder):
+    # Переопределение фикстуры pytest-playwright для тестов без авторизации
+    if network_router.enabled:
+        network_router.install(context)
+    diagnostics.register_context(context)
+    yield context
+    diagnostics.unregister_context(context)
+
+
+@pytest.fixture(scope="session")
+def shared_pages(browser: Browser, browser_context_args):
+    # Видео для общего контекста не пишется: он переживает отдельные тесты
+    context_args = {key: value for key, value in browser_context_args.items() if key != "record_video_dir"}
+    shared = SharedPage(browser, **context_args)
+    yield shared
+    logger.info(f"Общие страницы: создано {shared.created}, переиспользовано {shared.reused}")
+    shared.close()
+
+
+@pytest.fixture(scope="function")
+def shared_page(request, network_router: NetworkRouter, diagnostics: DiagnosticsRecorder):
+    # Страница без авторизации, общая для параметризованных случаев теста;
+    # тест сам приводит её в исходное состояние (например, AuthenticationPage.reset)
+    if request.config.getoption("--page-reuse") == "off" or not hasattr(request.node, "callspec"):
+        yield request.getfixturevalue("page")
         return
+    shared = request.getfixturevalue("shared_pages")
+    page = shared.acquire(reuse_key(request.node.nodeid), network_router.install if network_router.enabled else None)
+    diagnostics.register_context(page.context)
+    yield page
+    diagnostics.unregister_context(page.context)
+    report = getattr(request.node, "rep_call", None)
+    shared.release(dirty=report is None or report.failed)
 
-    context = browser.new_context(
-        ignore_https_errors=True,
-        storage_state={
-            "cookies": [
-                {
-                    "name": "jwt",
-                    "value": response.cookies.get("jwt", token),
-                    "url": BasePage.BASE_URL,
-                    "sameSite": "Strict",
-                    "secure": True
-                }
-            ],
-            "origins": [
-                {
-                    "origin": BasePage.BASE_URL,
-                    "localStorage": [
-                        {"name": "authToken", "value": token},
-                        {
-                            "name": "persist:root",
-                            "value": json.dumps({
-                                "global": json.dumps({"isSidebarOpen": True, "isModalOpen": False, "isTaskDetailsModalOpen": False, "task": False}),
-                                "auth": json.dumps({"user": user, "token": token}),
-                                "_persist": json.dumps({"version": -1, "rehydrated": True})
-                            })
-                        }
-                    ]
-                }
-            ]
-        }
-    )
+
+@pytest.fixture(scope="session")
+def context_pool(browser: Browser, auth_storage_state, app_config: Config):
+    pool = ContextPool(browser, auth_storage_state, app_config.base_url, ignore_https_errors=True)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="function")
+def har_session(request, backend_api_url):
+    mode = request.config.getoption("--har")
+    if mode == "off" or request.node.get_closest_marker("har") is None:
+        return None
+    session = HarSession(mode, request.config.getoption("--har-dir"), request.node.nodeid, backend_api_url)
+    if not session.available:
+        pytest.skip(f"Нет HAR {session.path}: запишите его через --har=record или python -m utils.har refresh")
+    return session
+
+
+@pytest.fixture(scope="function")
+def authenticated_context(request, har_session, network_router: NetworkRouter, diagnostics: DiagnosticsRecorder):
+    # Фикстуры пула и авторизации запрашиваются лениво: при воспроизведении HAR сервер не нужен
+    if har_session is None:
+        context_pool = request.getfixturevalue("context_pool")
+        context = context_pool.lease()
+    else:
+        # HAR записывается при закрытии контекста, поэтому контекст отдельный, не из пула
+        if har_session.mode == "record":
+            storage_state = request.getfixturevalue("auth_storage_state")
+        else:
+            storage_state = build_storage_state(request.getfixturevalue("app_config").base_url, REPLAY_TOKEN, har_session.replay_user())
+        context = request.getfixturevalue("browser").new_context(
+            storage_state=storage_state, ignore_https_errors=True
+        )
+        har_session.attach(context)
+    if network_router.enabled:
+        network_router.install(context)
+    diagnostics.register_context(context)
     yield context
-    context.close()
-    logger.info("Контекст с авторизацией закрыт")
\ No newline at end of file
+    diagnostics.unregister_context(context)
+    if har_session is not None:
+        context.close()
+        report = getattr(request.node, "rep_call", None)
+        user = user_from_storage_state(storage_state) if har_session.mode == "record" else None
+        har_session.finish(report is not None and report.passed, user)
+        return
+    if network_router.enabled:
+        network_router.uninstall(context)
+    context_pool.release(context)
+    logger.info("Контекст с авторизацией возвращён в пул")
+
+
+@pytest.fixture(scope="session")
+def api_client(auth_storage_state, backend_api_url):
+    client = ApiClient(backend_api_url, token_from_storage_state(auth_storage_state))
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def user_factory(backend_api_url, app_config: Config):
+    """Отдельные пользователи, зарегистрированные через API: {"email", "token", "storage_state"}."""
+    cache = TokenCache()
+
+    def factory(count: int) -> list:
+        users = []
+        for index in range(count):
+            email = f"{app_config.worker_id}_user{index}_{os.urandom(5).hex()}@mail.ru"
+            with allure.step(f"Зарегистрировать пользователя {email}"):
+                entry = cache.signup(backend_api_url, email, "q1w2e3r4t5Y", f"User{index}{os.urandom(3).hex()}")
+            users.append({
+                "email": email,
+                "token": entry["token"],
+                "storage_state": build_storage_state(app_config.base_url, entry["token"], entry["user"], entry.get("refresh_token")),
+            })
+        return users
+
+    return factory
+
+
+@pytest.fixture(scope="function")
+def seeded_project(api_client: ApiClient):
+    project = api_client.create_project(f"Seeded Project {datetime.now().strftime('%Y%m%d%H%M%S%f')}", "Создан через API")
+    yield project
+    try:
+        api_client.delete_project(project["id"])
+    except ApiError as e:
+        # Проект мог быть удалён самим тестом
+        logger.warning(f"Не удалось удалить проект {project['id']}: {e}")
+
+
+@pytest.fixture(scope="function")
+def project_factory(api_client: ApiClient):
+    created = []
+
+    def factory(n_tasks: int, depth: int = 5, fan_in: int = 2, **kwargs) -> BulkProject:
+        bulk = build_project(api_client, n_tasks, depth, fan_in, **kwargs)
+        created.append(bulk)
+        return bulk
+
+    yield factory
+    for bulk in created:
+        try:
+            api_client.delete_project(bulk.project_id)
+        except ApiError as e:
+            logger.warning(f"Не удалось удалить проект {bulk.project_id}: {e}")
@@ -1,26 +1,28 @@
 # tests/test_navigation.py
 import pytest
 import allure
-from dotenv import load_dotenv
 from playwright.sync_api import expect, TimeoutError as PlaywrightTimeoutError
-from allure import step, attach
-from allure_commons.types import AttachmentType
+from allure import step
+from utils.diagnostics import checkpoint
 from utils.logger import logger
+from settings import Config
 from pages.authentication_page import AuthenticationPage
 from pages.dashboard_page import DashboardPage
 
-load_dotenv()
+# Тесты навигации проверяют только URL и формы: картинки и шрифты не нужны
+pytestmark = pytest.mark.network(block=["image", "font", "media"], cache_static=True)
 
 
 @pytest.fixture(scope="function")
-def dashboard_page(authenticated_context):
+def dashboard_page(authenticated_context, app_config: Config):
     page = authenticated_context.new_page()
-    dashboard_page = DashboardPage(page)
+    dashboard_page = DashboardPage(page, app_config)
     yield dashboard_page
     page.close()
 
 
 @pytest.mark.navigation
+@pytest.mark.har
 @pytest.mark.smoke
 @allure.title("Загрузка дашборда после авторизации")
 def test_homepage_loads(dashboard_page: DashboardPage):
@@ -30,10 +32,11 @@ def test_homepage_loads(dashboard_page: DashboardPage):
         logger.info(f"Текущий URL: {dashboard_page.page.url}")
         expect(dashboard_page.page).to_have_url(f"{dashboard_page.BASE_URL}/dashboard", timeout=30000)
         assert dashboard_page.is_loaded(), "Дашборд не загружен"
-        attach(dashboard_page.page.screenshot(), name="дашборд_загружен.png", attachment_type=AttachmentType.PNG)
+        checkpoint("дашборд_загружен.png", dashboard_page.page)
 
 
 @pytest.mark.navigation
+@pytest.mark.har
 @pytest.mark.regression
 @allure.title("Переход в раздел сообщений")
 def test_messages_navigation(dashboard_page: DashboardPage):
@@ -42,10 +45,11 @@ def test_messages_navigation(dashboard_page: DashboardPage):
     with step("Проверить переход в раздел сообщений"):
         logger.info(f"Текущий URL: {dashboard_page.page.url}")
         expect(dashboard_page.page).to_have_url(f"{dashboard_page.BASE_URL}/messages", timeout=30000)
-        attach(dashboard_page.page.screenshot(), name="страница_сообщений_загружена.png", attachment_type=AttachmentType.PNG)
+        checkpoint("страница_сообщений_загружена.png", dashboard_page.page)
 
 
 @pytest.mark.navigation
+@pytest.mark.har
 @pytest.mark.regression
 @allure.title("Переход в раздел участников")
 def test_members_navigation(dashboard_page: DashboardPage):
@@ -54,14 +58,14 @@ def test_members_navigation(dashboard_page: DashboardPage):
     with step("Проверить переход в раздел участников"):
         logger.info(f"Текущий URL: {dashboard_page.page.url}")
         expect(dashboard_page.page).to_have_url(f"{dashboard_page.BASE_URL}/members", timeout=30000)
-        attach(dashboard_page.page.screenshot(), name="страница_участников_загружена.png", attachment_type=AttachmentType.PNG)
+        checkpoint("страница_участников_загружена.png", dashboard_page.page)
 
 
 @pytest.mark.navigation
 @pytest.mark.regression
 @allure.title("Переход на несуществующую страницу")
-def test_nonexistent_page(page):
-    auth_page = AuthenticationPage(page)
+def test_nonexistent_page(page, app_config: Config):
+    auth_page = AuthenticationPage(page, app_config)
     with step("Открыть несуществующую страницу"):
         auth_page.navigate_to(f"{auth_page.BASE_URL}/nonexistent")
         logger.info(f"Текущий URL: {auth_page.page.url}")
@@ -71,14 +75,14 @@ def test_nonexistent_page(page):
         expect(auth_page.email_input).to_be_visible(timeout=15000)
         expect(auth_page.password_input).to_be_visible(timeout=15000)
         expect(auth_page.submit_button).to_be_visible(timeout=15000)
-        attach(auth_page.page.screenshot(), name="редирект_на_авторизацию_несуществующая.png", attachment_type=AttachmentType.PNG)
+        checkpoint("редирект_на_авторизацию_несуществующая.png", auth_page.page)
 
 
 @pytest.mark.navigation
 @pytest.mark.regression
 @allure.title("Переход на дашборд без авторизации")
-def test_dashboard_without_login(page):
-    auth_page = AuthenticationPage(page)
+def test_dashboard_without_login(page, app_config: Config):
+    auth_page = AuthenticationPage(page, app_config)
     with step("Открыть дашборд"):
         auth_page.navigate_to(f"{auth_page.BASE_URL}/dashboard")
     with step("Проверить редирект на страницу авторизации"):
@@ -88,14 +92,14 @@ def test_dashboard_without_login(page):
         expect(auth_page.email_input).to_be_visible(timeout=15000)
         expect(auth_page.password_input).to_be_visible(timeout=15000)
         expect(auth_page.submit_button).to_be_visible(timeout=15000)
-        attach(auth_page.page.screenshot(), name="редирект_на_авторизацию_дашборд.png", attachment_type=AttachmentType.PNG)
+        checkpoint("редирект_на_авторизацию_дашборд.png", auth_page.page)
 
 
 @pytest.mark.navigation
 @pytest.mark.regression
 @allure.title("Переход на проекты без авторизации")
-def test_projects_without_login(page):
-    auth_page = AuthenticationPage(page)
+def test_projects_without_login(page, app_config: Config):
+    auth_page = AuthenticationPage(page, app_config)
     with step("Открыть страницу проектов"):
         auth_page.navigate_to(f"{auth_page.BASE_URL}/projects")
     with step("Проверить редирект на страницу авторизации"):
@@ -105,14 +109,14 @@ def test_projects_without_login(page):
         expect(auth_page.email_input).to_be_visible(timeout=15000)
         expect(auth_page.password_input).to_be_visible(timeout=15000)
         expect(auth_page.submit_button).to_be_visible(timeout=15000)
-        attach(auth_page.page.screenshot(), name="редирект_на_авторизацию_проекты.png", attachment_type=AttachmentType.PNG)
+        checkpoint("редирект_на_авторизацию_проекты.png", auth_page.page)
 
 
 @pytest.mark.navigation
 @pytest.mark.regression
 @allure.title("Переход на задачи без авторизации")
-def test_tasks_without_login(page):
-    auth_page = AuthenticationPage(page)
+def test_tasks_without_login(page, app_config: Config):
+    auth_page = AuthenticationPage(page, app_config)
     with step("Открыть страницу задач"):
         auth_page.navigate_to(f"{auth_page.BASE_URL}/tasks")
     with step("Проверить редирект на страницу авторизации"):
@@ -122,14 +126,14 @@ def test_tasks_without_login(page):
         expect(auth_page.email_input).to_be_visible(timeout=15000)
         expect(auth_page.password_input).to_be_visible(timeout=15000)
         expect(auth_page.submit_button).to_be_visible(timeout=15000)
-        attach(auth_page.page.screenshot(), name="редирект_на_авторизацию_задачи.png", attachment_type=AttachmentType.PNG)
+        checkpoint("редирект_на_авторизацию_задачи.png", auth_page.page)
 
 
 @pytest.mark.navigation
 @pytest.mark.regression
 @allure.title("Переход на участников без авторизации")
-def test_members_without_login(page):
-    auth_page = AuthenticationPage(page)
+def test_members_without_login(page, app_config: Config):
+    auth_page = AuthenticationPage(page, app_config)
     with step("Переход на участников"):
         auth_page.navigate_to(f"{auth_page.BASE_URL}/members")
     with step("Проверка редиректа на страницу авторизации"):
@@ -139,14 +143,14 @@ def test_members_without_login(page):
         expect(auth_page.email_input).to_be_visible(timeout=15000)
         expect(auth_page.password_input).to_be_visible(timeout=15000)
         expect(auth_page.submit_button).to_be_visible(timeout=15000)
-        attach(auth_page.page.screenshot(), name="members_auth_redirect.png", attachment_type=AttachmentType.PNG)
+        checkpoint("members_auth_redirect.png", auth_page.page)
 
 
 @pytest.mark.navigation
 @pytest.mark.regression
 @allure.title("Переход на сообщения без авторизации")
-def test_messages_without_login(page):
-    auth_page = AuthenticationPage(page)
+def test_messages_without_login(page, app_config: Config):
+    auth_page = AuthenticationPage(page, app_config)
     with step("Открыть страницу сообщений"):
         auth_page.navigate_to(f"{auth_page.BASE_URL}/messages")
     with step("Проверить редирект на страницу авторизации"):
@@ -156,4 +160,4 @@ def test_messages_without_login(page):
         expect(auth_page.email_input).to_be_visible(timeout=15000)
         expect(auth_page.password_input).to_be_visible(timeout=15000)
         expect(auth_page.submit_button).to_be_visible(timeout=15000)
-        attach(auth_page.page.screenshot(), name="редирект_на_авторизацию_сообщения.png", attachment_type=AttachmentType.PNG)
\ No newline at end of file
+        checkpoint("редирект_на_авторизацию_сообщения.png", auth_page.page)
\ No newline at end of file
@@ -3,34 +3,37 @@ import pytest
 import allure
 from pages.project_page import ProjectPage
 from pages.dashboard_page import DashboardPage
+from pages.aio.dashboard_page import DashboardPage as AsyncDashboardPage
+from pages.aio.project_page import ProjectPage as AsyncProjectPage
+from utils.diagnostics import checkpoint
+from utils.api_client import ApiClient
+from utils.concurrent_users import run_users_sync
 from utils.logger import logger
+from settings import Config
 from datetime import datetime, timedelta
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
 @pytest.fixture(scope="function")
-def project_page(authenticated_context):
+def project_page(authenticated_context, app_config: Config):
     page = authenticated_context.new_page()
-    project_page = ProjectPage(page)
+    project_page = ProjectPage(page, app_config)
     yield project_page
     page.close()
 
 
 @pytest.mark.smoke
 @pytest.mark.projects
-@allure.title("Удаление первого проекта в списке")
-def test_delete_first_project(project_page: ProjectPage):
+@allure.title("Удаление проекта из списка")
+def test_delete_project(project_page: ProjectPage, seeded_project):
     with allure.step("Переход на дашборд"):
         project_page.navigate_to(f"{project_page.BASE_URL}/dashboard")
-    with allure.step("Удаление первого проекта"):
+    with allure.step(f"Удаление проекта {seeded_project['name']}"):
         try:
-            dashboard_page = DashboardPage(project_page.page)
-            project_name = dashboard_page.delete_first_project()
-            allure.attach(project_page.page.screenshot(), name="after_delete.png", attachment_type=allure.attachment_type.PNG)
-            logger.info(f"Первый проект {project_name} успешно удалён")
+            dashboard_page = DashboardPage(project_page.page, project_page.config)
+            dashboard_page.delete_project(seeded_project["name"])
+            checkpoint("after_delete.png", project_page.page)
+            logger.info(f"Проект {seeded_project['name']} успешно удалён")
         except PlaywrightTimeoutError as e:
             logger.error(f"Не удалось удалить проект: {e}")
             allure.attach(project_page.page.content(), name="delete_error.html", attachment_type=allure.attachment_type.HTML)
@@ -48,18 +51,14 @@ def test_create_project_success(project_page: ProjectPage):
             project_page.close_create_form()
             logger.info("Форма создания проекта была открыта и закрыта")
     with allure.step("Открытие формы создания проекта"):
-        dashboard_page = DashboardPage(project_page.page)
+        dashboard_page = DashboardPage(project_page.page, project_page.config)
         dashboard_page.click_plus_button()
     with allure.step("Заполнение формы"):
         project_name = "Test Project " + datetime.now().strftime("%Y%m%d%H%M%S")
-        project_page.fill_project_name(project_name)
-        project_page.fill_description("Test description")
         start_date = datetime.now().strftime("%Y-%m-%d")
-        project_page.fill_start_date(start_date)
         end_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-        project_page.fill_end_date(end_date)
-        project_page.fill_status("In Progress")
-        allure.attach(project_page.page.screenshot(), name="project_form_filled.png", attachment_type=allure.attachment_type.PNG)
+        project_page.fill_project_form(project_name, "Test description", start_date, end_date, "In Progress")
+        checkpoint("project_form_filled.png", project_page.page)
     with allure.step("Отправка формы"):
         project_page.submit_create_project()
 
@@ -67,12 +66,12 @@ def test_create_project_success(project_page: ProjectPage):
         try:
             project_page.page.wait_for_selector("div.text-green-500:has-text('Project created successfully'), [class*='success']", state="visible", timeout=5000)
             logger.info(f"Проект {project_name} успешно создан")
-            allure.attach(project_page.page.screenshot(), name="project_created.png", attachment_type=allure.attachment_type.PNG)
+            checkpoint("project_created.png", project_page.page)
         except PlaywrightTimeoutError:
             logger.error("Сообщение об успехе не найдено, проверка отсутствия ошибки")
             assert not project_page.error_message.is_visible(timeout=5000), "Обнаружена ошибка при создании проекта"
             logger.info(f"Проект {project_name} создан (без сообщения об успехе)")
-            allure.attach(project_page.page.screenshot(), name="project_created_no_success_message.png", attachment_type=allure.attachment_type.PNG)
+            checkpoint("project_created_no_success_message.png", project_page.page)
 
 
 @pytest.mark.projects
@@ -87,14 +86,10 @@ def test_create_project_long_name(project_page: ProjectPage):
             logger.info("Форма создания проекта была открыта и закрыта")
     with allure.step("Заполнение длинным названием"):
         long_name = "LongName_" + "a" * 90 + datetime.now().strftime("%Y%m%d%H%M%S")
-        project_page.fill_project_name(long_name)
-        project_page.fill_description("Test description")
         start_date = datetime.now().strftime("%Y-%m-%d")
-        project_page.fill_start_date(start_date)
         end_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-        project_page.fill_end_date(end_date)
-        project_page.fill_status("In Progress")
-        allure.attach(project_page.page.screenshot(), name="project_form_long_name.png", attachment_type=allure.attachment_type.PNG)
+        project_page.fill_project_form(long_name, "Test description", start_date, end_date, "In Progress")
+        checkpoint("project_form_long_name.png", project_page.page)
     with allure.step("Отправка формы"):
         project_page.submit_create_project()
 
@@ -102,12 +97,12 @@ def test_create_project_long_name(project_page: ProjectPage):
         try:
             project_page.page.wait_for_selector("text=Project name too long", state="visible", timeout=5000)
             logger.info("Ошибка для длинного названия отображена")
-            allure.attach(project_page.page.screenshot(), name="long_name_error.png", attachment_type=allure.attachment_type.PNG)
+            checkpoint("long_name_error.png", project_page.page)
         except PlaywrightTimeoutError:
             logger.error("Ошибка для длинного названия не отображена, проверка отсутствия сообщения об успехе")
             assert not project_page.page.locator("div.text-green-500:has-text('Project created successfully'), [class*='success']").is_visible(timeout=5000), "Проект с длинным названием неожиданно создан"
             logger.info(f"Проект с названием длиной {len(long_name)} символов не создан")
-            allure.attach(project_page.page.screenshot(), name="long_name_not_created.png", attachment_type=allure.attachment_type.PNG)
+            checkpoint("long_name_not_created.png", project_page.page)
 
 
 @pytest.mark.projects
@@ -122,14 +117,10 @@ def test_create_project_special_chars(project_page: ProjectPage):
             logger.info("Форма создания проекта была открыта и закрыта")
     with allure.step("Заполнение формы с особыми символами"):
         project_name = "Test@#$%_" + datetime.now().strftime("%Y%m%d%H%M%S")
-        project_page.fill_project_name(project_name)
-        project_page.fill_description("Test with special chars")
         start_date = datetime.now().strftime("%Y-%m-%d")
-        project_page.fill_start_date(start_date)
         end_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-        project_page.fill_end_date(end_date)
-        project_page.fill_status("In Progress")
-        allure.attach(project_page.page.screenshot(), name="project_form_special_chars.png", attachment_type=allure.attachment_type.PNG)
+        project_page.fill_project_form(project_name, "Test with special chars", start_date, end_date, "In Progress")
+        checkpoint("project_form_special_chars.png", project_page.page)
     with allure.step("Отправка формы"):
         project_page.submit_create_project()
 
@@ -137,12 +128,12 @@ def test_create_project_special_chars(project_page: ProjectPage):
         try:
             project_page.page.wait_for_selector("div.text-green-500:has-text('Project created successfully'), [class*='success']", state="visible", timeout=5000)
             logger.info(f"Проект {project_name} с особыми символами успешно создан")
-            allure.attach(project_page.page.screenshot(), name="project_special_chars_created.png", attachment_type=allure.attachment_type.PNG)
+            checkpoint("project_special_chars_created.png", project_page.page)
         except PlaywrightTimeoutError:
             logger.error("Сообщение об успехе не найдено, проверка отсутствия ошибки")
             assert not project_page.error_message.is_visible(timeout=5000), "Обнаружена ошибка при создании проекта"
             logger.info(f"Проект {project_name} создан (без сообщения об успехе)")
-            allure.attach(project_page.page.screenshot(), name="project_special_chars_no_success_message.png", attachment_type=allure.attachment_type.PNG)
+            checkpoint("project_special_chars_no_success_message.png", project_page.page)
 
 
 @pytest.mark.projects
@@ -156,18 +147,14 @@ def test_create_button_disabled_on_empty_name(project_page: ProjectPage):
             project_page.close_create_form()
             logger.info("Форма создания проекта была открыта и закрыта")
     with allure.step("Оставление поля названия пустым"):
-        project_page.fill_project_name("")
-        project_page.fill_description("Test description")
         start_date = datetime.now().strftime("%Y-%m-%d")
-        project_page.fill_start_date(start_date)
         end_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-        project_page.fill_end_date(end_date)
-        project_page.fill_status("In Progress")
-        allure.attach(project_page.page.screenshot(), name="project_form_empty_name.png", attachment_type=allure.attachment_type.PNG)
+        project_page.fill_project_form("", "Test description", start_date, end_date, "In Progress")
+        checkpoint("project_form_empty_name.png", project_page.page)
     with allure.step("Проверка неактивности кнопки"):
         assert not project_page.is_create_button_enabled(), "Кнопка 'Create' активна при пустом названии"
         logger.info("Кнопка 'Create' корректно неактивна при пустом названии")
-        allure.attach(project_page.page.screenshot(), name="create_button_disabled.png", attachment_type=allure.attachment_type.PNG)
+        checkpoint("create_button_disabled.png", project_page.page)
 
 
 @pytest.mark.projects
@@ -182,14 +169,10 @@ def test_create_project_invalid_date_range(project_page: ProjectPage):
             logger.info("Форма создания проекта была открыта и закрыта")
     with allure.step("Заполнение формы с неверным диапазоном дат"):
         project_name = "InvalidDate_" + datetime.now().strftime("%Y%m%d%H%M%S")
-        project_page.fill_project_name(project_name)
-        project_page.fill_description("Test with invalid date range")
         start_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-        project_page.fill_start_date(start_date)
         end_date = datetime.now().strftime("%Y-%m-%d")
-        project_page.fill_end_date(end_date)
-        project_page.fill_status("In Progress")
-        allure.attach(project_page.page.screenshot(), name="project_form_invalid_dates.png", attachment_type=allure.attachment_type.PNG)
+        project_page.fill_project_form(project_name, "Test with invalid date range", start_date, end_date, "In Progress")
+        checkpoint("project_form_invalid_dates.png", project_page.page)
     with allure.step("Отправка формы"):
         project_page.submit_create_project()
 
@@ -197,12 +180,12 @@ def test_create_project_invalid_date_range(project_page: ProjectPage):
         try:
             project_page.page.wait_for_selector("text=Invalid date range", state="visible", timeout=5000)
             logger.info("Ошибка для неверного диапазона дат отображена")
-            allure.attach(project_page.page.screenshot(), name="invalid_date_range_error.png", attachment_type=allure.attachment_type.PNG)
+            checkpoint("invalid_date_range_error.png", project_page.page)
         except PlaywrightTimeoutError:
             logger.error("Ошибка для неверного диапазона дат не отображена, проверка отсутствия сообщения об успехе")
             assert not project_page.page.locator("div.text-green-500:has-text('Project created successfully'), [class*='success']").is_visible(timeout=5000), "Проект с неверным диапазоном дат неожиданно создан"
             logger.info(f"Проект {project_name} не создан")
-            allure.attach(project_page.page.screenshot(), name="invalid_date_range_not_created.png", attachment_type=allure.attachment_type.PNG)
+            checkpoint("invalid_date_range_not_created.png", project_page.page)
 
 
 @pytest.mark.projects
@@ -217,14 +200,10 @@ def test_create_project_invalid_date(project_page: ProjectPage):
             logger.info("Форма создания проекта была открыта и закрыта")
     with allure.step("Заполнение формы с некорректной датой"):
         project_name = "InvalidDateTest_" + datetime.now().strftime("%Y%m%d%H%M%S")
-        project_page.fill_project_name(project_name)
-        project_page.fill_description("Test with invalid date")
         invalid_start_date = "275760-01-01"
-        project_page.fill_start_date(invalid_start_date)
         end_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
-        project_page.fill_end_date(end_date)
-        project_page.fill_status("In Progress")
-        allure.attach(project_page.page.screenshot(), name="project_form_invalid_date.png", attachment_type=allure.attachment_type.PNG)
+        project_page.fill_project_form(project_name, "Test with invalid date", invalid_start_date, end_date, "In Progress")
+        checkpoint("project_form_invalid_date.png", project_page.page)
     with allure.step("Отправка формы"):
         project_page.submit_create_project()
  
@@ -232,9 +211,45 @@ def test_create_project_invalid_date(project_page: ProjectPage):
         try:
             project_page.page.wait_for_selector("text=Invalid date", state="visible", timeout=5000)
             logger.info("Ошибка для некорректной даты отображена")
-            allure.attach(project_page.page.screenshot(), name="invalid_date_error.png", attachment_type=allure.attachment_type.PNG)
+            checkpoint("invalid_date_error.png", project_page.page)
         except PlaywrightTimeoutError:
             logger.error("Ошибка для некорректной даты не отображена, проверка отсутствия сообщения об успехе")
             assert not project_page.page.locator("div.text-green-500:has-text('Project created successfully'), [class*='success']").is_visible(timeout=5000), "Проект с некорректной датой неожиданно создан"
             logger.info(f"Проект {project_name} не создан")
-            allure.attach(project_page.page.screenshot(), name="invalid_date_not_created.png", attachment_type=allure.attachment_type.PNG)
\ No newline at end of file
+            checkpoint("invalid_date_not_created.png", project_page.page)
+
+@pytest.mark.projects
+@allure.title("Одновременное создание проектов несколькими пользователями")
+def test_concurrent_project_creation(user_factory, backend_api_url, app_config: Config, browser_name, browser_type_launch_args):
+    users = user_factory(5)
+    stamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    names = [f"Concurrent Project {stamp} {i}" for i in range(len(users))]
+    start_date = datetime.now().strftime("%Y-%m-%d")
+    end_date = (datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d")
+
+    async def scenario(index, page):
+        dashboard_page = await AsyncDashboardPage(page, app_config, user=users[index]["email"]).navigate()
+        await dashboard_page.click_plus_button()
+        project_page = AsyncProjectPage(page, app_config, user=dashboard_page.user)
+        await project_page.create_project(names[index], "Concurrent test", start_date, end_date)
+        return await project_page.is_project_visible(names[index])
+
+    with allure.step(f"Создание проектов за {len(users)} пользователей в одном процессе"):
+        results = run_users_sync(scenario, [user["storage_state"] for user in users], browser_name=browser_name,
+                                 headless=browser_type_launch_args.get("headless", True), ignore_https_errors=True)
+    clients = [ApiClient(backend_api_url, user["token"]) for user in users]
+    # Проекты видны только участникам команды проекта, поэтому список у каждого пользователя свой
+    created = [[project for project in client.get_projects() if project["name"] in names] for client in clients]
+    try:
+        with allure.step("Проверка, что каждый пользователь создал свой проект"):
+            failures = [f"{users[i]['email']}: {result}" for i, result in enumerate(results) if result is not True]
+            assert not failures, f"Сценарии пользователей не прошли: {failures}"
+            for index, projects in enumerate(created):
+                assert [p["name"] for p in projects] == [names[index]], \
+                    f"У пользователя {users[index]['email']} проекты {[p['name'] for p in projects]} вместо {names[index]}"
+            logger.info(f"{len(users)} пользователей одновременно создали проекты")
+    finally:
+        for client, projects in zip(clients, created):
+            for project in projects:
+                client.delete_project(project["id"])
+            client.close()
@@ -0,0 +1,49 @@
+# tests/unit/test_data_factory.py
+from collections import Counter
+import allure
+import pytest
+from utils.api_client import ApiError
+from utils.data_factory import build_project, generate_dag
+from utils.task_graph import TaskGraph
+
+
+@pytest.mark.parametrize("fan_in, fan_out", [(1, None), (3, None), (3, 2), (4, 5)])
+@allure.title("generate_dag: глубина, fan-in и fan-out")
+def test_generate_dag_limits(fan_in, fan_out):
+    specs = generate_dag(300, 6, fan_in, seed=1, fan_out=fan_out)
+    edges = [(prerequisite, spec.index) for spec in specs for prerequisite in spec.prerequisites]
+    assert max(TaskGraph(range(300), edges).ranks().values()) == 5
+    assert max(len(spec.prerequisites) for spec in specs) <= fan_in
+    if fan_out is not None:
+        assert max(Counter(prerequisite for prerequisite, _ in edges).values()) <= fan_out
+
+
+@allure.title("generate_dag: некорректные параметры")
+def test_generate_dag_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        generate_dag(10, 3, 0)
+    with pytest.raises(ValueError):
+        generate_dag(10, 3, 2, fan_out=0)
+    # Один слой из 9 задач не может зависеть от единственной задачи с fan_out=1
+    with pytest.raises(ValueError):
+        generate_dag(10, 2, 1, seed=1, fan_out=1)
+
+
+@allure.title("build_project удаляет проект, если задачи создать не удалось")
+def test_build_project_deletes_project_on_failure():
+    class Client:
+        deleted = []
+
+        def create_project(self, name, description):
+            return {"id": 7, "name": name}
+
+        def create_task(self, project_id, title, **kwargs):
+            raise ApiError("POST", "/tasks", 500, "error")
+
+        def delete_project(self, project_id):
+            self.deleted.append(project_id)
+
+    client = Client()
+    with pytest.raises(ApiError):
+        build_project(client, 10, depth=2, seed=1)
+    assert client.deleted == [7]
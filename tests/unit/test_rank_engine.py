@@ -0,0 +1,64 @@
+# tests/unit/test_rank_engine.py
+import allure
+import pytest
+from utils.rank_engine import RankEngine
+from utils.task_graph import CycleError, TaskGraph
+
+
+def full_ranks(engine: RankEngine) -> dict:
+    return TaskGraph(engine.rank, engine.edges()).ranks()
+
+
+@pytest.fixture
+def engine():
+    # 1 -> 2 -> 3 и отдельная задача 4
+    return RankEngine([1, 2, 3, 4], [(1, 2), (2, 3)])
+
+
+@allure.title("Добавление и удаление зависимости возвращают только изменившиеся ранги")
+def test_add_and_remove_edge(engine):
+    assert engine.rank == {1: 0, 2: 1, 3: 2, 4: 0}
+    assert engine.add_edge(3, 4) == {4: 3}
+    assert engine.add_edge(1, 4) == {}
+    assert engine.add_edge(3, 4) == {}
+    assert engine.rank == full_ranks(engine)
+    assert engine.remove_edge(3, 4) == {4: 1}
+    assert engine.remove_edge(3, 4) == {}
+    assert engine.rank == full_ranks(engine)
+
+
+@allure.title("Зависимость, замыкающая цикл, отклоняется без изменения графа")
+def test_add_edge_cycle(engine):
+    with pytest.raises(CycleError) as error:
+        engine.add_edge(3, 1)
+    assert error.value.cycle == [1, 2, 3, 1]
+    with pytest.raises(CycleError):
+        engine.add_edge(2, 2)
+    assert 1 not in engine.successors[3]
+    assert engine.rank == {1: 0, 2: 1, 3: 2, 4: 0}
+
+
+@allure.title("add_task с циклом откатывает задачу и её зависимости")
+def test_add_task_cycle_rollback(engine):
+    edges = set(engine.edges())
+    ranks = dict(engine.rank)
+    with pytest.raises(CycleError):
+        engine.add_task(5, prerequisites=[3], dependents=[4, 1])
+    assert 5 not in engine
+    assert 5 not in engine.successors[3] and 5 not in engine.predecessors[4]
+    assert set(engine.edges()) == edges
+    assert engine.rank == ranks
+    with pytest.raises(KeyError):
+        engine.add_task(5, prerequisites=[99])
+    assert 5 not in engine
+
+
+@allure.title("add_task и remove_task пересчитывают ранги ниже по графу")
+def test_add_and_remove_task(engine):
+    assert engine.add_task(5, prerequisites=[3], dependents=[4]) == {5: 3, 4: 4}
+    with pytest.raises(ValueError):
+        engine.add_task(5)
+    assert engine.rank == full_ranks(engine)
+    assert engine.remove_task(2) == {3: 0, 5: 1, 4: 2}
+    assert 2 not in engine and 2 not in engine.successors[1]
+    assert engine.rank == full_ranks(engine)
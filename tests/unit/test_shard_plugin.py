@@ -0,0 +1,76 @@
+# tests/unit/test_shard_plugin.py
+import random
+from types import SimpleNamespace
+import allure
+from utils.page_reuse import SharedPage, reuse_key
+from utils.shard_plugin import DurationStore, ShardScheduler
+
+
+class FakeConfig:
+    def __init__(self, store, shard=None):
+        self.options = {"--shard": shard, "--durations-store": str(store), "--no-store-durations": False,
+                        "collectonly": False}
+        self.hook = SimpleNamespace(pytest_deselected=lambda items: None)
+
+    def getoption(self, name):
+        return self.options[name]
+
+
+def run_shard(store, shard: str, nodeids: list, measured: dict = None) -> list:
+    config = FakeConfig(store, shard)
+    scheduler = ShardScheduler(config)
+    items = [SimpleNamespace(nodeid=nodeid) for nodeid in nodeids]
+    scheduler.pytest_collection_modifyitems(config, items)
+    for item in items:
+        scheduler.pytest_runtest_logreport(SimpleNamespace(nodeid=item.nodeid, duration=measured[item.nodeid],
+                                                           skipped=False))
+    scheduler.pytest_sessionfinish(None)
+    return [item.nodeid for item in items]
+
+
+@allure.title("Шарды делят тесты по одному снимку длительностей, даже если идут друг за другом")
+def test_shards_partition_with_frozen_store(tmp_path):
+    rng = random.Random(1)
+    nodeids = [f"tests/test_x.py::test_{i}" for i in range(20)]
+    store = DurationStore(tmp_path / "durations.json")
+    store.update({nodeid: rng.uniform(1, 10) for nodeid in nodeids})
+    snapshot = store.load()
+    # Замеры шарда сильно отличаются от истории — раньше это меняло деление для следующих шардов
+    measured = {nodeid: rng.uniform(1, 10) for nodeid in nodeids}
+
+    shards = [run_shard(store.path, f"{index}/3", nodeids, measured) for index in (1, 2, 3)]
+
+    assert sorted(sum(shards, [])) == sorted(nodeids)
+    assert store.load() == snapshot
+    assert store.merge_shards() == [store.shard_path(index, 3) for index in (1, 2, 3)]
+    assert store.load() == {nodeid: round(measured[nodeid], 3) for nodeid in nodeids}
+    assert not list(tmp_path.glob("durations.shard-*"))
+
+
+@allure.title("Случаи параметризованного теста идут подряд и в шарде, --page-reuse их не теряет")
+def test_shard_keeps_parametrized_cases_adjacent(tmp_path):
+    rng = random.Random(2)
+    nodeids = [f"tests/test_auth.py::test_{name}[{case}]" for name in ("login", "signup") for case in range(6)]
+    nodeids += [f"tests/test_x.py::test_{i}" for i in range(8)]
+    store = DurationStore(tmp_path / "durations.json")
+    # Длительности случаев сильно разные: сортировка по отдельным случаям раскидала бы их по шарду
+    store.update({nodeid: rng.uniform(0.1, 20) for nodeid in nodeids})
+    measured = store.load()
+
+    class Context:
+        def new_page(self):
+            return SimpleNamespace(is_closed=lambda: False)
+
+        def close(self):
+            pass
+
+    for index in (1, 2):
+        order = run_shard(store.path, f"{index}/2", nodeids, measured)
+        keys = [reuse_key(nodeid) for nodeid in order]
+        assert keys == sorted(keys, key=keys.index), f"Случаи одного теста разделены: {order}"
+        shared = SharedPage(SimpleNamespace(new_context=lambda **kwargs: Context()))
+        for key in keys:
+            shared.acquire(key)
+            shared.release(dirty=False)
+        assert shared.created == len(set(keys))
+        assert shared.reused == len(keys) - len(set(keys))
@@ -0,0 +1,91 @@
+# tests/unit/test_task_graph.py
+import allure
+import pytest
+from utils.task_graph import CycleError, TaskGraph, random_dag, verify_degrees, verify_project
+
+
+def reference_ranks(ids, edges) -> dict:
+    # Наивный расчёт по определению: rank = max(rank(предпосылка) + 1), без предпосылок 0
+    prerequisites = {task_id: [a for a, b in edges if b == task_id] for task_id in ids}
+    ranks = {}
+
+    def rank(task_id):
+        if task_id not in ranks:
+            ranks[task_id] = max((rank(a) + 1 for a in prerequisites[task_id]), default=0)
+        return ranks[task_id]
+
+    return {task_id: rank(task_id) for task_id in ids}
+
+
+@allure.title("Ранги цепочки и ромба")
+def test_ranks_chain_and_diamond():
+    graph = TaskGraph([10, 20, 30, 40, 50], [(10, 20), (10, 30), (20, 40), (30, 40), (40, 50)])
+    assert graph.ranks() == {10: 0, 20: 1, 30: 1, 40: 2, 50: 3}
+
+
+@allure.title("Рёбра к задачам вне графа отбрасываются")
+def test_edges_outside_graph_are_ignored():
+    graph = TaskGraph([1, 2], [(1, 2), (2, 99), (98, 1)])
+    assert graph.edge_count == 1
+    assert graph.ranks() == {1: 0, 2: 1}
+
+
+@pytest.mark.parametrize("seed", range(5))
+@allure.title("Ранги и топологический порядок на случайном DAG")
+def test_ranks_match_reference_on_random_dag(seed):
+    ids, edges, _ = random_dag(60, 150, seed=seed)
+    graph = TaskGraph(ids, edges)
+    assert graph.ranks() == reference_ranks(ids, edges)
+    position = {task_id: i for i, task_id in enumerate(graph.topological_order())}
+    assert len(position) == len(ids)
+    assert all(position[a] < position[b] for a, b in edges)
+
+
+@allure.title("Цикл: CycleError с путём цикла")
+def test_cycle_is_reported_with_path():
+    graph = TaskGraph([1, 2, 3, 4], [(1, 2), (2, 3), (3, 4), (4, 2)])
+    with pytest.raises(CycleError) as error:
+        graph.ranks()
+    cycle = error.value.cycle
+    assert cycle[0] == cycle[-1]
+    assert set(cycle) == {2, 3, 4}
+    assert all((a, b) in {(2, 3), (3, 4), (4, 2)} for a, b in zip(cycle, cycle[1:]))
+    with pytest.raises(CycleError):
+        graph.topological_order()
+    assert TaskGraph([1, 2], [(1, 2)]).find_cycle() == []
+
+
+@allure.title("Критический путь по сумме duration")
+def test_critical_path():
+    # Обе ветки из трёх задач, критическая идёт через более длинную задачу 2
+    graph = TaskGraph([1, 2, 3, 4], [(1, 2), (1, 3), (2, 4), (3, 4)], durations=[1, 10, 2, 3])
+    assert graph.critical_path() == (14, [1, 2, 4])
+    # Пустой duration считается нулём
+    assert TaskGraph([1, 2], [(1, 2)], durations=[5, None]).critical_path()[0] == 5
+
+
+@allure.title("Сверка degree из ответа API")
+def test_verify_degrees():
+    tasks = [{"id": 1, "degree": 0}, {"id": 2, "degree": 1}, {"id": 3, "degree": 1}]
+    dependencies = [{"prerequisiteTaskId": 1, "dependentTaskId": 2}, {"prerequisiteTaskId": 2, "dependentTaskId": 3}]
+    assert verify_degrees(tasks, dependencies) == [(3, 2, 1)]
+
+
+@allure.title("verify_project ждёт, пока сервер досчитает ранги")
+def test_verify_project_polls_until_settled():
+    class Client:
+        calls = 0
+
+        def get_tasks(self, project_id):
+            # Первые два ответа — до завершения пересчёта рангов
+            self.calls += 1
+            return [{"id": 1, "degree": 0}, {"id": 2, "degree": 1 if self.calls > 2 else 0}]
+
+        def get_project_dependencies(self, project_id):
+            return [{"prerequisiteTaskId": 1, "dependentTaskId": 2}]
+
+    client = Client()
+    assert verify_project(client, 1) == [(2, 1, 0)]
+    client.calls = 0
+    assert verify_project(client, 1, timeout=5, interval=0) == []
+    assert client.calls == 3
@@ -0,0 +1,127 @@
+# utils/api_client.py
+from datetime import date, timedelta
+from typing import Iterable, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from utils.logger import logger
+
+# Значения совпадают с перечислениями в client/src/app/types/types.ts
+PROJECT_STATUS_IN_PROGRESS = "In Progress"
+TASK_STATUS_TODO = "To Do"
+TASK_PRIORITY_MEDIUM = "medium"
+TEAM_ROLE_MEMBER = "MEMBER"
+
+
+class ApiError(Exception):
+    def __init__(self, method: str, url: str, status_code: int, body: str):
+        super().__init__(f"{method} {url} -> {status_code}: {body[:500]}")
+        self.status_code = status_code
+        self.body = body
+
+
+class ApiClient:
+    """Клиент REST API сервера для подготовки тестовых данных.
+
+    API_URL, как и в conftest, указывается вместе с префиксом /api.
+    Соединения переиспользуются через пул requests.Session.
+    """
+
+    def __init__(self, api_url: str, token: str, pool_size: int = 16, timeout: float = 10):
+        self.api_url = api_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json",
+        })
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def request(self, method: str, path: str, **kwargs):
+        url = f"{self.api_url}{path}"
+        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        if response.status_code >= 400:
+            logger.error(f"Ошибка API {method} {path}: {response.status_code}")
+            raise ApiError(method, url, response.status_code, response.text)
+        if response.status_code == 204 or not response.content:
+            return None
+        return response.json()
+
+    # Проекты
+    def get_projects(self) -> list:
+        return self.request("GET", "/projects")
+
+    def create_project(self, name: str, description: str = "", start_date: Optional[date] = None,
+                       end_date: Optional[date] = None, status: str = PROJECT_STATUS_IN_PROGRESS) -> dict:
+        start_date = start_date or date.today()
+        end_date = end_date or start_date + timedelta(days=7)
+        response = self.request("POST", "/projects", json={
+            "name": name,
+            "description": description,
+            "startDate": start_date.isoformat(),
+            "endDate": end_date.isoformat(),
+            "status": status,
+        })
+        project = response["data"]
+        logger.info(f"Создан проект через API: {project['id']} ({name})")
+        return project
+
+    def delete_project(self, project_id: int):
+        self.request("DELETE", f"/projects/{project_id}")
+        logger.info(f"Удалён проект через API: {project_id}")
+
+    def get_project_dependencies(self, project_id: int) -> list:
+        return self.request("GET", f"/projects/{project_id}/tasks/dependencies")
+
+    # Задачи
+    def get_tasks(self, project_id: int) -> list:
+        return self.request("GET", f"/tasks/{project_id}")
+
+    def create_task(self, project_id: int, title: str, description: str = "Test task description",
+                    status: str = TASK_STATUS_TODO, priority: str = TASK_PRIORITY_MEDIUM,
+                    tags: str = "test, automation", start_date: Optional[date] = None,
+                    due_date: Optional[date] = None, points: int = 5,
+                    dependencies: Iterable[int] = ()) -> dict:
+        start_date = start_date or date.today()
+        due_date = due_date or start_date + timedelta(days=7)
+        task = self.request("POST", f"/tasks/{project_id}", json={
+            "title": title,
+            "description": description,
+            "status": status,
+            "priority": priority,
+            "tags": tags,
+            "startDate": start_date.isoformat(),
+            "dueDate": due_date.isoformat(),
+            "points": points,
+            "projectId": project_id,
+            "dependencies": list(dependencies),
+        })
+        logger.info(f"Создана задача через API: {task['id']} в проекте {project_id}")
+        return task
+
+    def update_task_status(self, task_id: int, status: str) -> dict:
+        return self.request("PATCH", f"/tasks/{task_id}/status", json={"status": status})
+
+    def delete_task(self, task_id: int):
+        self.request("DELETE", f"/tasks/{task_id}")
+        logger.info(f"Удалена задача через API: {task_id}")
+
+    # Команды
+    def add_team_member(self, team_id: int, user_id: int, role: str = TEAM_ROLE_MEMBER) -> dict:
+        member = self.request("POST", "/teams/members", json={"teamId": team_id, "userId": user_id, "role": role})
+        logger.info(f"Пользователь {user_id} добавлен в команду {team_id}")
+        return member
+
+    def remove_team_member(self, team_id: int, user_id: int):
+        self.request("DELETE", f"/teams/{team_id}/members/{user_id}")
+        logger.info(f"Пользователь {user_id} удалён из команды {team_id}")
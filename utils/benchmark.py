@@ -0,0 +1,114 @@
+# utils/benchmark.py
+# Замеры пользовательских сценариев: метрики из performance API браузера и сравнение с базовой линией
+import json
+import time
+from pathlib import Path
+from utils.stats import summarize
+
+DEFAULT_BASELINE_PATH = Path(__file__).resolve().parent.parent / "benchmarks" / "baseline.json"
+DEFAULT_THRESHOLD = 0.2
+
+# Navigation Timing, First Contentful Paint, LCP и CLS (через буферизованный PerformanceObserver,
+# getEntries их не отдаёт) и ресурсы, загруженные после отметки since
+WEB_VITALS_JS = """
+async (since) => {
+    const observed = (type) => new Promise((resolve) => {
+        const entries = [];
+        try {
+            new PerformanceObserver((list) => entries.push(...list.getEntries()))
+                .observe({type, buffered: true});
+        } catch (e) {
+            resolve(entries);
+            return;
+        }
+        setTimeout(() => resolve(entries), 50);
+    });
+    const [lcp, shifts] = await Promise.all([observed('largest-contentful-paint'), observed('layout-shift')]);
+    const nav = performance.getEntriesByType('navigation')[0];
+    const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+    const resources = performance.getEntriesByType('resource').filter((r) => r.startTime >= since);
+    const api = resources.filter((r) => r.name.includes('/api/'));
+    return {
+        ttfb: nav ? nav.responseStart - nav.requestStart : null,
+        dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+        load: nav ? nav.loadEventEnd : null,
+        fcp: fcp ? fcp.startTime : null,
+        lcp: lcp.length ? lcp[lcp.length - 1].startTime : null,
+        cls: shifts.filter((s) => !s.hadRecentInput).reduce((sum, s) => sum + s.value, 0),
+        resources: resources.length,
+        transfer_bytes: resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+        api_requests: api.length,
+        api_max: api.length ? Math.max(...api.map((r) => r.duration)) : 0,
+    };
+}
+"""
+
+
+def performance_now(page) -> float:
+    return page.evaluate("performance.now()")
+
+
+def collect_web_vitals(page, since: float = 0) -> dict:
+    return page.evaluate(WEB_VITALS_JS, since)
+
+
+class FlowBenchmark:
+    def __init__(self, name: str, rounds: int = 5, warmup: int = 1):
+        self.name = name
+        self.rounds = rounds
+        self.warmup = warmup
+        self.samples = []
+
+    def run(self, prepare, action, page_of=None, navigates: bool = False):
+        # prepare() готовит состояние и возвращает объект для action; время prepare не учитывается.
+        # page_of(state) — страница, с которой снимаются метрики браузера.
+        # navigates — action загружает новый документ, ресурсы считаются от начала его загрузки
+        for round_index in range(self.warmup + self.rounds):
+            state = prepare()
+            page = page_of(state) if page_of else None
+            since = performance_now(page) if page is not None and not navigates else 0
+            started = time.perf_counter()
+            action(state)
+            duration = time.perf_counter() - started
+            if round_index < self.warmup:
+                continue
+            sample = {"duration": duration}
+            if page is not None:
+                sample.update(collect_web_vitals(page, since))
+            self.samples.append(sample)
+        return self.summary()
+
+    def summary(self) -> dict:
+        metrics = {}
+        for key in self.samples[0] if self.samples else ():
+            values = [sample[key] for sample in self.samples if sample.get(key) is not None]
+            if values:
+                metrics[key] = summarize(values, quantiles=(50, 95))
+        return {"rounds": len(self.samples), "metrics": metrics}
+
+
+def load_baseline(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_results(path: Path, results: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def find_regressions(summary: dict, baseline: dict, threshold: float, metrics=("duration",)) -> list:
+    # Сравниваются медианы: одиночный выброс в раунде не должен валить прогон
+    regressions = []
+    for metric in metrics:
+        current = summary["metrics"].get(metric, {}).get("p50")
+        previous = baseline.get("metrics", {}).get(metric, {}).get("p50")
+        if current is None or not previous:
+            continue
+        if current > previous * (1 + threshold):
+            regressions.append(f"{metric}: медиана {current:.3f} против {previous:.3f} в базовой линии "
+                               f"(+{(current / previous - 1) * 100:.0f}%, порог {threshold * 100:.0f}%)")
+    return regressions
@@ -0,0 +1,147 @@
+# utils/browser_server.py
+# Тёплый браузер для локальных прогонов: демон один раз запускает Chromium с портом CDP,
+# фикстура browser подключается к нему через connect_over_cdp вместо запуска нового браузера.
+# Если демон не запущен или режим не совпадает (headless/headed), браузер запускается как обычно.
+#   python -m utils.browser_server start --detach [--headed]
+#   python -m utils.browser_server status | stop
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from playwright.sync_api import Browser, BrowserType, Error as PlaywrightError, sync_playwright
+from utils.logger import logger
+
+STATE_PATH = Path(__file__).resolve().parent.parent / ".browser_server.json"
+LOG_PATH = STATE_PATH.with_suffix(".log")
+DEFAULT_PORT = 9333
+CONNECT_TIMEOUT = 5000
+
+
+def load_state(path: Path = STATE_PATH):
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+    try:
+        os.kill(state["pid"], 0)
+    except OSError:
+        # Демон завершился без уборки (kill -9, перезагрузка) — состояние устарело
+        path.unlink(missing_ok=True)
+        return None
+    return state
+
+
+def connect(browser_type: BrowserType, headless: bool = True, path: Path = STATE_PATH):
+    """Подключение к тёплому браузеру; None, если подключиться нельзя и нужно запускать свой."""
+    state = load_state(path)
+    if state is None:
+        return None
+    if state["browser"] != browser_type.name or state["headless"] != headless:
+        logger.info(f"Тёплый браузер ({state['browser']}, headless={state['headless']}) не подходит "
+                    f"для {browser_type.name}, headless={headless}: запуск отдельного браузера")
+        return None
+    try:
+        browser = browser_type.connect_over_cdp(state["endpoint"], timeout=CONNECT_TIMEOUT)
+    except PlaywrightError as e:
+        logger.warning(f"Не удалось подключиться к тёплому браузеру {state['endpoint']}: {e}")
+        return None
+    logger.info(f"Подключение к тёплому браузеру {state['endpoint']} (pid {state['pid']})")
+    return browser
+
+
+def serve(port: int, headless: bool, path: Path = STATE_PATH):
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    with sync_playwright() as playwright:
+        browser: Browser = playwright.chromium.launch(
+            headless=headless, args=[f"--remote-debugging-port={port}", "--remote-debugging-address=127.0.0.1"]
+        )
+        path.write_text(json.dumps({
+            "pid": os.getpid(),
+            "browser": "chromium",
+            "endpoint": f"http://127.0.0.1:{port}",
+            "headless": headless,
+            "version": browser.version,
+            "started_at": time.time(),
+        }, indent=2), encoding="utf-8")
+        logger.info(f"Тёплый браузер Chromium {browser.version} слушает CDP на порту {port}")
+        try:
+            while not stop.wait(1):
+                pass
+        finally:
+            path.unlink(missing_ok=True)
+            browser.close()
+            logger.info("Тёплый браузер остановлен")
+
+
+def start_detached(port: int, headless: bool, path: Path = STATE_PATH, timeout: float = 30) -> int:
+    if load_state(path):
+        print(f"Тёплый браузер уже запущен: {path}")
+        return 0
+    command = [sys.executable, "-m", "utils.browser_server", "start", f"--port={port}"]
+    if not headless:
+        command.append("--headed")
+    with LOG_PATH.open("a", encoding="utf-8") as log:
+        process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT, start_new_session=True,
+                                   cwd=Path(__file__).resolve().parent.parent)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        state = load_state(path)
+        if state:
+            print(f"Тёплый браузер запущен: {state['endpoint']} (pid {state['pid']})")
+            return 0
+        if process.poll() is not None:
+            break
+        time.sleep(0.2)
+    print(f"Тёплый браузер не запустился, см. {LOG_PATH}", file=sys.stderr)
+    return 1
+
+
+def stop_server(path: Path = STATE_PATH, timeout: float = 10) -> int:
+    state = load_state(path)
+    if state is None:
+        print("Тёплый браузер не запущен")
+        return 0
+    os.kill(state["pid"], signal.SIGTERM)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline and path.exists():
+        time.sleep(0.2)
+    print("Тёплый браузер остановлен")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m utils.browser_server", description="Тёплый браузер для pytest")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    start_parser = subparsers.add_parser("start", help="Запустить браузер (по умолчанию в текущем терминале)")
+    start_parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    start_parser.add_argument("--headed", action="store_true", help="Видимый браузер, для pytest --headed")
+    start_parser.add_argument("--detach", action="store_true", help="Запустить в фоне")
+    subparsers.add_parser("stop", help="Остановить фоновый браузер")
+    subparsers.add_parser("status", help="Показать состояние")
+    args = parser.parse_args(argv)
+    if args.command == "start":
+        if args.detach:
+            return start_detached(args.port, not args.headed)
+        serve(args.port, not args.headed)
+        return 0
+    if args.command == "stop":
+        return stop_server()
+    state = load_state()
+    if state is None:
+        print("Тёплый браузер не запущен")
+        return 1
+    uptime = (time.time() - state["started_at"]) / 60
+    print(f"{state['browser']} {state['version']} {state['endpoint']} pid {state['pid']}, "
+          f"headless={state['headless']}, работает {uptime:.0f} мин")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
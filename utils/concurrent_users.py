@@ -0,0 +1,38 @@
+# utils/concurrent_users.py
+# Запуск сценария за многих пользователей в одном процессе: один браузер, по контексту на пользователя,
+# сценарии выполняются конкурентно на страницах из pages/aio.
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from playwright.async_api import async_playwright
+from utils.logger import logger
+
+
+async def run_users(scenario, storage_states: list, browser_name: str = "chromium", headless: bool = True,
+                    **context_args) -> list:
+    """scenario(index, page) -> результат; для каждого storage_state — свой контекст.
+
+    Возвращает результаты в порядке пользователей; исключение сценария попадает в список вместо результата,
+    чтобы падение одного пользователя не обрывало остальных посреди действий.
+    """
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, browser_name).launch(headless=headless)
+
+        async def run_one(index: int, storage_state):
+            context = await browser.new_context(storage_state=storage_state, **context_args)
+            try:
+                return await scenario(index, await context.new_page())
+            finally:
+                await context.close()
+
+        try:
+            logger.info(f"Запуск сценария за {len(storage_states)} пользователей")
+            return await asyncio.gather(*(run_one(i, state) for i, state in enumerate(storage_states)),
+                                        return_exceptions=True)
+        finally:
+            await browser.close()
+
+
+def run_users_sync(scenario, storage_states: list, **kwargs) -> list:
+    # Из sync-теста: у sync_api pytest-playwright свой цикл событий в этом потоке, поэтому asyncio — в отдельном
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, run_users(scenario, storage_states, **kwargs)).result()
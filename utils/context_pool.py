@@ -0,0 +1,91 @@
+# utils/context_pool.py
+from playwright.sync_api import Browser, BrowserContext
+from utils.logger import logger
+
+# Служебный путь на origin приложения: отдаётся из route, до dev-сервера не доходит
+RESET_PATH = "/__context_pool_reset__"
+RESET_SCRIPT = """(items) => {
+    window.localStorage.clear();
+    window.sessionStorage.clear();
+    for (const {name, value} of items) {
+        window.localStorage.setItem(name, value);
+    }
+}"""
+
+
+class ContextPool:
+    """Пул авторизованных BrowserContext на всю сессию.
+
+    Контекст выдаётся тесту через lease() и возвращается через release().
+    Между тестами контекст не пересоздаётся: закрываются страницы, а cookies
+    и localStorage сбрасываются к исходному состоянию авторизации.
+    """
+
+    def __init__(self, browser: Browser, storage_state: dict, base_url: str, **context_args):
+        self.browser = browser
+        self.storage_state = storage_state
+        self.base_url = base_url.rstrip("/")
+        self.context_args = context_args
+        self._idle = []
+        self._leased = []
+        self.created = 0
+        self.reused = 0
+
+    def lease(self) -> BrowserContext:
+        if self._idle:
+            context = self._idle.pop()
+            self.reused += 1
+        else:
+            context = self._create_context()
+        self._leased.append(context)
+        return context
+
+    def release(self, context: BrowserContext):
+        if context in self._leased:
+            self._leased.remove(context)
+        try:
+            self._reset(context)
+        except Exception as e:
+            logger.warning(f"Не удалось сбросить контекст, он будет закрыт: {e}")
+            self._close_quietly(context)
+            return
+        self._idle.append(context)
+
+    def close(self):
+        for context in self._idle + self._leased:
+            self._close_quietly(context)
+        logger.info(f"Пул контекстов закрыт: создано {self.created}, переиспользовано {self.reused}")
+        self._idle.clear()
+        self._leased.clear()
+
+    def _create_context(self) -> BrowserContext:
+        context = self.browser.new_context(storage_state=self.storage_state, **self.context_args)
+        context.route(f"**{RESET_PATH}", lambda route: route.fulfill(
+            status=200, content_type="text/html", body="<!doctype html><html></html>"
+        ))
+        self.created += 1
+        logger.info(f"Создан новый контекст в пуле (всего: {self.created})")
+        return context
+
+    def _reset(self, context: BrowserContext):
+        for page in list(context.pages):
+            page.close()
+        context.clear_cookies()
+        if self.storage_state.get("cookies"):
+            context.add_cookies(self.storage_state["cookies"])
+        origins = {origin["origin"].rstrip("/"): origin.get("localStorage", []) for origin in self.storage_state.get("origins", [])}
+        origins.setdefault(self.base_url, [])
+        page = context.new_page()
+        try:
+            for origin, items in origins.items():
+                page.goto(f"{origin}{RESET_PATH}", wait_until="domcontentloaded")
+                page.evaluate(RESET_SCRIPT, items)
+        finally:
+            page.close()
+
+    @staticmethod
+    def _close_quietly(context: BrowserContext):
+        try:
+            context.close()
+        except Exception as e:
+            logger.warning(f"Ошибка при закрытии контекста: {e}")
@@ -0,0 +1,132 @@
+# utils/data_factory.py
+import random
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from utils.api_client import ApiClient
+from utils.logger import logger
+
+
+@dataclass
+class TaskSpec:
+    index: int
+    layer: int
+    prerequisites: list
+    duration_days: int
+
+
+@dataclass
+class BulkProject:
+    project: dict
+    task_ids: list = field(default_factory=list)
+    # Рёбра в терминах TaskDependency: (prerequisiteTaskId, dependentTaskId)
+    edges: list = field(default_factory=list)
+
+    @property
+    def project_id(self) -> int:
+        return self.project["id"]
+
+
+def generate_dag(n_tasks: int, depth: int, fan_in: int, seed=None, fan_out: int = None) -> list:
+    # Задачи раскладываются по depth слоям; каждая задача слоя k > 0 зависит
+    # от одной задачи слоя k-1 (чтобы глубина была ровно depth) и ещё
+    # максимум от fan_in-1 случайных задач из более ранних слоёв.
+    # fan_in — наибольшее число предшественников (prerequisites) у задачи,
+    # fan_out — наибольшее число зависимых задач (dependents), None — без ограничения.
+    if n_tasks < depth:
+        raise ValueError(f"Задач ({n_tasks}) меньше, чем слоёв ({depth})")
+    if fan_in < 1:
+        raise ValueError(f"fan_in должен быть не меньше 1, получено {fan_in}")
+    if fan_out is not None and fan_out < 1:
+        raise ValueError(f"fan_out должен быть не меньше 1, получено {fan_out}")
+    rng = random.Random(seed)
+    layers = [[] for _ in range(depth)]
+    for index in range(n_tasks):
+        layer = index if index < depth else rng.randrange(depth)
+        layers[layer].append(index)
+
+    dependents = [0] * n_tasks
+
+    def available(index):
+        return fan_out is None or dependents[index] < fan_out
+
+    specs = []
+    earlier = []
+    for layer_number, layer in enumerate(layers):
+        prerequisites = {index: [] for index in layer}
+        if layer_number > 0:
+            # Сначала обязательные предшественники всего слоя — наименее нагруженные задачи предыдущего,
+            # чтобы случайные рёбра не исчерпали их fan_out раньше
+            for index in layer:
+                previous = min(layers[layer_number - 1], key=lambda i: (dependents[i], rng.random()))
+                if not available(previous):
+                    raise ValueError(f"fan_out={fan_out} мал: в слое {layer_number - 1} не хватает задач "
+                                     f"для {len(layer)} задач слоя {layer_number}")
+                prerequisites[index].append(previous)
+                dependents[previous] += 1
+            for index in layer:
+                candidates = [i for i in earlier if i not in prerequisites[index] and available(i)]
+                for candidate in rng.sample(candidates, min(fan_in - 1, len(candidates))):
+                    prerequisites[index].append(candidate)
+                    dependents[candidate] += 1
+        for index in layer:
+            specs.append(TaskSpec(index, layer_number, prerequisites[index], rng.randint(1, 10)))
+        earlier.extend(layer)
+    return specs
+
+
+def build_project(api_client: ApiClient, n_tasks: int, depth: int = 5, fan_in: int = 2,
+                  workers: int = 16, seed=None, name: str = None, fan_out: int = None) -> BulkProject:
+    started = datetime.now()
+    name = name or f"Bulk Project {n_tasks}x{depth} {started.strftime('%Y%m%d%H%M%S%f')}"
+    # Граф строится до создания проекта: ошибка в параметрах не оставит пустой проект
+    specs = generate_dag(n_tasks, depth, fan_in, seed, fan_out)
+    description = f"{n_tasks} задач, глубина {depth}, fan-in {fan_in}" + (f", fan-out {fan_out}" if fan_out else "")
+    bulk = BulkProject(api_client.create_project(name, description))
+    by_layer = {}
+    for spec in specs:
+        by_layer.setdefault(spec.layer, []).append(spec)
+
+    task_ids = {}
+    start = date.today()
+
+    def create(spec: TaskSpec):
+        dependencies = [task_ids[index] for index in spec.prerequisites]
+        task = api_client.create_task(
+            bulk.project_id,
+            f"Task {spec.index} (L{spec.layer})",
+            start_date=start + timedelta(days=spec.layer),
+            due_date=start + timedelta(days=spec.layer + spec.duration_days),
+            dependencies=dependencies,
+        )
+        return spec, task["id"], dependencies
+
+    # Слои создаются по порядку: зависимости задачи должны уже существовать.
+    # Внутри слоя запросы идут параллельно пачками по workers штук.
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for layer in sorted(by_layer):
+                for spec, task_id, dependencies in executor.map(create, by_layer[layer]):
+                    task_ids[spec.index] = task_id
+                    bulk.edges.extend((prerequisite, task_id) for prerequisite in dependencies)
+    except Exception:
+        # Вызывающий не получит bulk и не сможет удалить проект сам; задачи удаляются вместе с проектом
+        logger.error(f"Ошибка при создании задач, удаление проекта {bulk.project_id}")
+        try:
+            api_client.delete_project(bulk.project_id)
+        except Exception as e:
+            logger.warning(f"Не удалось удалить проект {bulk.project_id}: {e}")
+        raise
+
+    bulk.task_ids = [task_ids[spec.index] for spec in specs]
+    elapsed = (datetime.now() - started).total_seconds()
+    logger.info(f"Проект {bulk.project_id}: создано {len(bulk.task_ids)} задач и {len(bulk.edges)} зависимостей за {elapsed:.1f} с")
+    return bulk
+
+
+def build_projects(api_client: ApiClient, count: int, workers: int = 16, **project_kwargs) -> list:
+    # Проекты независимы, поэтому создаются параллельно, по одному на поток;
+    # задачи внутри каждого проекта создаются последовательно по слоям
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(build_project, api_client, workers=1, **project_kwargs) for _ in range(count)]
+        return [future.result() for future in futures]
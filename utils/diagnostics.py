@@ -0,0 +1,129 @@
+# utils/diagnostics.py
+import time
+import allure
+from pathlib import Path
+from utils.logger import logger
+
+# Уровни диагностики:
+# failure — только хлебные крошки, артефакты снимаются при падении теста;
+# trace   — как failure, плюс Playwright trace, который сохраняется только при падении;
+# steps   — как failure, плюс скриншот на каждом checkpoint (прежнее поведение)
+LEVELS = ("failure", "trace", "steps")
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+TRACES_DIR = Path("test-results") / "traces"
+
+_current = None
+
+
+def current():
+    return _current
+
+
+def checkpoint(name: str, page=None):
+    # Дешёвая отметка шага в тесте: вместо скриншота на каждом успешном шаге
+    if _current is not None:
+        _current.checkpoint(name, page)
+
+
+class DiagnosticsRecorder:
+    def __init__(self, test_id: str, level: str = "failure", max_bytes: int = DEFAULT_MAX_BYTES):
+        if level not in LEVELS:
+            raise ValueError(f"Неизвестный уровень диагностики: {level}, допустимые: {', '.join(LEVELS)}")
+        self.test_id = test_id
+        self.level = level
+        self.max_bytes = max_bytes
+        self.attached_bytes = 0
+        self.skipped = []
+        self.breadcrumbs = []
+        self.contexts = []
+        self.failure_captured = False
+        # Страницы, артефакты которых уже сняты: id(page) -> URL на момент снятия
+        self._captured_pages = {}
+        self._started = time.monotonic()
+
+    def activate(self):
+        global _current
+        _current = self
+        return self
+
+    def deactivate(self):
+        global _current
+        if _current is self:
+            _current = None
+
+    def register_context(self, context):
+        self.contexts.append(context)
+        if self.level == "trace":
+            context.tracing.start(screenshots=True, snapshots=True, sources=False)
+
+    def unregister_context(self, context):
+        if context not in self.contexts:
+            return
+        self.contexts.remove(context)
+        if self.level == "trace":
+            try:
+                context.tracing.stop()
+            except Exception as e:
+                logger.warning(f"Не удалось остановить трассировку: {e}")
+
+    def checkpoint(self, name: str, page=None):
+        url = page.url if page is not None else None
+        self.breadcrumbs.append((time.monotonic() - self._started, name, url))
+        if self.level == "steps" and page is not None:
+            self.attach(page.screenshot(), name, allure.attachment_type.PNG)
+
+    def attach(self, body, name: str, attachment_type) -> bool:
+        size = len(body.encode("utf-8")) if isinstance(body, str) else len(body)
+        if self.attached_bytes + size > self.max_bytes:
+            self.skipped.append(f"{name} ({size} байт)")
+            logger.warning(f"Вложение {name} пропущено: превышен лимит {self.max_bytes} байт на тест")
+            return False
+        self.attached_bytes += size
+        allure.attach(body, name=name, attachment_type=attachment_type)
+        return True
+
+    def capture_page(self, page, prefix: str = "failure"):
+        if page.is_closed() or self._captured_pages.get(id(page)) == page.url:
+            return
+        self._captured_pages[id(page)] = page.url
+        safe_url = page.url.split("?")[0].rstrip("/").rsplit("/", 1)[-1] or "root"
+        try:
+            self.attach(page.screenshot(), f"{prefix}_{safe_url}.png", allure.attachment_type.PNG)
+            self.attach(page.content(), f"{prefix}_{safe_url}.html", allure.attachment_type.HTML)
+        except Exception as e:
+            logger.warning(f"Не удалось снять артефакты страницы {page.url}: {e}")
+
+    def on_failure(self):
+        if self.failure_captured:
+            return
+        self.failure_captured = True
+        self.attach(self.format_breadcrumbs(), "breadcrumbs.txt", allure.attachment_type.TEXT)
+        for index, context in enumerate(list(self.contexts)):
+            for page in context.pages:
+                self.capture_page(page)
+            if self.level == "trace":
+                self._save_trace(context, index)
+        if self.skipped:
+            allure.attach("\n".join(self.skipped), name="skipped_attachments.txt", attachment_type=allure.attachment_type.TEXT)
+
+    def format_breadcrumbs(self) -> str:
+        return "\n".join(
+            f"{elapsed:8.3f}s  {name}" + (f"  [{url}]" if url else "")
+            for elapsed, name, url in self.breadcrumbs
+        ) or "нет отметок"
+
+    def _save_trace(self, context, index: int):
+        TRACES_DIR.mkdir(parents=True, exist_ok=True)
+        path = TRACES_DIR / f"{self.test_id.replace('/', '_').replace('::', '__')}_{index}.zip"
+        try:
+            context.tracing.stop(path=str(path))
+        except Exception as e:
+            logger.warning(f"Не удалось сохранить трассировку: {e}")
+            return
+        # Трассировка уже остановлена, повторная остановка в unregister не нужна
+        self.contexts = [c for c in self.contexts if c is not context]
+        if path.stat().st_size + self.attached_bytes <= self.max_bytes:
+            self.attached_bytes += path.stat().st_size
+            allure.attach.file(str(path), name="trace.zip", extension="zip")
+        else:
+            logger.warning(f"Трассировка {path} не приложена: превышен лимит, файл сохранён на диске")
@@ -0,0 +1,121 @@
+# utils/dom_snapshot.py
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
+from playwright.sync_api import Error as PlaywrightError, Page
+
+# Состояние одного набора элементов: число совпадений и данные первого из них.
+# Видимость считается как в Playwright: непустой bounding box и visibility не hidden.
+ELEMENTS_SCRIPT = """(elements, attributes) => {
+    const first = elements[0];
+    if (!first) {
+        return {count: 0, visible: false, text: null, value: null, attributes: {}};
+    }
+    const rect = first.getBoundingClientRect();
+    return {
+        count: elements.length,
+        visible: rect.width > 0 && rect.height > 0 && getComputedStyle(first).visibility !== "hidden",
+        text: first.textContent,
+        value: "value" in first ? String(first.value) : null,
+        attributes: Object.fromEntries(attributes.map((name) => [name, first.getAttribute(name)])),
+    };
+}"""
+
+# Все CSS-селекторы за один вызов. Селекторы Playwright (text=, :has-text) document.querySelectorAll
+# не понимает: для них возвращается null, и они снимаются отдельно через locator.evaluate_all.
+SNAPSHOT_SCRIPT = f"""([selectors, attributes]) => {{
+    const collect = {ELEMENTS_SCRIPT};
+    return selectors.map((selector) => {{
+        let elements;
+        try {{
+            elements = Array.from(document.querySelectorAll(selector));
+        }} catch (e) {{
+            return null;
+        }}
+        return collect(elements, attributes);
+    }});
+}}"""
+
+
+@dataclass(frozen=True)
+class ElementState:
+    selector: str
+    count: int
+    visible: bool
+    text: Optional[str]
+    value: Optional[str]
+    attributes: Mapping[str, Optional[str]]
+
+    def attribute(self, name: str) -> Optional[str]:
+        return self.attributes.get(name)
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Неизменяемый снимок DOM: проверки по нему идут локально, без обращений к браузеру."""
+    elements: Mapping[str, ElementState]
+    taken_at: float
+
+    def __getitem__(self, name: str) -> ElementState:
+        return self.elements[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.elements
+
+    def all_visible(self) -> bool:
+        return all(state.visible for state in self.elements.values())
+
+
+class SnapshotTimeoutError(AssertionError):
+    def __init__(self, message: str, snapshot: Optional[Snapshot]):
+        super().__init__(message)
+        self.snapshot = snapshot
+
+
+def take_snapshot(page: Page, spec: Mapping[str, str], attributes=()) -> Snapshot:
+    """spec — словарь {имя: селектор}; attributes снимаются у первого элемента каждого селектора."""
+    attributes = list(attributes)
+    selectors = list(spec.values())
+    raw = page.evaluate(SNAPSHOT_SCRIPT, [selectors, attributes])
+    elements = {}
+    for (name, selector), state in zip(spec.items(), raw):
+        if state is None:
+            state = page.locator(selector).evaluate_all(ELEMENTS_SCRIPT, attributes)
+        elements[name] = ElementState(
+            selector=selector,
+            count=state["count"],
+            visible=state["visible"],
+            text=state["text"],
+            value=state["value"],
+            attributes=MappingProxyType(state["attributes"]),
+        )
+    return Snapshot(MappingProxyType(elements), time.monotonic())
+
+
+def wait_for_snapshot(page: Page, spec: Mapping[str, str], until: Callable[[Snapshot], bool], attributes=(),
+                      timeout: int = 30000, interval: int = 100) -> Snapshot:
+    """Снимает снимки, пока until(snapshot) не станет истинным; таймаут и интервал в мс.
+
+    Навигация или перерисовка во время ожидания ("Execution context was destroyed") не прерывает
+    его, как и у expect(...): снимок повторяется до истечения таймаута.
+    """
+    deadline = time.monotonic() + timeout / 1000
+    snapshot, error = None, None
+    while True:
+        try:
+            snapshot, error = take_snapshot(page, spec, attributes), None
+        except PlaywrightError as e:
+            error = e
+        if error is None and until(snapshot):
+            return snapshot
+        if time.monotonic() >= deadline:
+            state = f"ошибка снимка: {error}" if error is not None else describe(snapshot)
+            raise SnapshotTimeoutError(f"Снимок DOM не достиг ожидаемого состояния за {timeout} мс: {state}", snapshot)
+        page.wait_for_timeout(interval)
+
+
+def describe(snapshot: Snapshot) -> str:
+    return ", ".join(
+        f"{name}: count={state.count}, visible={state.visible}" for name, state in snapshot.elements.items()
+    )
@@ -0,0 +1,104 @@
+# utils/form_driver.py
+from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
+from utils.logger import logger
+
+# Ждёт, пока все поля формы видимы и активны, и заполняет их за один вызов в браузере.
+# Значение ставится через сеттер прототипа, а не el.value = ...: иначе React не увидит изменения
+# (его трекер значения сравнивает со значением, записанным через свойство экземпляра) и onChange не сработает.
+# Возвращает null, пока форма не готова: page.wait_for_function повторяет вызов до истинного результата.
+FILL_SCRIPT = """(fields) => {
+    const elements = [];
+    for (const field of fields) {
+        let element;
+        try {
+            element = document.querySelector(field.selector);
+        } catch (e) {
+            // Селектор Playwright (text=, :has-text) — document.querySelector его не понимает, поле заполнит fill
+            elements.push(undefined);
+            continue;
+        }
+        if (!element || !element.getClientRects().length || element.disabled || element.readOnly) {
+            return null;
+        }
+        elements.push(element);
+    }
+    return fields.map((field, index) => {
+        const element = elements[index];
+        if (!element) {
+            return {selector: field.selector, tag: null, ok: false, reason: "selector"};
+        }
+        // У contenteditable или элемента, найденного слишком широким селектором, сеттера value нет
+        const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), "value");
+        const setter = descriptor && descriptor.set;
+        if (!setter) {
+            return {selector: field.selector, tag: element.tagName, ok: false, reason: "selector"};
+        }
+        element.focus();
+        setter.call(element, field.value);
+        element.dispatchEvent(new Event("input", {bubbles: true}));
+        element.dispatchEvent(new Event("change", {bubbles: true}));
+        element.blur();
+        // Браузер сбрасывает значение, которое не прошло разбор (дата вне диапазона, нет такой опции)
+        const ok = element.value === field.value;
+        return {selector: field.selector, tag: element.tagName, ok, reason: ok ? null : "value"};
+    });
+}"""
+
+
+# Если форма так и не стала готова, полный таймаут уже истрачен: поштучный fill лишь даёт точную ошибку
+# Playwright по первому неготовому полю, поэтому ждёт недолго
+READY_FALLBACK_TIMEOUT = 1000
+
+
+class FormFillError(AssertionError):
+    def __init__(self, failed: list):
+        details = ", ".join(f"{item['selector']} ({item.get('reason') or 'timeout'})" for item in failed)
+        super().__init__(f"Не удалось заполнить поля формы: {details}")
+        self.failed = failed
+
+
+class FormDriver:
+    """Заполнение формы за один вызов page.wait_for_function вместо ожидания и fill на каждое поле.
+
+    fields — словарь {селектор: значение}, порядок заполнения совпадает с порядком ключей.
+    После заполнения каждое значение перечитывается из DOM. В строгом режиме (по умолчанию)
+    поля, которые не удалось заполнить пакетно, заполняются обычным locator.fill / select_option:
+    проверки Playwright дают точную ошибку, а поведение совпадает с поштучным заполнением.
+    Если форма не стала готова за timeout, поштучное заполнение ждёт не дольше READY_FALLBACK_TIMEOUT.
+    Без строгого режима такие поля сразу приводят к FormFillError.
+    """
+
+    def __init__(self, page: Page, timeout: int = 30000, strict: bool = True):
+        self.page = page
+        self.timeout = timeout
+        self.strict = strict
+        self.fallbacks = 0
+
+    def fill(self, fields: dict) -> list:
+        """Возвращает селекторы полей, заполненных поштучно."""
+        values = {selector: "" if value is None else str(value) for selector, value in fields.items()}
+        payload = [{"selector": selector, "value": value} for selector, value in values.items()]
+        timeout = self.timeout
+        try:
+            results = self.page.wait_for_function(FILL_SCRIPT, arg=payload, timeout=self.timeout).json_value()
+        except PlaywrightTimeoutError:
+            logger.warning(f"Форма не готова к пакетному заполнению за {self.timeout} мс")
+            results = [{"selector": selector, "tag": None, "ok": False, "reason": None} for selector in values]
+            timeout = READY_FALLBACK_TIMEOUT
+        failed = [item for item in results if not item["ok"]]
+        if failed and not self.strict:
+            raise FormFillError(failed)
+        for item in failed:
+            self._fill_field(item["selector"], item["tag"], values[item["selector"]], timeout)
+        logger.info(f"Форма заполнена: {len(values)} полей, поштучно {len(failed)}")
+        return [item["selector"] for item in failed]
+
+    def _fill_field(self, selector: str, tag: str, value: str, timeout: int):
+        self.fallbacks += 1
+        logger.info(f"Поштучное заполнение поля {selector}")
+        locator = self.page.locator(selector)
+        tag = tag or locator.evaluate("element => element.tagName", timeout=timeout)
+        if tag == "SELECT":
+            locator.select_option(value, timeout=timeout)
+        else:
+            locator.fill(value, timeout=timeout)
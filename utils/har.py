@@ -0,0 +1,180 @@
+# utils/har.py
+# Запись и воспроизведение трафика API через HAR, по одному файлу на тест.
+# record — запросы к API идут на сервер и сохраняются в HAR (только для прошедших тестов);
+# replay — ответы API отдаются из HAR через context.route_from_har, сервер не нужен.
+# Перезапись устаревших HAR: python -m utils.har refresh --max-age-days 7
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+from playwright.sync_api import BrowserContext
+from utils.logger import logger
+from utils.token_cache import FileLock
+
+HAR_MODES = ("off", "record", "replay")
+DEFAULT_HAR_DIR = Path(__file__).resolve().parent.parent / "tests" / "har"
+INDEX_NAME = "index.json"
+REDACTED = "<redacted>"
+# Заголовки и поля ответов, которые не должны попасть в репозиторий
+SECRET_HEADERS = {"authorization", "cookie", "set-cookie"}
+SECRET_FIELDS = {"token", "accessToken", "password"}
+# Токен для состояния авторизации при воспроизведении: HAR сопоставляет запросы без учёта заголовка Authorization
+REPLAY_TOKEN = "har-replay"
+
+
+def har_path(har_dir: Path, nodeid: str) -> Path:
+    # tests/test_navigation.py::test_homepage_loads[chromium] -> test_navigation/test_homepage_loads[chromium].har
+    module, _, name = nodeid.partition("::")
+    safe_name = re.sub(r"[^\w\[\].-]+", "_", name)
+    return Path(har_dir) / Path(module).stem / f"{safe_name}.har"
+
+
+def api_url_pattern(api_url: str) -> str:
+    return f"{api_url.rstrip('/')}/**"
+
+
+def _redact_body(text: str) -> str:
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text
+
+    def walk(value):
+        if isinstance(value, dict):
+            return {k: REDACTED if k in SECRET_FIELDS else walk(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [walk(item) for item in value]
+        return value
+
+    return json.dumps(walk(data), ensure_ascii=False)
+
+
+def sanitize_har(path: Path):
+    har = json.loads(path.read_text(encoding="utf-8"))
+    for entry in har["log"]["entries"]:
+        for message in (entry["request"], entry["response"]):
+            message["headers"] = [h for h in message.get("headers", []) if h["name"].lower() not in SECRET_HEADERS]
+            message["cookies"] = []
+        content = entry["response"].get("content", {})
+        if content.get("text") and content.get("encoding") != "base64":
+            content["text"] = _redact_body(content["text"])
+        post_data = entry["request"].get("postData")
+        if post_data and post_data.get("text"):
+            post_data["text"] = _redact_body(post_data["text"])
+    path.write_text(json.dumps(har, ensure_ascii=False, indent=1), encoding="utf-8")
+
+
+class HarIndex:
+    """index.json в каталоге HAR: файл -> тест, время записи и пользователь для состояния авторизации."""
+
+    def __init__(self, har_dir: Path):
+        self.har_dir = Path(har_dir)
+        self.path = self.har_dir / INDEX_NAME
+
+    def load(self) -> dict:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def get(self, har_file: Path):
+        return self.load().get(har_file.relative_to(self.har_dir).as_posix())
+
+    def put(self, har_file: Path, nodeid: str, user: dict):
+        self.har_dir.mkdir(parents=True, exist_ok=True)
+        with FileLock(self.path.with_suffix(".lock")):
+            entries = self.load()
+            entries[har_file.relative_to(self.har_dir).as_posix()] = {
+                "nodeid": nodeid,
+                "recorded_at": time.time(),
+                "user": user,
+            }
+            self.path.write_text(json.dumps(entries, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+
+    def stale(self, max_age_days: float) -> list:
+        # Устаревшие записи и записи, HAR которых удалён
+        deadline = time.time() - max_age_days * 86400
+        return [entry["nodeid"] for name, entry in sorted(self.load().items())
+                if entry["recorded_at"] < deadline or not (self.har_dir / name).exists()]
+
+
+class HarSession:
+    def __init__(self, mode: str, har_dir: Path, nodeid: str, api_url: str):
+        if mode not in HAR_MODES:
+            raise ValueError(f"Неизвестный режим HAR: {mode}, допустимые: {', '.join(HAR_MODES)}")
+        self.mode = mode
+        self.nodeid = nodeid
+        self.api_url = api_url
+        self.index = HarIndex(har_dir)
+        self.path = har_path(har_dir, nodeid)
+        # Запись идёт во временный файл рядом: прежний HAR заменяется, только если тест прошёл
+        self.recording_path = self.path.with_suffix(".recording.har")
+
+    @property
+    def available(self) -> bool:
+        return self.mode != "replay" or self.path.exists()
+
+    def replay_user(self) -> dict:
+        entry = self.index.get(self.path)
+        return entry["user"] if entry else {}
+
+    def attach(self, context: BrowserContext):
+        # Вызывается до установки остальных маршрутов: их fallback доходит до HAR
+        pattern = api_url_pattern(self.api_url)
+        if self.mode == "record":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.recording_path.unlink(missing_ok=True)
+            context.route_from_har(self.recording_path, url=pattern, update=True, update_content="embed", update_mode="minimal")
+            logger.info(f"Запись трафика API в {self.recording_path}")
+        else:
+            context.route_from_har(self.path, url=pattern, not_found="abort")
+            logger.info(f"Ответы API воспроизводятся из {self.path}")
+
+    def finish(self, passed: bool, user: dict = None):
+        # HAR дописывается при закрытии контекста, поэтому finish вызывается после context.close()
+        if self.mode != "record":
+            return
+        if not passed:
+            logger.warning(f"Тест не прошёл, HAR {self.path} не обновлён")
+            self.recording_path.unlink(missing_ok=True)
+            return
+        os.replace(self.recording_path, self.path)
+        sanitize_har(self.path)
+        self.index.put(self.path, self.nodeid, user or {})
+
+
+def refresh(har_dir: Path, max_age_days: float, refresh_all: bool, pytest_args: list) -> int:
+    index = HarIndex(har_dir)
+    nodeids = [entry["nodeid"] for entry in index.load().values()] if refresh_all else index.stale(max_age_days)
+    if not nodeids:
+        print("Устаревших HAR нет")
+        return 0
+    print(f"Перезапись HAR для {len(nodeids)} тестов")
+    command = [sys.executable, "-m", "pytest", "--har=record", f"--har-dir={har_dir}", *pytest_args, *sorted(set(nodeids))]
+    return subprocess.call(command)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m utils.har", description="Обслуживание HAR для режима replay")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    refresh_parser = subparsers.add_parser("refresh", help="Перезаписать устаревшие HAR, запустив их тесты с --har=record")
+    refresh_parser.add_argument("--har-dir", type=Path, default=DEFAULT_HAR_DIR)
+    refresh_parser.add_argument("--max-age-days", type=float, default=7)
+    refresh_parser.add_argument("--all", dest="refresh_all", action="store_true", help="Перезаписать все HAR")
+    list_parser = subparsers.add_parser("list", help="Показать записанные HAR и их возраст")
+    list_parser.add_argument("--har-dir", type=Path, default=DEFAULT_HAR_DIR)
+    args, pytest_args = parser.parse_known_args(argv)
+    if args.command == "list":
+        for name, entry in sorted(HarIndex(args.har_dir).load().items()):
+            age_days = (time.time() - entry["recorded_at"]) / 86400
+            print(f"{age_days:6.1f} дн.  {name}  {entry['nodeid']}")
+        return 0
+    return refresh(args.har_dir, args.max_age_days, args.refresh_all, pytest_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,419 @@
+# utils/impact.py
+# Выбор тестов, затронутых изменениями (git diff), вместо полного прогона.
+# Клиент: изменённый файл client/src -> страницы Next.js (page.tsx), которые его импортируют -> маршруты;
+# маршрут -> тесты, которые на него переходят сами или через страницы из pages/ (self.url).
+# Сервер: контроллер или роутер -> префикс API (/api/tasks) -> тесты, которые обращались к нему
+# по записанным HAR (tests/har) или ждут его ответов в READY_RESPONSES своих страниц.
+# Python: изменённый модуль -> тесты, которые его импортируют; всё, от чего зависит conftest, — полный прогон.
+#   pytest $(python -m utils.impact --base origin/main)
+#   python -m utils.impact --base main --explain
+import argparse
+import ast
+import json
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path, PurePosixPath
+from urllib.parse import urlparse
+from utils.har import DEFAULT_HAR_DIR, HarIndex
+
+ROOT = Path(__file__).resolve().parent.parent
+CLIENT_SRC = "client/src"
+CLIENT_APP = "client/src/app"
+SERVER_SRC = "server/src"
+TESTS_DIR = "tests"
+PAGES_DIR = "pages"
+# Async-страницы для сценариев многих пользователей (utils/concurrent_users)
+AIO_PAGES_DIR = "pages/aio"
+# Без этих префиксов API не проходит ни один тест с авторизацией
+GLOBAL_API = {"/api/auth", "/api/refresh"}
+# Фикстуры conftest, готовящие данные через API: тест зависит от этих префиксов, даже если страница их не вызывает
+FIXTURE_API = {
+    "seeded_project": {"/api/projects", "/api/tasks"},
+    "project_factory": {"/api/projects", "/api/tasks"},
+}
+# Файлы, не влияющие на тесты
+IGNORED_SUFFIXES = {".md", ".txt", ".png", ".jpg", ".svg", ".ico"}
+IGNORED_FILES = {".gitignore", "requests.jsonl", "client/README.md"}
+# Конфигурация запуска — любое её изменение требует полного прогона
+GLOBAL_FILES = {"pytest.ini", "requirements.txt", "tests/conftest.py"}
+
+TS_IMPORT = re.compile(r"""(?:import|export)\s[^'"]*?from\s*['"]([^'"]+)['"]|import\s*\(?\s*['"]([^'"]+)['"]""")
+TS_EXTENSIONS = ("", ".ts", ".tsx", ".js", ".jsx", "/index.ts", "/index.tsx", "/index.js")
+APP_USE = re.compile(r"""app\.use\(\s*['"]([^'"]+)['"]\s*,\s*(\w+)\s*\)""")
+DEFAULT_IMPORT = re.compile(r"""import\s+(\w+)\s+from\s+['"]([^'"]+)['"]""")
+
+
+class Selection:
+    def __init__(self):
+        self.full = False
+        self.reasons = defaultdict(set)
+
+    def select(self, nodeid: str, reason: str):
+        self.reasons[nodeid].add(reason)
+
+    def select_all(self, reason: str):
+        self.full = True
+        self.reasons[TESTS_DIR].add(reason)
+
+    @property
+    def nodeids(self) -> list:
+        return [TESTS_DIR] if self.full else sorted(self.reasons)
+
+
+def changed_files(base: str, root: Path = ROOT) -> list:
+    # Коммиты ветки относительно точки ответвления от base плюс незакоммиченные изменения
+    merge_base = subprocess.check_output(["git", "merge-base", base, "HEAD"], cwd=root, text=True).strip()
+    output = subprocess.check_output(["git", "diff", "--name-only", merge_base], cwd=root, text=True)
+    return [line for line in output.splitlines() if line]
+
+
+def api_area(url: str):
+    # /api/tasks/12/status -> /api/tasks; шаблоны READY_RESPONSES (*/api/teams) разбираются так же
+    parts = PurePosixPath(urlparse(url).path if "://" in url else url).parts
+    if "api" not in parts:
+        return None
+    index = parts.index("api")
+    return f"/api/{parts[index + 1]}" if index + 1 < len(parts) and parts[index + 1] != "*" else None
+
+
+def route_matches(test_route: str, app_route: str) -> bool:
+    # Динамические сегменты: {project_id} в f-строке теста, [id] в каталоге app
+    test_parts = [p for p in test_route.split("?")[0].split("/") if p]
+    app_parts = [p for p in app_route.split("/") if p]
+    if len(test_parts) != len(app_parts):
+        return False
+    return all(t == a or t == "{}" or a.startswith("[") for t, a in zip(test_parts, app_parts))
+
+
+# --- клиент ---
+
+def _resolve_ts(source: Path, spec: str, root: Path):
+    if spec.startswith("@/"):
+        base = root / CLIENT_SRC / spec[2:]
+    elif spec.startswith("."):
+        base = source.parent / spec
+    else:
+        return None
+    for extension in TS_EXTENSIONS:
+        candidate = Path(f"{base}{extension}").resolve()
+        if candidate.is_file():
+            return candidate.relative_to(root).as_posix()
+    return None
+
+
+def client_importers(root: Path = ROOT) -> dict:
+    importers = defaultdict(set)
+    for path in (root / CLIENT_SRC).rglob("*"):
+        if path.suffix not in (".ts", ".tsx", ".js", ".jsx"):
+            continue
+        for match in TS_IMPORT.finditer(path.read_text(encoding="utf-8", errors="replace")):
+            target = _resolve_ts(path, match.group(1) or match.group(2), root)
+            if target:
+                importers[target].add(path.relative_to(root).as_posix())
+    return importers
+
+
+def app_route(page_file: str) -> str:
+    relative = PurePosixPath(page_file).parent.relative_to(CLIENT_APP).as_posix()
+    return "/" if relative == "." else f"/{relative}"
+
+
+def client_routes(path: str, importers: dict):
+    """Маршруты, которые отрисовывают файл клиента; None — файл общий для всех страниц (layout)."""
+    routes, seen, stack = set(), {path}, [path]
+    while stack:
+        current = stack.pop()
+        name = PurePosixPath(current).name
+        if name.startswith("layout."):
+            return None
+        # Страница — граница обхода: то, что её импортирует (DashboardWrapper -> authentication/page),
+        # рисует её на своём месте, но сама она относится к своему маршруту
+        if name.startswith("page.") and current.startswith(CLIENT_APP):
+            routes.add(app_route(current))
+            continue
+        for importer in importers.get(current, ()):
+            if importer not in seen:
+                seen.add(importer)
+                stack.append(importer)
+    return routes
+
+
+# --- сервер ---
+
+def server_areas(path: str, root: Path = ROOT):
+    """Префиксы API, которые обслуживает файл сервера; None — файл общий (index.ts, middleware, prisma)."""
+    index = (root / SERVER_SRC / "index.ts").read_text(encoding="utf-8")
+    routers = {name: spec for name, spec in DEFAULT_IMPORT.findall(index)}
+    mounts = defaultdict(set)
+    for prefix, name in APP_USE.findall(index):
+        if name in routers:
+            router_file = _resolve_ts(root / SERVER_SRC / "index.ts", routers[name], root)
+            mounts[router_file].add("/" + prefix.strip("/"))
+    if path in mounts:
+        return mounts[path]
+    if PurePosixPath(path).parent.as_posix() == f"{SERVER_SRC}/controllers":
+        # Контроллер -> роутеры, которые его импортируют
+        areas = set()
+        for router_file, prefixes in mounts.items():
+            source = root / router_file
+            for match in TS_IMPORT.finditer(source.read_text(encoding="utf-8")):
+                if _resolve_ts(source, match.group(1) or match.group(2) or "", root) == path:
+                    areas |= prefixes
+        return areas
+    return None
+
+
+# --- тесты и страницы ---
+
+def _is_base_url(node) -> bool:
+    return (isinstance(node, ast.Name) and node.id == "BASE_URL") or \
+           (isinstance(node, ast.Attribute) and node.attr == "BASE_URL")
+
+
+def url_routes(tree) -> set:
+    """Маршруты из f"{...BASE_URL}/members" и присваиваний self.url = BASE_URL."""
+    routes = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.JoinedStr):
+            values = node.values
+            for i, value in enumerate(values):
+                if isinstance(value, ast.FormattedValue) and _is_base_url(value.value):
+                    tail = "".join(v.value if isinstance(v, ast.Constant) else "{}" for v in values[i + 1:])
+                    routes.add(re.sub(r"\{\}[^/]*|[^/]*\{\}", "{}", tail) or "/")
+                    break
+        elif isinstance(node, ast.Assign) and _is_base_url(node.value):
+            routes.add("/")
+    return routes
+
+
+def _module_name(path: str) -> str:
+    return PurePosixPath(path).with_suffix("").as_posix().replace("/", ".")
+
+
+def python_imports(root: Path = ROOT) -> dict:
+    # Модуль -> модули репозитория, которые он импортирует
+    files = {_module_name(p.relative_to(root).as_posix()): p.relative_to(root).as_posix()
+             for p in root.rglob("*.py") if not {"client", "server", ".venv", "venv"} & set(p.parts)}
+    imports = defaultdict(set)
+    for name, path in files.items():
+        tree = ast.parse((root / path).read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                targets = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                targets = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+            else:
+                continue
+            imports[path] |= {files[t] for t in targets if t in files}
+    return imports
+
+
+class PageIndex:
+    """Классы страниц из pages/: собственные маршруты (self.url) и префиксы API из READY_RESPONSES."""
+
+    def __init__(self, root: Path = ROOT):
+        self.routes = {}
+        self.areas = {}
+        self.modules = defaultdict(set)
+        ready = {}
+        bases = {}
+        # Только sync-страницы: имена классов в pages/aio те же, их изменения _select_python ведёт по импортам
+        for path in sorted((root / PAGES_DIR).glob("*.py")):
+            module = path.relative_to(root).as_posix()
+            for node in ast.parse(path.read_text(encoding="utf-8")).body:
+                if not isinstance(node, ast.ClassDef):
+                    continue
+                self.modules[module].add(node.name)
+                bases[node.name] = [b.id for b in node.bases if isinstance(b, ast.Name)]
+                own_url = [n for n in ast.walk(node) if isinstance(n, ast.Assign)
+                           and any(isinstance(t, ast.Attribute) and t.attr == "url" for t in n.targets)]
+                self.routes[node.name] = set().union(*(url_routes(n) for n in own_url)) if own_url else set()
+                for item in node.body:
+                    if isinstance(item, ast.Assign) and any(getattr(t, "id", None) == "READY_RESPONSES" for t in item.targets):
+                        ready[node.name] = item.value
+
+        def ready_patterns(name, seen=()):
+            # READY_RESPONSES задаётся в классе, ссылкой на другой класс или наследуется (классы *Locators)
+            value = ready.get(name)
+            if isinstance(value, ast.Attribute) and isinstance(value.value, ast.Name):
+                return ready_patterns(value.value.id, seen + (name,))
+            if value is not None:
+                return [e.value for e in getattr(value, "elts", []) if isinstance(e, ast.Constant)]
+            for base in bases.get(name, ()):
+                if base not in seen:
+                    patterns = ready_patterns(base, seen + (name,))
+                    if patterns:
+                        return patterns
+            return []
+
+        for name in bases:
+            self.areas[name] = {area for area in map(api_area, ready_patterns(name)) if area}
+
+
+class TestIndex:
+    """Тестовые функции: маршруты, классы страниц (с учётом фикстур модуля), префиксы API из HAR
+    и модули репозитория, имена из которых тест использует."""
+
+    def __init__(self, pages: PageIndex, root: Path = ROOT, har_dir: Path = DEFAULT_HAR_DIR):
+        self.routes = defaultdict(set)
+        self.pages = defaultdict(set)
+        self.areas = defaultdict(set)
+        self.modules = defaultdict(set)
+        self.imports = defaultdict(set)
+        # Как pytest (testpaths = tests, python_files = test_*.py): во всех подкаталогах, включая tests/unit
+        for path in sorted((root / TESTS_DIR).rglob("test_*.py")):
+            module = path.relative_to(root).as_posix()
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+            functions = {n.name: n for n in tree.body if isinstance(n, ast.FunctionDef)}
+            # Имя в модуле теста -> файл, из которого оно импортировано (from pages.aio.x import Y as Z)
+            imported = {}
+            for node in tree.body:
+                if isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                    source = f"{node.module.replace('.', '/')}.py"
+                    if (root / source).is_file():
+                        imported.update({alias.asname or alias.name: source for alias in node.names})
+            for name, node in functions.items():
+                if not name.startswith("test_"):
+                    continue
+                nodeid = f"{module}::{name}"
+                self.modules[module].add(nodeid)
+                # Фикстуры модуля, которые тест запрашивает (транзитивно)
+                bodies, stack = [], [node]
+                while stack:
+                    current = stack.pop()
+                    bodies.append(current)
+                    stack.extend(functions[a.arg] for a in current.args.args
+                                 if a.arg in functions and functions[a.arg] not in bodies)
+                for body in bodies:
+                    for arg in body.args.args:
+                        self.areas[nodeid] |= FIXTURE_API.get(arg.arg, set())
+                    self.routes[nodeid] |= url_routes(body)
+                    names = {n.id for n in ast.walk(body) if isinstance(n, ast.Name)}
+                    self.pages[nodeid] |= names & pages.routes.keys()
+                    self.imports[nodeid] |= {imported[name] for name in names & imported.keys()}
+                for page in self.pages[nodeid]:
+                    self.routes[nodeid] |= pages.routes[page]
+                # Переход на маршрут (в т.ч. кликом по меню) загружает API страницы, которой он принадлежит
+                for page, page_routes in pages.routes.items():
+                    if page in self.pages[nodeid] or any(route_matches(r, p) for r in self.routes[nodeid] for p in page_routes):
+                        self.areas[nodeid] |= pages.areas.get(page, set())
+        index = HarIndex(har_dir)
+        for name, entry in index.load().items():
+            nodeid = entry["nodeid"].split("[")[0]
+            try:
+                har = json.loads((index.har_dir / name).read_text(encoding="utf-8"))
+            except (FileNotFoundError, ValueError):
+                continue
+            self.areas[nodeid] |= {area for area in (api_area(e["request"]["url"]) for e in har["log"]["entries"]) if area}
+
+
+def select_tests(paths: list, root: Path = ROOT, har_dir: Path = DEFAULT_HAR_DIR) -> Selection:
+    selection = Selection()
+    pages = PageIndex(root)
+    tests = TestIndex(pages, root, har_dir)
+    importers = None
+    reverse_python = None
+    for path in paths:
+        suffix = PurePosixPath(path).suffix
+        if path in IGNORED_FILES or (suffix in IGNORED_SUFFIXES and path not in GLOBAL_FILES):
+            continue
+        if path in GLOBAL_FILES:
+            selection.select_all(f"{path}: конфигурация запуска")
+        elif path.startswith(f"{CLIENT_SRC}/"):
+            importers = importers if importers is not None else client_importers(root)
+            routes = client_routes(path, importers)
+            if routes is None:
+                selection.select_all(f"{path}: общий для всех страниц клиента")
+            for route in routes or ():
+                for nodeid, test_routes in tests.routes.items():
+                    if any(route_matches(r, route) for r in test_routes):
+                        selection.select(nodeid, f"{path} -> {route}")
+        elif path.startswith(f"{SERVER_SRC}/"):
+            areas = server_areas(path, root)
+            if areas is None or areas & GLOBAL_API:
+                selection.select_all(f"{path}: общий код сервера или авторизация")
+            for area in areas or ():
+                for nodeid, test_areas in tests.areas.items():
+                    if area in test_areas:
+                        selection.select(nodeid, f"{path} -> {area}")
+        elif path.startswith(f"{TESTS_DIR}/har/"):
+            entry = HarIndex(har_dir).get(root / path) if (root / path).suffix == ".har" else None
+            if entry:
+                selection.select(entry["nodeid"].split("[")[0], f"{path}: HAR теста")
+        elif suffix == ".py":
+            if reverse_python is None:
+                reverse_python = defaultdict(set)
+                for module, targets in python_imports(root).items():
+                    for target in targets:
+                        reverse_python[target].add(module)
+            _select_python(path, reverse_python, pages, tests, selection)
+        elif path.startswith(("client/", "server/")):
+            # package.json, next.config.ts, prisma и прочая сборка
+            selection.select_all(f"{path}: сборка клиента или сервера")
+        if selection.full:
+            break
+    return selection
+
+
+def _select_python(path: str, reverse: dict, pages: PageIndex, tests: TestIndex, selection: Selection):
+    affected, stack = {path}, [path]
+    while stack:
+        current = stack.pop()
+        for importer in reverse.get(current, ()):
+            # conftest импортирует страницы для входа, но это не делает их изменения глобальными:
+            # от модуля страницы идём только к другим страницам
+            if current.startswith(f"{PAGES_DIR}/") and not importer.startswith(f"{PAGES_DIR}/"):
+                # Async-страниц нет в PageIndex (имена классов совпадают с sync), поэтому от них идём дальше:
+                # в тестовом модуле — к тестам, которые используют их классы, в utils — к модулю целиком
+                if not current.startswith(f"{AIO_PAGES_DIR}/") or importer in GLOBAL_FILES:
+                    continue
+                if importer in tests.modules:
+                    for nodeid in tests.modules[importer]:
+                        if current in tests.imports[nodeid]:
+                            selection.select(nodeid, f"{path} -> {current}")
+                    continue
+            if importer not in affected:
+                affected.add(importer)
+                stack.append(importer)
+    for module in affected:
+        if module in GLOBAL_FILES:
+            selection.select_all(f"{path}: используется в {module}")
+            return
+        for nodeid in tests.modules.get(module, ()):
+            selection.select(nodeid, f"{path} -> {module}")
+        changed_pages = pages.modules.get(module, set())
+        for nodeid, used in tests.pages.items():
+            for page in used & changed_pages:
+                selection.select(nodeid, f"{path} -> {page}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m utils.impact", description="Тесты, затронутые изменениями")
+    parser.add_argument("--base", default="main", help="Ветка или коммит, с которым сравнивать (git merge-base)")
+    parser.add_argument("--files", nargs="*", help="Список изменённых файлов вместо git diff")
+    parser.add_argument("--har-dir", type=Path, default=DEFAULT_HAR_DIR)
+    parser.add_argument("--explain", action="store_true", help="Показать, почему выбран каждый тест")
+    parser.add_argument("--run", action="store_true", help="Сразу запустить pytest с выбранными тестами")
+    args, pytest_args = parser.parse_known_args(argv)
+    paths = args.files if args.files is not None else changed_files(args.base)
+    selection = select_tests(paths, ROOT, args.har_dir)
+    if args.explain:
+        for nodeid, reasons in sorted(selection.reasons.items()):
+            print(nodeid, file=sys.stderr)
+            for reason in sorted(reasons):
+                print(f"    {reason}", file=sys.stderr)
+        print(f"Изменено файлов: {len(paths)}, выбрано: "
+              f"{'все тесты' if selection.full else len(selection.nodeids)}", file=sys.stderr)
+    if not selection.nodeids:
+        print("Затронутых тестов нет", file=sys.stderr)
+        return 0
+    if args.run:
+        return subprocess.call([sys.executable, "-m", "pytest", *pytest_args, *selection.nodeids], cwd=ROOT)
+    print(" ".join(selection.nodeids))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+# utils/instrumentation.py
+import functools
+import inspect
+import time
+import allure
+from utils import diagnostics
+from utils.logger import logger
+
+# Замеры действий страниц в текущем процессе: (класс страницы, метод, длительность в секундах, успех)
+action_timings = []
+_listeners = []
+
+
+def add_timing_listener(listener):
+    _listeners.append(listener)
+
+
+def remove_timing_listener(listener):
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def _record(page_class: str, action: str, duration: float, ok: bool):
+    action_timings.append((page_class, action, duration, ok))
+    for listener in _listeners:
+        listener(page_class, action, duration, ok)
+
+
+def capture_failure(page, name: str):
+    recorder = diagnostics.current()
+    if recorder is not None:
+        recorder.capture_page(page, name)
+        return
+    try:
+        allure.attach(page.content(), name=f"{name}.html", attachment_type=allure.attachment_type.HTML)
+        allure.attach(page.screenshot(), name=f"{name}.png", attachment_type=allure.attachment_type.PNG)
+    except Exception as e:
+        logger.warning(f"Не удалось снять артефакты ошибки {name}: {e}")
+
+
+async def capture_failure_async(page, name: str):
+    # Для страниц async_api: page.content() и page.screenshot() — корутины
+    recorder = diagnostics.current()
+    try:
+        content, screenshot = await page.content(), await page.screenshot()
+    except Exception as e:
+        logger.warning(f"Не удалось снять артефакты ошибки {name}: {e}")
+        return
+    if recorder is not None:
+        recorder.attach(screenshot, f"{name}.png", allure.attachment_type.PNG)
+        recorder.attach(content, f"{name}.html", allure.attachment_type.HTML)
+    else:
+        allure.attach(content, name=f"{name}.html", attachment_type=allure.attachment_type.HTML)
+        allure.attach(screenshot, name=f"{name}.png", attachment_type=allure.attachment_type.PNG)
+
+
+def _mark_captured(e: Exception):
+    try:
+        e.artifacts_captured = True
+    except AttributeError:
+        pass
+
+
+def page_action(func):
+    """Замеряет длительность метода страницы и при ошибке один раз снимает артефакты.
+
+    Исключение помечается после снятия артефактов, поэтому внешние
+    декорированные методы и обработчик падения теста их не дублируют.
+    Ставится над @allure.step: allure берёт параметры шага из сигнатуры
+    функции и не видит её сквозь обёртку. Корутины (страницы pages/aio)
+    оборачиваются асинхронной обёрткой с тем же поведением.
+    """
+    if inspect.iscoroutinefunction(func):
+        return _async_page_action(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        page_class = type(self).__name__
+        started = time.perf_counter()
+        ok = False
+        try:
+            result = func(self, *args, **kwargs)
+            ok = True
+            return result
+        except Exception as e:
+            if not getattr(e, "artifacts_captured", False):
+                logger.error(f"{page_class}.{func.__name__} завершился с ошибкой: {e}")
+                capture_failure(self.page, f"{func.__name__}_error")
+                _mark_captured(e)
+            raise
+        finally:
+            _record(page_class, func.__name__, time.perf_counter() - started, ok)
+    return wrapper
+
+
+def _async_page_action(func):
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        page_class = type(self).__name__
+        started = time.perf_counter()
+        ok = False
+        try:
+            result = await func(self, *args, **kwargs)
+            ok = True
+            return result
+        except Exception as e:
+            if not getattr(e, "artifacts_captured", False):
+                logger.error(f"{getattr(self, 'log_prefix', '')}{page_class}.{func.__name__} завершился с ошибкой: {e}")
+                await capture_failure_async(self.page, f"{func.__name__}_error")
+                _mark_captured(e)
+            raise
+        finally:
+            _record(page_class, func.__name__, time.perf_counter() - started, ok)
+    return wrapper
@@ -1,9 +1,118 @@
+# utils/logger.py
+# Логирование без блокировки тестов на вводе-выводе:
+# - logger пишет в QueueHandler, консоль и JSON-файл обслуживает QueueListener в фоновом потоке;
+# - каждая запись помечается id теста и воркера xdist;
+# - записи текущего теста копятся в кольцевом буфере в памяти и выгружаются целиком, только если тест упал.
+# Уровни: LOG_LEVEL (по умолчанию INFO), LOG_CONSOLE_LEVEL (INFO, у воркеров xdist — WARNING).
+import atexit
+import json
 import logging
+import os
+import queue
+from collections import deque
+from logging.handlers import QueueHandler, QueueListener
+from utils.workers import get_worker_id, is_parallel
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[logging.StreamHandler()]
-)
+CONSOLE_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+RING_BUFFER_SIZE = int(os.getenv("LOG_RING_BUFFER", 2000))
 
-logger = logging.getLogger(__name__)
\ No newline at end of file
+_test_id = None
+
+
+def set_test_id(test_id):
+    global _test_id
+    _test_id = test_id
+
+
+class ContextFilter(logging.Filter):
+    # Поля проставляются в потоке, который пишет лог: в фоновом потоке текущий тест уже может смениться
+    def filter(self, record):
+        record.test_id = _test_id
+        record.worker = get_worker_id()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        data = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "test": getattr(record, "test_id", None),
+            "worker": getattr(record, "worker", None),
+        }
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc"] = record.exc_text
+        return json.dumps(data, ensure_ascii=False)
+
+
+class RingBufferHandler(logging.Handler):
+    """Последние записи в памяти; запись — только append в deque, без форматирования и ввода-вывода."""
+
+    def __init__(self, capacity: int = RING_BUFFER_SIZE):
+        super().__init__(level=logging.DEBUG)
+        self.records = deque(maxlen=capacity)
+        self.dropped = 0
+
+    def emit(self, record):
+        if len(self.records) == self.records.maxlen:
+            self.dropped += 1
+        self.records.append(record)
+
+    def clear(self):
+        self.records.clear()
+        self.dropped = 0
+
+    def dump(self) -> str:
+        formatter = JsonFormatter()
+        lines = [formatter.format(record) for record in list(self.records)]
+        if self.dropped:
+            lines.insert(0, json.dumps({"dropped": self.dropped, "capacity": self.records.maxlen}))
+        return "\n".join(lines)
+
+
+def _console_level() -> str:
+    return os.getenv("LOG_CONSOLE_LEVEL", "WARNING" if is_parallel() else "INFO")
+
+
+_queue = queue.SimpleQueue()
+_console = logging.StreamHandler()
+_console.setLevel(_console_level())
+_console.setFormatter(logging.Formatter(CONSOLE_FORMAT))
+_listener = QueueListener(_queue, _console, respect_handler_level=True)
+_listener.start()
+atexit.register(_listener.stop)
+
+ring_buffer = RingBufferHandler()
+
+logger = logging.getLogger(__name__)
+logger.setLevel(os.getenv("LOG_LEVEL", "INFO"))
+# propagate не отключаем: через корневой логгер записи видят caplog и --log-cli-level
+logger.addFilter(ContextFilter())
+logger.addHandler(QueueHandler(_queue))
+logger.addHandler(ring_buffer)
+
+
+def add_json_file(path) -> logging.Handler:
+    """Добавляет JSONL-файл к фоновому писателю (вызывается из pytest_configure)."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    handler = logging.FileHandler(path, mode="w", encoding="utf-8")
+    handler.setFormatter(JsonFormatter())
+    # Набор обработчиков QueueListener меняется только на остановленном слушателе
+    _listener.stop()
+    _listener.handlers = _listener.handlers + (handler,)
+    _listener.start()
+    return handler
+
+
+def start_test(test_id: str):
+    set_test_id(test_id)
+    ring_buffer.clear()
+
+
+def current_test_log() -> str:
+    """Записи текущего теста в JSONL — для выгрузки при падении."""
+    return ring_buffer.dump()
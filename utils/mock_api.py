@@ -0,0 +1,656 @@
+# utils/mock_api.py
+# Лёгкая замена Express-сервера для UI-тестов: маршруты, которые вызывает клиент, данные в памяти.
+# Формы ответов повторяют контроллеры server/src/controllers и модели server/prisma/schema.prisma.
+# Запуск отдельно: python -m utils.mock_api --port 8000 --email test@mail.ru --password 1111
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import re
+import secrets
+import threading
+import time
+from datetime import datetime, timezone
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from utils.logger import logger
+from utils.task_graph import CycleError, TaskGraph
+
+ACCESS_TOKEN_TTL = 4 * 3600
+REFRESH_TOKEN_TTL = 7 * 24 * 3600
+ROLE_OWNER = "OWNER"
+ROLE_MEMBER = "MEMBER"
+USER_PUBLIC_FIELDS = ("userId", "username", "email", "profilePictureUrl")
+# Пользователь mock-сервера, если EMAIL/PASSWORD не заданы: для mock учётные данные не секретны
+DEFAULT_EMAIL = "mock.user@example.com"
+DEFAULT_PASSWORD = "MockPassword1"
+
+
+def _format(moment: datetime) -> str:
+    # Формат дат Prisma в JSON
+    return moment.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def _now() -> str:
+    return _format(datetime.now(timezone.utc))
+
+
+def _parse(value: str) -> datetime:
+    moment = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+
+
+def _date(value):
+    return _format(_parse(value)) if value else None
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _unb64(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class MockError(Exception):
+    def __init__(self, status: int, body: dict):
+        super().__init__(body)
+        self.status = status
+        self.body = body
+
+
+class MockStore:
+    """Данные в памяти и логика контроллеров. Все операции под одной блокировкой."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.access_secret = secrets.token_bytes(32)
+        self.refresh_secret = secrets.token_bytes(32)
+        self.users = {}
+        self.teams = {}
+        self.team_members = {}
+        self.projects = {}
+        self.tasks = {}
+        self.dependencies = {}
+        self.assignments = {}
+        self._ids = {}
+
+    def _next_id(self, table: str) -> int:
+        self._ids[table] = self._ids.get(table, 0) + 1
+        return self._ids[table]
+
+    # Токены в формате JWT (HS256), чтобы TokenCache мог прочитать claim exp
+    def issue_token(self, user_id: int, refresh: bool = False) -> str:
+        now = int(time.time())
+        ttl, secret = (REFRESH_TOKEN_TTL, self.refresh_secret) if refresh else (ACCESS_TOKEN_TTL, self.access_secret)
+        header = _b64(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+        payload = _b64(json.dumps({"userId": str(user_id), "iat": now, "exp": now + ttl}).encode())
+        signature = _b64(hmac.new(secret, f"{header}.{payload}".encode(), hashlib.sha256).digest())
+        return f"{header}.{payload}.{signature}"
+
+    def verify_token(self, token: str, refresh: bool = False):
+        try:
+            header, payload, signature = token.split(".")
+            secret = self.refresh_secret if refresh else self.access_secret
+            expected = _b64(hmac.new(secret, f"{header}.{payload}".encode(), hashlib.sha256).digest())
+            if not hmac.compare_digest(signature, expected):
+                return None
+            claims = json.loads(_unb64(payload))
+        except (ValueError, AttributeError):
+            return None
+        if claims.get("exp", 0) < time.time():
+            return None
+        return int(claims["userId"])
+
+    @staticmethod
+    def _hash_password(password: str) -> str:
+        return hashlib.sha256(password.encode()).hexdigest()
+
+    def _public_user(self, user_id: int) -> dict:
+        user = self.users[user_id]
+        return {field: user[field] for field in USER_PUBLIC_FIELDS}
+
+    def _member_with_user(self, member: dict) -> dict:
+        return {**member, "user": self._public_user(member["userId"])}
+
+    def _is_member(self, team_id: int, user_id: int, role: str = None) -> bool:
+        return any(m["teamId"] == team_id and m["userId"] == user_id and (role is None or m["role"] == role)
+                   for m in self.team_members.values())
+
+    def _find_member(self, team_id: int, user_id: int):
+        return next((m for m in self.team_members.values() if m["teamId"] == team_id and m["userId"] == user_id), None)
+
+    # Пользователи и авторизация
+    def add_user(self, email: str, password: str, username: str = None) -> dict:
+        if not email or "@" not in email or not password:
+            raise ValueError(f"Для пользователя mock API нужны email и пароль, получено email={email!r}")
+        with self.lock:
+            if any(u["email"] == email for u in self.users.values()):
+                raise MockError(400, {"error": "User already exists"})
+            user_id = self._next_id("users")
+            now = _now()
+            self.users[user_id] = {
+                "userId": user_id,
+                "email": email,
+                "username": username or email.split("@")[0],
+                "password": self._hash_password(password),
+                "googleId": None,
+                "profilePictureUrl": "https://avatar.iran.liara.run/public",
+                "createdAt": now,
+                "updatedAt": now,
+            }
+            return self.users[user_id]
+
+    def login(self, email: str, password: str) -> dict:
+        if not email or not password:
+            raise MockError(400, {"error": "Email and password are required"})
+        with self.lock:
+            user = next((u for u in self.users.values() if u["email"] == email), None)
+            if user is None or user["password"] != self._hash_password(password):
+                raise MockError(401, {"error": "Invalid credentials"})
+            return user
+
+    def get_users(self) -> list:
+        with self.lock:
+            return list(self.users.values())
+
+    def get_user(self, user_id: int):
+        with self.lock:
+            if user_id not in self.users:
+                raise MockError(404, {"message": "User not found"})
+            return self.users[user_id]
+
+    # Проекты
+    def get_projects(self, user_id: int) -> list:
+        with self.lock:
+            return [p for p in self.projects.values() if self._is_member(p["teamId"], user_id)]
+
+    def create_project(self, user_id: int, body: dict) -> dict:
+        with self.lock:
+            if user_id not in self.users:
+                raise MockError(404, {"message": "User not found"})
+            now = _now()
+            team_id = self._next_id("teams")
+            self.teams[team_id] = {"id": team_id, "teamName": f"{body.get('name')} Team", "createdAt": now, "updatedAt": now}
+            member_id = self._next_id("team_members")
+            self.team_members[member_id] = {"id": member_id, "userId": user_id, "teamId": team_id,
+                                            "role": body.get("role", ROLE_OWNER), "joinedAt": now}
+            project_id = self._next_id("projects")
+            self.projects[project_id] = {
+                "id": project_id,
+                "name": body.get("name"),
+                "description": body.get("description"),
+                "startDate": _date(body.get("startDate")),
+                "endDate": _date(body.get("endDate")),
+                "status": body.get("status", "PLANNING"),
+                "createdAt": now,
+                "updatedAt": now,
+                "teamId": team_id,
+            }
+            return self.projects[project_id]
+
+    def get_project(self, project_id: int):
+        with self.lock:
+            return self.projects.get(project_id)
+
+    def delete_project(self, project_id: int):
+        with self.lock:
+            if self.projects.pop(project_id, None) is None:
+                raise MockError(500, {"message": "error deleting project", "error": "Record to delete does not exist."})
+            for task_id in [t["id"] for t in self.tasks.values() if t["projectId"] == project_id]:
+                self._delete_task(task_id)
+
+    def get_project_dependencies(self, project_id: int) -> list:
+        with self.lock:
+            task_ids = {t["id"] for t in self.tasks.values() if t["projectId"] == project_id}
+            return [d for d in self.dependencies.values()
+                    if d["dependentTaskId"] in task_ids and d["prerequisiteTaskId"] in task_ids]
+
+    def get_project_team(self, project_id: int, user_id: int) -> list:
+        with self.lock:
+            project = self.projects.get(project_id)
+            if project is None:
+                raise MockError(404, {"error": "Project not found"})
+            if not self._is_member(project["teamId"], user_id):
+                raise MockError(403, {"error": "You must be a team member to view this information"})
+            return [self._member_with_user(m) for m in self.team_members.values() if m["teamId"] == project["teamId"]]
+
+    # Задачи
+    def get_tasks(self, project_id: int) -> list:
+        with self.lock:
+            return [t for t in self.tasks.values() if t["projectId"] == project_id]
+
+    def get_user_tasks(self, user_id: int) -> list:
+        with self.lock:
+            return [self.tasks[a["taskId"]] for a in self.assignments.values() if a["userId"] == user_id]
+
+    def create_task(self, user_id: int, body: dict) -> dict:
+        required = ("title", "description", "status", "priority", "tags", "startDate", "dueDate", "points", "projectId")
+        if not all(body.get(field) for field in required):
+            raise MockError(400, {"error": "All fields are required."})
+        with self.lock:
+            start, due = _parse(body["startDate"]), _parse(body["dueDate"])
+            seconds = (due - start).total_seconds()
+            now = _now()
+            task_id = self._next_id("tasks")
+            self.tasks[task_id] = {
+                "id": task_id,
+                "title": body["title"],
+                "description": body["description"],
+                "status": body["status"],
+                "priority": body["priority"],
+                "tags": body["tags"],
+                "startDate": _format(start),
+                "dueDate": _format(due),
+                "points": int(body["points"]),
+                "projectId": int(body["projectId"]),
+                "authorUserId": user_id,
+                "assignedUserId": None,
+                "createdAt": now,
+                "updatedAt": now,
+                "degree": None,
+                "duration": -int(-seconds // 86400),
+            }
+            for prerequisite_id in body.get("dependencies") or ():
+                dependency_id = self._next_id("dependencies")
+                self.dependencies[dependency_id] = {"id": dependency_id, "dependentTaskId": task_id,
+                                                    "prerequisiteTaskId": int(prerequisite_id), "createdAt": now}
+            task = dict(self.tasks[task_id])
+            # Сервер отвечает до пересчёта рангов, поэтому degree в ответе ещё пустой
+            self._recalculate_ranks(task["projectId"])
+            return task
+
+    def _recalculate_ranks(self, project_id: int):
+        # Как calculateTaskRanks в taskController.ts: degree пересчитывается у всех задач проекта
+        tasks = self.get_tasks(project_id)
+        try:
+            ranks = TaskGraph.from_api(tasks, self.get_project_dependencies(project_id)).ranks()
+        except CycleError as e:
+            logger.warning(f"Ранги задач проекта {project_id} не обновлены: {e}")
+            return
+        for task in tasks:
+            task["degree"] = ranks[task["id"]]
+
+    def update_task_status(self, task_id: int, status: str) -> dict:
+        with self.lock:
+            if task_id not in self.tasks:
+                raise MockError(500, {"message": "error updating task status"})
+            self.tasks[task_id].update(status=status, updatedAt=_now())
+            return self.tasks[task_id]
+
+    def delete_task(self, task_id: int):
+        with self.lock:
+            if task_id not in self.tasks:
+                raise MockError(500, {"message": "error deleting task", "error": "Record to delete does not exist."})
+            self._delete_task(task_id)
+
+    def _delete_task(self, task_id: int):
+        del self.tasks[task_id]
+        for table in (self.dependencies, self.assignments):
+            for key in [k for k, v in table.items()
+                        if task_id in (v.get("taskId"), v.get("dependentTaskId"), v.get("prerequisiteTaskId"))]:
+                del table[key]
+
+    def assign_task(self, body: dict) -> dict:
+        with self.lock:
+            task_id, user_id = int(body.get("taskId", 0)), int(body.get("userId", 0))
+            if task_id not in self.tasks:
+                raise MockError(404, {"error": "Task not found"})
+            if user_id not in self.users:
+                raise MockError(404, {"error": "User not found"})
+            if any(a["taskId"] == task_id and a["userId"] == user_id for a in self.assignments.values()):
+                raise MockError(400, {"error": "User already assigned to task"})
+            assignment_id = self._next_id("assignments")
+            self.assignments[assignment_id] = {"id": assignment_id, "userId": user_id, "taskId": task_id}
+            self.tasks[task_id]["assignedUserId"] = user_id
+            return {**self.assignments[assignment_id], "user": self.users[user_id], "task": self.tasks[task_id]}
+
+    def unassign_task(self, task_id: int, user_id: int):
+        with self.lock:
+            if task_id not in self.tasks:
+                raise MockError(500, {"error": "Failed to remove assignment"})
+            for key in [k for k, a in self.assignments.items() if a["taskId"] == task_id and a["userId"] == user_id]:
+                del self.assignments[key]
+            self.tasks[task_id]["assignedUserId"] = None
+
+    def get_task_assignees(self, task_id: int) -> list:
+        with self.lock:
+            return [{**a, "user": self._public_user(a["userId"])} for a in self.assignments.values() if a["taskId"] == task_id]
+
+    # Команды
+    def get_teams(self, user_id: int) -> list:
+        with self.lock:
+            return [{
+                **team,
+                "members": [self._member_with_user(m) for m in self.team_members.values() if m["teamId"] == team["id"]],
+                "projects": [{"id": p["id"], "name": p["name"], "status": p["status"]}
+                             for p in self.projects.values() if p["teamId"] == team["id"]],
+            } for team in self.teams.values() if self._is_member(team["id"], user_id)]
+
+    def add_team_member(self, requester_id: int, body: dict) -> dict:
+        with self.lock:
+            team_id, user_id = int(body.get("teamId", 0)), int(body.get("userId", 0))
+            if not self._is_member(team_id, requester_id, ROLE_OWNER):
+                raise MockError(403, {"error": "Only team admins can add members"})
+            if self._find_member(team_id, user_id):
+                raise MockError(409, {"error": "User is already a team member"})
+            if user_id not in self.users:
+                raise MockError(500, {"error": "Failed to add team member"})
+            member_id = self._next_id("team_members")
+            self.team_members[member_id] = {"id": member_id, "userId": user_id, "teamId": team_id,
+                                            "role": body.get("role", ROLE_MEMBER), "joinedAt": _now()}
+            return self._member_with_user(self.team_members[member_id])
+
+    def _check_last_owner(self, team_id: int, member: dict):
+        owners = sum(1 for m in self.team_members.values() if m["teamId"] == team_id and m["role"] == ROLE_OWNER)
+        if owners == 1 and member["role"] == ROLE_OWNER:
+            raise MockError(400, {"error": "Cannot remove the last admin from the team"})
+
+    def remove_team_member(self, requester_id: int, team_id: int, user_id: int):
+        with self.lock:
+            if not self._is_member(team_id, requester_id, ROLE_OWNER):
+                raise MockError(403, {"error": "Only team admins can remove members"})
+            member = self._find_member(team_id, user_id)
+            if member is None:
+                raise MockError(500, {"error": "Failed to remove team member"})
+            self._check_last_owner(team_id, member)
+            del self.team_members[member["id"]]
+
+    def update_team_member_role(self, requester_id: int, team_id: int, user_id: int, role: str) -> dict:
+        with self.lock:
+            if not self._is_member(team_id, requester_id, ROLE_OWNER):
+                raise MockError(403, {"error": "Only team admins can update member roles"})
+            member = self._find_member(team_id, user_id)
+            if member is None:
+                raise MockError(404, {"error": "Team member not found"})
+            if role != ROLE_OWNER:
+                self._check_last_owner(team_id, member)
+            member["role"] = role
+            return self._member_with_user(member)
+
+
+# Маршруты: (метод, шаблон пути, имя метода обработчика, нужна ли авторизация).
+# Порядок важен так же, как в Express: GET /api/tasks/:projectId перекрывает getTaskById
+ROUTES = [
+    ("GET", r"/(health)?", "health", False),
+    ("POST", r"/api/auth/signup", "signup", False),
+    ("POST", r"/api/auth/login", "login", False),
+    ("POST", r"/api/auth/logout", "logout", False),
+    ("GET", r"/api/refresh/token", "refresh", False),
+    ("GET", r"/api/projects/?", "get_projects", True),
+    ("POST", r"/api/projects/?", "create_project", True),
+    ("GET", r"/api/projects/(\d+)", "get_project", True),
+    ("DELETE", r"/api/projects/(\d+)", "delete_project", True),
+    ("GET", r"/api/projects/(\d+)/tasks/dependencies", "get_project_dependencies", True),
+    ("GET", r"/api/projects/(\d+)/team", "get_project_team", True),
+    ("GET", r"/api/tasks/?", "get_user_tasks", True),
+    ("POST", r"/api/tasks/assign/task", "assign_task", True),
+    ("GET", r"/api/tasks/(\d+)", "get_tasks", True),
+    ("POST", r"/api/tasks/(\d+)", "create_task", True),
+    ("PATCH", r"/api/tasks/(\d+)/status", "update_task_status", True),
+    ("DELETE", r"/api/tasks/(\d+)", "delete_task", True),
+    ("DELETE", r"/api/tasks/(\d+)/users/(\d+)", "unassign_task", True),
+    ("GET", r"/api/tasks/(\d+)/assignees", "get_task_assignees", True),
+    ("GET", r"/api/teams/?", "get_teams", True),
+    ("POST", r"/api/teams/members", "add_team_member", True),
+    ("DELETE", r"/api/teams/(\d+)/members/(\d+)", "remove_team_member", True),
+    ("PATCH", r"/api/teams/(\d+)/members/(\d+)/role", "update_team_member_role", True),
+    ("GET", r"/api/users/?", "get_users", True),
+    ("POST", r"/api/users/authenticated", "get_authenticated_user", False),
+]
+_COMPILED_ROUTES = [(method, re.compile(pattern + r"$"), name, protected) for method, pattern, name, protected in ROUTES]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "MockApi/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def store(self) -> MockStore:
+        return self.server.store
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self._cors_headers()
+        self.send_header("Access-Control-Allow-Methods", "GET,POST,PATCH,DELETE,OPTIONS")
+        self.send_header("Access-Control-Allow-Headers",
+                         self.headers.get("Access-Control-Request-Headers", "authorization,content-type"))
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        self._dispatch()
+
+    def do_POST(self):
+        self._dispatch()
+
+    def do_PATCH(self):
+        self._dispatch()
+
+    def do_DELETE(self):
+        self._dispatch()
+
+    def _cors_headers(self):
+        # Клиент отправляет запросы с credentials: include, поэтому origin указывается явно
+        self.send_header("Access-Control-Allow-Origin", self.headers.get("Origin", "*"))
+        self.send_header("Access-Control-Allow-Credentials", "true")
+        self.send_header("Vary", "Origin")
+
+    def _send(self, status: int, body=None, cookies=()):
+        payload = b"" if status == 204 else json.dumps(body).encode()
+        self.send_response(status)
+        self._cors_headers()
+        if payload:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        for cookie in cookies:
+            self.send_header("Set-Cookie", cookie)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length))
+        except ValueError:
+            return {}
+
+    def _cookie(self, name: str):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookie[name].value if name in cookie else None
+
+    def _dispatch(self):
+        path = self.path.split("?")[0]
+        for method, pattern, name, protected in _COMPILED_ROUTES:
+            match = pattern.match(path)
+            if method != self.command or not match:
+                continue
+            body = self._body()
+            try:
+                user_id = None
+                if protected:
+                    auth = self.headers.get("Authorization", "")
+                    token = auth.split(" ")[1] if " " in auth else None
+                    if not token:
+                        raise MockError(401, {"error": "No token provided"})
+                    user_id = self.store.verify_token(token)
+                    if user_id is None:
+                        raise MockError(403, {"error": "Invalid token"})
+                args = [int(group) for group in match.groups() if group and group.isdigit()]
+                result = getattr(self, f"route_{name}")(user_id, body, *args)
+            except MockError as e:
+                self._send(e.status, e.body)
+                return
+            except (KeyError, ValueError, TypeError) as e:
+                logger.error(f"Mock API: ошибка обработки {self.command} {path}: {e}")
+                self._send(500, {"message": "Internal server error", "error": str(e)})
+                return
+            if isinstance(result, tuple):
+                self._send(*result)
+            else:
+                self._send(200, result)
+            return
+        self._send(404, {"error": f"Cannot {self.command} {path}"})
+
+    # Обработчики маршрутов: возвращают тело ответа (200) или кортеж (статус, тело[, cookies])
+    def route_health(self, user_id, body):
+        return {"status": "ok"}
+
+    def route_signup(self, user_id, body):
+        user = self.store.add_user(body.get("email"), body.get("password", ""), body.get("username"))
+        return 201, {"user": {"id": user["userId"], "username": user["username"], "email": user["email"]},
+                     "token": self.store.issue_token(user["userId"])}
+
+    def route_login(self, user_id, body):
+        user = self.store.login(body.get("email"), body.get("password"))
+        refresh = self.store.issue_token(user["userId"], refresh=True)
+        cookie = (f"jwt={refresh}; Max-Age={REFRESH_TOKEN_TTL}; Path=/api/refresh; HttpOnly; Secure; SameSite=None")
+        return 200, {"user": user, "token": self.store.issue_token(user["userId"])}, [cookie]
+
+    def route_logout(self, user_id, body):
+        return 200, {"message": "Logged out"}, ["jwt=; Max-Age=0; Path=/"]
+
+    def route_refresh(self, user_id, body):
+        token = self._cookie("jwt")
+        if not token:
+            raise MockError(401, {"error": "Unauthorized access"})
+        refresh_user = self.store.verify_token(token, refresh=True)
+        if refresh_user is None:
+            raise MockError(403, {"error": "Forbidden"})
+        return {"accessToken": self.store.issue_token(refresh_user)}
+
+    def route_get_projects(self, user_id, body):
+        return self.store.get_projects(user_id)
+
+    def route_create_project(self, user_id, body):
+        return 201, {"message": "Project created successfully", "data": self.store.create_project(user_id, body)}
+
+    def route_get_project(self, user_id, body, project_id):
+        return self.store.get_project(project_id)
+
+    def route_delete_project(self, user_id, body, project_id):
+        self.store.delete_project(project_id)
+        return {"message": "project deleted successfully"}
+
+    def route_get_project_dependencies(self, user_id, body, project_id):
+        return self.store.get_project_dependencies(project_id)
+
+    def route_get_project_team(self, user_id, body, project_id):
+        return self.store.get_project_team(project_id, user_id)
+
+    def route_get_user_tasks(self, user_id, body):
+        return self.store.get_user_tasks(user_id)
+
+    def route_assign_task(self, user_id, body):
+        return 201, self.store.assign_task(body)
+
+    def route_get_tasks(self, user_id, body, project_id):
+        return self.store.get_tasks(project_id)
+
+    def route_create_task(self, user_id, body, project_id):
+        return 201, self.store.create_task(user_id, body)
+
+    def route_update_task_status(self, user_id, body, task_id):
+        return self.store.update_task_status(task_id, body.get("status"))
+
+    def route_delete_task(self, user_id, body, task_id):
+        self.store.delete_task(task_id)
+        return 204, None
+
+    def route_unassign_task(self, user_id, body, task_id, assignee_id):
+        self.store.unassign_task(task_id, assignee_id)
+        return {"message": "Assignment removed successfully"}
+
+    def route_get_task_assignees(self, user_id, body, task_id):
+        return self.store.get_task_assignees(task_id)
+
+    def route_get_teams(self, user_id, body):
+        return self.store.get_teams(user_id)
+
+    def route_add_team_member(self, user_id, body):
+        return 201, self.store.add_team_member(user_id, body)
+
+    def route_remove_team_member(self, user_id, body, team_id, member_id):
+        self.store.remove_team_member(user_id, team_id, member_id)
+        return {"message": "Team member removed successfully"}
+
+    def route_update_team_member_role(self, user_id, body, team_id, member_id):
+        return self.store.update_team_member_role(user_id, team_id, member_id, body.get("newRole"))
+
+    def route_get_users(self, user_id, body):
+        return self.store.get_users()
+
+    def route_get_authenticated_user(self, user_id, body):
+        token = self._cookie("jwt")
+        if not token:
+            raise MockError(401, {"message": "No token provided"})
+        cookie_user = self.store.verify_token(token)
+        if cookie_user is None:
+            raise MockError(401, {"message": "Unauthorized"})
+        return self.store.get_user(cookie_user)
+
+
+class MockApiServer:
+    """HTTP-сервер с MockStore в фоновом потоке. api_url указывается с префиксом /api, как API_URL."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, store: MockStore = None):
+        self.store = store or MockStore()
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.store = self.store
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.url}/api"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name="mock-api", daemon=True)
+        self._thread.start()
+        logger.info(f"Mock API запущен на {self.url}")
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        logger.info("Mock API остановлен")
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.mock_api", description="Mock API сервера приложения")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--email", default=DEFAULT_EMAIL, help="Пользователь, который создаётся при старте")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    args = parser.parse_args(argv)
+    server = MockApiServer(args.host, args.port)
+    server.store.add_user(args.email, args.password)
+    server.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# utils/network.py
+from playwright.sync_api import BrowserContext, Route
+from utils.logger import logger
+
+STATIC_ASSETS_PATTERN = "**/_next/static/**"
+ALL_REQUESTS_PATTERN = "**/*"
+
+# Кэш статики Next.js на всю сессию: url -> (status, headers, body).
+# Перехват запросов отключает HTTP-кэш браузера, поэтому кэшируем сами.
+_static_cache = {}
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+def static_cache_stats() -> dict:
+    return {**_cache_stats, "entries": len(_static_cache), "bytes": sum(len(body) for _, _, body in _static_cache.values())}
+
+
+class NetworkRouter:
+    """Маршрутизация запросов контекста: блокировка ненужных типов ресурсов
+    (image, font, media, ...) и отдача повторной статики _next/static из кэша."""
+
+    def __init__(self, block_resource_types=(), cache_static: bool = False):
+        self.block_resource_types = frozenset(block_resource_types)
+        self.cache_static = cache_static
+        self.blocked = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.block_resource_types) or self.cache_static
+
+    def install(self, context: BrowserContext):
+        if self.block_resource_types:
+            context.route(ALL_REQUESTS_PATTERN, self._block)
+        if self.cache_static:
+            # Маршрут, добавленный последним, срабатывает первым
+            context.route(STATIC_ASSETS_PATTERN, self._serve_static)
+        logger.info(f"Маршрутизация включена: блокировка={sorted(self.block_resource_types)}, кэш статики={self.cache_static}")
+
+    def uninstall(self, context: BrowserContext):
+        if self.cache_static:
+            context.unroute(STATIC_ASSETS_PATTERN, self._serve_static)
+        if self.block_resource_types:
+            context.unroute(ALL_REQUESTS_PATTERN, self._block)
+        if self.blocked:
+            logger.info(f"Заблокировано запросов: {self.blocked}")
+
+    def _block(self, route: Route):
+        if route.request.resource_type in self.block_resource_types:
+            self.blocked += 1
+            route.abort("blockedbyclient")
+            return
+        route.fallback()
+
+    def _serve_static(self, route: Route):
+        request = route.request
+        if request.method != "GET" or request.resource_type in self.block_resource_types:
+            route.fallback()
+            return
+        cached = _static_cache.get(request.url)
+        if cached:
+            _cache_stats["hits"] += 1
+            status, headers, body = cached
+            route.fulfill(status=status, headers=headers, body=body)
+            return
+        _cache_stats["misses"] += 1
+        response = route.fetch()
+        body = response.body()
+        if response.status == 200:
+            _static_cache[request.url] = (response.status, response.headers, body)
+        route.fulfill(response=response, body=body)
+
+
+def router_from_marker(marker, default_block=(), default_cache_static=False) -> NetworkRouter:
+    # @pytest.mark.network(block=["image", "font"], cache_static=True)
+    if marker is None:
+        return NetworkRouter(default_block, default_cache_static)
+    return NetworkRouter(
+        marker.kwargs.get("block", default_block),
+        marker.kwargs.get("cache_static", default_cache_static)
+    )
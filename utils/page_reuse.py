@@ -0,0 +1,55 @@
+# utils/page_reuse.py
+from playwright.sync_api import Browser, BrowserContext, Page
+from utils.logger import logger
+
+REUSE_MODES = ("off", "params")
+
+
+def reuse_key(nodeid: str) -> str:
+    # Параметризованные случаи одного теста различаются только суффиксом [id]
+    return nodeid.split("[", 1)[0]
+
+
+class SharedPage:
+    """Одна страница на все параметризованные случаи теста.
+
+    Пока случаи идут подряд, тест получает ту же страницу и сам сбрасывает форму
+    на месте (AuthenticationPage.reset). Контекст пересоздаётся при смене теста
+    и после упавшего случая: страница могла остаться в неизвестном состоянии.
+    """
+
+    def __init__(self, browser: Browser, **context_args):
+        self.browser = browser
+        self.context_args = context_args
+        self.key = None
+        self.context: BrowserContext = None
+        self.page: Page = None
+        self.dirty = False
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, key: str, setup=None) -> Page:
+        if key == self.key and not self.dirty and self.page is not None and not self.page.is_closed():
+            self.reused += 1
+            logger.info(f"Страница переиспользована для {key}")
+            return self.page
+        self.close()
+        self.context = self.browser.new_context(**self.context_args)
+        if setup is not None:
+            setup(self.context)
+        self.page = self.context.new_page()
+        self.key = key
+        self.dirty = False
+        self.created += 1
+        return self.page
+
+    def release(self, dirty: bool):
+        self.dirty = dirty
+
+    def close(self):
+        if self.context is not None:
+            try:
+                self.context.close()
+            except Exception as e:
+                logger.warning(f"Не удалось закрыть общий контекст: {e}")
+        self.key = self.context = self.page = None
@@ -0,0 +1,209 @@
+# utils/rank_engine.py
+# Инкрементальное обновление рангов задач (degree) при добавлении и удалении задач и зависимостей.
+# Сервер (createTask в taskController.ts) после каждой вставки пересчитывает ранги всего проекта
+# и пишет degree в каждую задачу; здесь пересчитываются только задачи ниже изменённого места,
+# а каждая операция возвращает лишь изменившиеся degree — то, что действительно нужно записать в БД.
+# Замер против полного пересчёта: python -m utils.rank_engine --tasks 10000 --edges 30000 --ops 500
+import argparse
+import heapq
+import random
+import time
+from utils.stats import summarize
+from utils.task_graph import CycleError, TaskGraph, random_dag
+
+
+class RankEngine:
+    def __init__(self, ids=(), edges=()):
+        self.successors = {task_id: set() for task_id in ids}
+        self.predecessors = {task_id: set() for task_id in self.successors}
+        for prerequisite, dependent in edges:
+            if prerequisite in self.successors and dependent in self.successors:
+                self.successors[prerequisite].add(dependent)
+                self.predecessors[dependent].add(prerequisite)
+        self.rank = TaskGraph(self.successors, self.edges()).ranks()
+
+    @classmethod
+    def from_api(cls, tasks: list, dependencies: list) -> "RankEngine":
+        return cls([task["id"] for task in tasks],
+                   ((d["prerequisiteTaskId"], d["dependentTaskId"]) for d in dependencies))
+
+    def __len__(self):
+        return len(self.rank)
+
+    def __contains__(self, task_id):
+        return task_id in self.rank
+
+    def edges(self):
+        return ((prerequisite, dependent)
+                for prerequisite, dependents in self.successors.items() for dependent in dependents)
+
+    def _propagate(self, seeds) -> dict:
+        # Ранг задачи выше рангов всех её предпосылок, поэтому обход в порядке старых рангов
+        # доходит до задачи только после того, как все затронутые предпосылки уже пересчитаны
+        heap = [(self.rank[task_id], task_id) for task_id in set(seeds)]
+        heapq.heapify(heap)
+        queued = {task_id for _, task_id in heap}
+        changes = {}
+        while heap:
+            _, current = heapq.heappop(heap)
+            queued.discard(current)
+            new_rank = max((self.rank[p] + 1 for p in self.predecessors[current]), default=0)
+            if new_rank == self.rank[current]:
+                continue
+            self.rank[current] = changes[current] = new_rank
+            for dependent in self.successors[current]:
+                if dependent not in queued:
+                    queued.add(dependent)
+                    heapq.heappush(heap, (self.rank[dependent], dependent))
+        return changes
+
+    def _path_exists(self, source, target) -> bool:
+        # Задачи с рангом не меньше, чем у target (кроме неё самой), до target не доходят — их не обходим
+        limit = self.rank[target]
+        stack, seen = [source], {source}
+        while stack:
+            current = stack.pop()
+            if current == target:
+                return True
+            for dependent in self.successors[current]:
+                if dependent not in seen and (dependent == target or self.rank[dependent] < limit):
+                    seen.add(dependent)
+                    stack.append(dependent)
+        return False
+
+    def _cycle_path(self, source, target) -> list:
+        # Путь source -> ... -> target для сообщения об ошибке
+        parent = {source: None}
+        stack = [source]
+        while stack:
+            current = stack.pop()
+            if current == target:
+                break
+            for dependent in self.successors[current]:
+                if dependent not in parent:
+                    parent[dependent] = current
+                    stack.append(dependent)
+        path = [target]
+        while parent[path[-1]] is not None:
+            path.append(parent[path[-1]])
+        return path[::-1]
+
+    def add_edge(self, prerequisite, dependent) -> dict:
+        """Добавляет зависимость и возвращает изменившиеся ранги: {task_id: degree}."""
+        if prerequisite not in self.rank or dependent not in self.rank:
+            raise KeyError(f"Задача {prerequisite if prerequisite not in self.rank else dependent} не найдена")
+        if dependent in self.successors[prerequisite]:
+            return {}
+        if prerequisite == dependent or (self.rank[dependent] <= self.rank[prerequisite]
+                                         and self._path_exists(dependent, prerequisite)):
+            raise CycleError(self._cycle_path(dependent, prerequisite) + [dependent])
+        self.successors[prerequisite].add(dependent)
+        self.predecessors[dependent].add(prerequisite)
+        if self.rank[dependent] > self.rank[prerequisite]:
+            return {}
+        return self._propagate([dependent])
+
+    def remove_edge(self, prerequisite, dependent) -> dict:
+        if dependent not in self.successors.get(prerequisite, ()):
+            return {}
+        self.successors[prerequisite].discard(dependent)
+        self.predecessors[dependent].discard(prerequisite)
+        return self._propagate([dependent])
+
+    def add_task(self, task_id, prerequisites=(), dependents=()) -> dict:
+        """Новая задача с зависимостями; в ответе всегда есть её собственный degree."""
+        if task_id in self.rank:
+            raise ValueError(f"Задача {task_id} уже есть в графе")
+        self.successors[task_id] = set()
+        self.predecessors[task_id] = set()
+        self.rank[task_id] = 0
+        changes = {task_id: 0}
+        try:
+            for prerequisite in prerequisites:
+                changes.update(self.add_edge(prerequisite, task_id))
+            for dependent in dependents:
+                changes.update(self.add_edge(task_id, dependent))
+        except (CycleError, KeyError):
+            self.remove_task(task_id)
+            raise
+        return changes
+
+    def remove_task(self, task_id) -> dict:
+        # Удалённая задача в ответ не попадает — её degree писать некуда
+        dependents = self.successors.pop(task_id)
+        for prerequisite in self.predecessors.pop(task_id):
+            self.successors[prerequisite].discard(task_id)
+        for dependent in dependents:
+            self.predecessors[dependent].discard(task_id)
+        del self.rank[task_id]
+        return self._propagate(dependents)
+
+
+def _random_operation(rng: random.Random, order: list, engine: RankEngine, next_id: int):
+    # order — топологический порядок из random_dag: рёбра только от более ранних задач к более поздним,
+    # поэтому случайные операции никогда не создают цикл
+    kind = rng.choices(("add_task", "add_edge", "remove_edge", "remove_task"), weights=(4, 3, 2, 1))[0]
+    if kind == "add_task":
+        position = rng.randrange(len(order) + 1)
+        before, after = order[:position], order[position:]
+        prerequisites = rng.sample(before, min(len(before), rng.randint(0, 3)))
+        dependents = rng.sample(after, min(len(after), rng.randint(0, 2)))
+        order.insert(position, next_id)
+        return kind, (next_id, prerequisites, dependents)
+    if kind == "add_edge":
+        a, b = sorted(rng.sample(range(len(order)), 2))
+        return kind, (order[a], order[b])
+    if kind == "remove_edge":
+        task_id = rng.choice(order)
+        if engine.successors[task_id]:
+            return kind, (task_id, rng.choice(list(engine.successors[task_id])))
+        return kind, (task_id, task_id)
+    task_id = order.pop(rng.randrange(len(order)))
+    return kind, (task_id,)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.rank_engine",
+                                     description="Инкрементальный пересчёт рангов против полного пересчёта")
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--edges", type=int, default=30_000)
+    parser.add_argument("--ops", type=int, default=500, help="Число операций со случайными задачами и зависимостями")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    ids, edges, _ = random_dag(args.tasks, args.edges, args.seed)
+    # random_dag тасует ids и строит рёбра вперёд по списку, поэтому ids — топологический порядок
+    order = list(ids)
+    engine = RankEngine(ids, edges)
+    rng = random.Random(args.seed)
+    next_id = max(ids) + 1
+    incremental, full, changed = [], [], []
+    for _ in range(args.ops):
+        kind, operation = _random_operation(rng, order, engine, next_id)
+        if kind == "add_task":
+            next_id += 1
+        started = time.perf_counter()
+        changes = getattr(engine, kind)(*operation)
+        incremental.append(time.perf_counter() - started)
+        changed.append(len(changes))
+        # Так делает сервер: весь граф заново и degree во все задачи
+        started = time.perf_counter()
+        expected = TaskGraph(engine.rank, engine.edges()).ranks()
+        full.append(time.perf_counter() - started)
+        if expected != engine.rank:
+            raise AssertionError(f"Инкрементальные ранги разошлись с полным пересчётом после {kind}{operation}")
+
+    print(f"{args.tasks} задач, {args.edges} рёбер, {args.ops} операций; итог: {len(engine)} задач")
+    print(f"{'':24}{'mean, мс':>10}{'p50, мс':>10}{'p95, мс':>10}{'max, мс':>10}")
+    for name, values in (("инкрементально", incremental), ("полный пересчёт", full)):
+        summary = summarize(values, quantiles=(50, 95))
+        print(f"{name:24}{summary['mean'] * 1000:10.3f}{summary['p50'] * 1000:10.3f}"
+              f"{summary['p95'] * 1000:10.3f}{summary['max'] * 1000:10.3f}")
+    writes = summarize(changed, quantiles=(50, 95))
+    print(f"записей degree на операцию: среднее {writes['mean']:.1f}, p95 {writes['p95']:.0f}, "
+          f"максимум {writes['max']} (полный пересчёт пишет все {len(engine)})")
+    print(f"ускорение по сумме времени: {sum(full) / sum(incremental):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# utils/shard_plugin.py
+# Плагин pytest: деление набора тестов на N шардов с равной суммарной длительностью.
+# Длительности тестов (setup + call + teardown) копятся в JSON между запусками;
+# тесты раскладываются жадно, от самых долгих (LPT), и внутри шарда идут от долгих к коротким.
+# Параметризованные случаи одного теста раскладываются и упорядочиваются вместе, одной группой:
+# так они идут подряд и --page-reuse=params переиспользует страницу между ними.
+# Запуск шарда: pytest --shard=2/4. --shard=1/1 только упорядочивает весь набор.
+# Все шарды делят тесты по одному и тому же снимку JSON, поэтому шард его не меняет: свои длительности
+# он пишет в отдельный файл рядом (durations.shard-2of4.json), а после всех шардов их сливают в общий:
+#   python -m utils.shard_plugin --merge
+import argparse
+import heapq
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+import pytest
+from utils.logger import logger
+from utils.page_reuse import reuse_key
+from utils.token_cache import FileLock
+
+DEFAULT_STORE = ".timings/durations.json"
+# Длительность теста, для которого ещё нет истории, если история пуста совсем
+DEFAULT_DURATION = 1.0
+
+
+def parse_shard(value: str) -> tuple:
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--shard ожидает i/N, получено: {value}")
+    if total < 1 or not 1 <= index <= total:
+        raise pytest.UsageError(f"--shard: номер шарда должен быть от 1 до N, получено: {value}")
+    return index, total
+
+
+class DurationStore:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def load(self) -> dict:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def update(self, durations: dict):
+        # Несколько запусков на одной машине дописывают общий файл, поэтому чтение и запись под блокировкой
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with FileLock(self.path.with_suffix(".lock")):
+            stored = self.load()
+            stored.update({nodeid: round(duration, 3) for nodeid, duration in durations.items()})
+            self.path.write_text(json.dumps(stored, indent=1, sort_keys=True), encoding="utf-8")
+
+    def shard_path(self, index: int, total: int) -> Path:
+        return self.path.with_name(f"{self.path.stem}.shard-{index}of{total}{self.path.suffix}")
+
+    def save_shard(self, index: int, total: int, durations: dict) -> Path:
+        path = self.shard_path(index, total)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        rounded = {nodeid: round(duration, 3) for nodeid, duration in durations.items()}
+        path.write_text(json.dumps(rounded, indent=1, sort_keys=True), encoding="utf-8")
+        return path
+
+    def merge_shards(self) -> list:
+        """Сливает файлы шардов в общий JSON и удаляет их; возвращает слитые файлы."""
+        paths = sorted(self.path.parent.glob(f"{self.path.stem}.shard-*{self.path.suffix}"))
+        durations = {}
+        for path in paths:
+            try:
+                durations.update(json.loads(path.read_text(encoding="utf-8")))
+            except ValueError:
+                logger.warning(f"Файл длительностей шарда повреждён и пропущен: {path}")
+        if durations:
+            self.update(durations)
+        for path in paths:
+            path.unlink()
+        return paths
+
+
+def split(durations: dict, shards: int) -> list:
+    """Раскладывает тесты по шардам: список [(сумма, [nodeid, ...]), ...].
+
+    Единица раскладки — группа случаев одного теста (reuse_key); внутри шарда группы идут
+    от долгих к коротким, случаи группы — подряд, в порядке сбора.
+    """
+    groups = defaultdict(list)
+    for nodeid in durations:
+        groups[reuse_key(nodeid)].append(nodeid)
+    group_totals = {key: sum(durations[nodeid] for nodeid in nodeids) for key, nodeids in groups.items()}
+    heap = [(0.0, index) for index in range(shards)]
+    buckets = [[] for _ in range(shards)]
+    totals = [0.0] * shards
+    for key in sorted(groups, key=lambda k: (-group_totals[k], k)):
+        total, index = heapq.heappop(heap)
+        buckets[index].extend(groups[key])
+        totals[index] = total + group_totals[key]
+        heapq.heappush(heap, (totals[index], index))
+    return list(zip(totals, buckets))
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("shard", "Деление тестов на шарды по длительности")
+    group.addoption("--shard", default=None, metavar="i/N", help="Запустить i-й из N шардов (нумерация с 1)")
+    group.addoption("--durations-store", default=DEFAULT_STORE,
+                    help="JSON с длительностями тестов из прошлых запусков")
+    group.addoption("--no-store-durations", action="store_true",
+                    help="Не обновлять JSON с длительностями по итогам запуска")
+
+
+class ShardScheduler:
+    def __init__(self, config):
+        self.config = config
+        self.shard = parse_shard(config.getoption("--shard")) if config.getoption("--shard") else None
+        self.store = DurationStore(config.getoption("--durations-store"))
+        self.durations = defaultdict(float)
+        self.skipped = set()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if self.shard is None or not items:
+            return
+        index, total = self.shard
+        stored = self.store.load()
+        known = [stored[item.nodeid] for item in items if item.nodeid in stored]
+        # Новым тестам — средняя длительность известных, чтобы они не копились в одном шарде
+        fallback = sum(known) / len(known) if known else DEFAULT_DURATION
+        durations = {item.nodeid: stored.get(item.nodeid, fallback) for item in items}
+        shard_total, selected = split(durations, total)[index - 1]
+        position = {nodeid: i for i, nodeid in enumerate(selected)}
+        deselected = [item for item in items if item.nodeid not in position]
+        items[:] = sorted((item for item in items if item.nodeid in position), key=lambda item: position[item.nodeid])
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        logger.info(f"Шард {index}/{total}: {len(items)} тестов, ожидаемо {shard_total:.1f} с "
+                    f"(без истории: {len(durations) - len(known)})")
+
+    def pytest_runtest_logreport(self, report):
+        # С pytest-xdist отчёты воркеров приходят и в контроллер, поэтому длительности копит он
+        self.durations[report.nodeid] += report.duration
+        # Пропущенный тест почти ничего не длится — такую длительность не запоминаем
+        if report.skipped:
+            self.skipped.add(report.nodeid)
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput") or self.config.getoption("--no-store-durations"):
+            return
+        durations = {nodeid: d for nodeid, d in self.durations.items() if nodeid not in self.skipped}
+        if self.config.getoption("collectonly") or not durations:
+            return
+        if self.shard is not None:
+            path = self.store.save_shard(*self.shard, durations)
+            logger.info(f"Длительности шарда записаны в {path}; после всех шардов: python -m utils.shard_plugin --merge")
+            return
+        self.store.update(durations)
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(ShardScheduler(config), "shard_scheduler")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m utils.shard_plugin",
+                                     description="Длительности тестов для деления на шарды")
+    parser.add_argument("--store", default=DEFAULT_STORE, help="JSON с длительностями (--durations-store)")
+    parser.add_argument("--merge", action="store_true", help="Слить файлы шардов в общий JSON")
+    args = parser.parse_args(argv)
+    store = DurationStore(args.store)
+    if args.merge:
+        merged = store.merge_shards()
+        print(f"Слито файлов шардов: {len(merged)}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+# utils/stats.py
+import math
+
+
+def percentile(sorted_values: list, q: float) -> float:
+    # Линейная интерполяция между соседними рангами, q в диапазоне [0, 100]
+    if not sorted_values:
+        return float("nan")
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    rank = (len(sorted_values) - 1) * q / 100
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (rank - low)
+
+
+def summarize(values, quantiles=(50, 90, 95, 99)) -> dict:
+    ordered = sorted(values)
+    summary = {"count": len(ordered)}
+    if not ordered:
+        return summary
+    summary["mean"] = sum(ordered) / len(ordered)
+    summary["max"] = ordered[-1]
+    for q in quantiles:
+        summary[f"p{q}"] = percentile(ordered, q)
+    return summary
@@ -0,0 +1,218 @@
+# utils/task_graph.py
+# Эталонная реализация рангов задач (поле degree) для проверки сервера и замеров на больших графах.
+# Ранг считается как в topologicalSort (server/src/controllers/taskController.ts): алгоритм Кана,
+# rank(задача) = max(rank(предпосылка) + 1), у задач без предпосылок 0.
+# Смежность хранится в массивах (CSR): offsets[i]..offsets[i+1] — индексы зависимых задач в targets.
+# Замер: python -m utils.task_graph --tasks 200000 --edges 1000000
+import argparse
+import random
+import time
+from array import array
+
+
+class CycleError(ValueError):
+    def __init__(self, cycle: list):
+        super().__init__(f"Цикл в зависимостях задач: {' -> '.join(map(str, cycle))}")
+        self.cycle = cycle
+
+
+class TaskGraph:
+    def __init__(self, ids, edges, durations=None):
+        # edges — пары (prerequisiteTaskId, dependentTaskId); рёбра к задачам вне графа
+        # отбрасываются, как в getProjectDependencies
+        self.ids = list(ids)
+        self.index = {task_id: i for i, task_id in enumerate(self.ids)}
+        n = len(self.ids)
+        sources, targets = array("l"), array("l")
+        for prerequisite, dependent in edges:
+            source, target = self.index.get(prerequisite), self.index.get(dependent)
+            if source is not None and target is not None:
+                sources.append(source)
+                targets.append(target)
+        self.edge_count = len(targets)
+
+        self.offsets = array("l", [0]) * (n + 1)
+        for source in sources:
+            self.offsets[source + 1] += 1
+        for i in range(n):
+            self.offsets[i + 1] += self.offsets[i]
+        self.targets = array("l", [0]) * self.edge_count
+        cursor = self.offsets[:-1]
+        for source, target in zip(sources, targets):
+            self.targets[cursor[source]] = target
+            cursor[source] += 1
+
+        self.in_degree = array("l", [0]) * n
+        for target in targets:
+            self.in_degree[target] += 1
+        # duration у задачи может быть пустым (null в Prisma) — считаем нулём
+        if durations is None:
+            self.durations = array("l", [0]) * n
+        else:
+            self.durations = array("l", (duration or 0 for duration in durations))
+
+    @classmethod
+    def from_api(cls, tasks: list, dependencies: list) -> "TaskGraph":
+        # Ответы GET /api/tasks/:projectId и GET /api/projects/:projectId/tasks/dependencies
+        return cls(
+            [task["id"] for task in tasks],
+            ((d["prerequisiteTaskId"], d["dependentTaskId"]) for d in dependencies),
+            [task.get("duration") for task in tasks],
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _kahn(self):
+        # Возвращает порядок обхода и ранги; порядок короче числа задач, если есть цикл
+        n = len(self.ids)
+        remaining = array("l", self.in_degree)
+        rank = array("l", [0]) * n
+        order = array("l", (i for i in range(n) if remaining[i] == 0))
+        offsets, targets = self.offsets, self.targets
+        head = 0
+        while head < len(order):
+            current = order[head]
+            head += 1
+            next_rank = rank[current] + 1
+            for k in range(offsets[current], offsets[current + 1]):
+                dependent = targets[k]
+                if rank[dependent] < next_rank:
+                    rank[dependent] = next_rank
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    order.append(dependent)
+        return order, rank
+
+    def topological_order(self) -> list:
+        order, _ = self._kahn()
+        if len(order) != len(self.ids):
+            raise CycleError(self.find_cycle())
+        return [self.ids[i] for i in order]
+
+    def ranks(self) -> dict:
+        """Ранг каждой задачи: task_id -> degree. CycleError, если граф не ацикличен."""
+        order, rank = self._kahn()
+        if len(order) != len(self.ids):
+            raise CycleError(self.find_cycle())
+        return dict(zip(self.ids, rank))
+
+    def find_cycle(self) -> list:
+        # Итеративный DFS с цветами: 0 — не посещена, 1 — в стеке, 2 — обработана
+        n = len(self.ids)
+        color = bytearray(n)
+        parent = array("l", [-1]) * n
+        for start in range(n):
+            if color[start]:
+                continue
+            stack = [(start, self.offsets[start])]
+            color[start] = 1
+            while stack:
+                node, k = stack[-1]
+                if k == self.offsets[node + 1]:
+                    color[node] = 2
+                    stack.pop()
+                    continue
+                stack[-1] = (node, k + 1)
+                child = self.targets[k]
+                if color[child] == 0:
+                    color[child] = 1
+                    parent[child] = node
+                    stack.append((child, self.offsets[child]))
+                elif color[child] == 1:
+                    cycle = [child]
+                    while node != child:
+                        cycle.append(node)
+                        node = parent[node]
+                    cycle.append(child)
+                    return [self.ids[i] for i in reversed(cycle)]
+        return []
+
+    def critical_path(self) -> tuple:
+        """Самый длинный путь по сумме duration: (длительность, [task_id, ...] от начала к концу)."""
+        order, _ = self._kahn()
+        if len(order) != len(self.ids):
+            raise CycleError(self.find_cycle())
+        n = len(self.ids)
+        start = array("l", [0]) * n
+        parent = array("l", [-1]) * n
+        best, best_node = 0, -1
+        for current in order:
+            finish = start[current] + self.durations[current]
+            if best_node < 0 or finish > best:
+                best, best_node = finish, current
+            for k in range(self.offsets[current], self.offsets[current + 1]):
+                dependent = self.targets[k]
+                if parent[dependent] < 0 or finish > start[dependent]:
+                    start[dependent] = finish
+                    parent[dependent] = current
+        path = []
+        node = best_node
+        while node >= 0:
+            path.append(self.ids[node])
+            node = parent[node]
+        return best, path[::-1]
+
+
+def verify_degrees(tasks: list, dependencies: list) -> list:
+    """Сравнивает degree из ответа API с эталоном: [(task_id, ожидаемый, фактический), ...]."""
+    expected = TaskGraph.from_api(tasks, dependencies).ranks()
+    return [(task["id"], expected[task["id"]], task.get("degree"))
+            for task in tasks if task.get("degree") != expected[task["id"]]]
+
+
+def verify_project(api_client, project_id: int, timeout: float = 0, interval: float = 0.5) -> list:
+    # createTask отвечает до await calculateTaskRanks, а задачи слоя создаются параллельно:
+    # сразу после последнего POST пересчёты рангов ещё могут идти. С timeout сверка повторяется,
+    # пока расхождения не исчезнут или не выйдет время; возвращается результат последней сверки
+    deadline = time.monotonic() + timeout
+    while True:
+        mismatches = verify_degrees(api_client.get_tasks(project_id), api_client.get_project_dependencies(project_id))
+        if not mismatches or time.monotonic() >= deadline:
+            return mismatches
+        time.sleep(interval)
+
+
+def random_dag(n_tasks: int, n_edges: int, seed=None, max_duration: int = 10):
+    # Рёбра идут от меньшего номера к большему в случайной перестановке — граф гарантированно ацикличен
+    rng = random.Random(seed)
+    ids = list(range(1, n_tasks + 1))
+    rng.shuffle(ids)
+    edges = set()
+    while len(edges) < n_edges:
+        a, b = rng.randrange(n_tasks), rng.randrange(n_tasks)
+        if a != b:
+            edges.add((ids[min(a, b)], ids[max(a, b)]))
+    durations = [rng.randint(1, max_duration) for _ in ids]
+    return ids, list(edges), durations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.task_graph", description="Замер расчёта рангов задач")
+    parser.add_argument("--tasks", type=int, default=200_000)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+    if args.edges > args.tasks * (args.tasks - 1) // 2:
+        parser.error("Рёбер больше, чем возможно в ацикличном графе с таким числом задач")
+
+    started = time.perf_counter()
+    ids, edges, durations = random_dag(args.tasks, args.edges, args.seed)
+    print(f"генерация графа     {time.perf_counter() - started:8.3f} с  ({args.tasks} задач, {args.edges} рёбер)")
+    timings = []
+    started = time.perf_counter()
+    graph = TaskGraph(ids, edges, durations)
+    timings.append(("построение CSR", time.perf_counter() - started))
+    started = time.perf_counter()
+    ranks = graph.ranks()
+    timings.append(("ранги (Кан)", time.perf_counter() - started))
+    started = time.perf_counter()
+    length, path = graph.critical_path()
+    timings.append(("критический путь", time.perf_counter() - started))
+    for name, seconds in timings:
+        print(f"{name:20}{seconds:8.3f} с")
+    print(f"максимальный ранг {max(ranks.values())}, критический путь {length} дн. через {len(path)} задач")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# utils/timing_plugin.py
+# Плагин pytest: длительность каждого allure.step и каждого действия страниц (page_action).
+# Записи пишутся в JSONL, в конце сессии печатается таблица самых медленных шагов
+# и перцентили по действиям страниц. Отключается через -p no:utils.timing_plugin
+import json
+import time
+from collections import defaultdict
+from pathlib import Path
+import allure_commons
+from utils.instrumentation import add_timing_listener, remove_timing_listener
+from utils.stats import summarize
+from utils.workers import get_worker_id
+
+
+class StepTimer:
+    def __init__(self, path: Path):
+        self.path = path
+        self.test_id = None
+        self._started = {}
+        self._depth = 0
+        self._file = path.open("a", encoding="utf-8")
+
+    def close(self):
+        self._file.close()
+
+    def write(self, kind: str, name: str, duration: float, ok: bool, page: str = None):
+        self._file.write(json.dumps({
+            "test": self.test_id,
+            "worker": get_worker_id(),
+            "kind": kind,
+            "name": name,
+            "page": page,
+            "depth": self._depth,
+            "duration": round(duration, 6),
+            "ok": ok,
+        }, ensure_ascii=False) + "\n")
+
+    @allure_commons.hookimpl
+    def start_step(self, uuid, title, params):
+        self._started[uuid] = (title, time.perf_counter())
+        self._depth += 1
+
+    @allure_commons.hookimpl
+    def stop_step(self, uuid, exc_type, exc_val, exc_tb):
+        started = self._started.pop(uuid, None)
+        self._depth -= 1
+        if started is not None:
+            title, started_at = started
+            self.write("step", title, time.perf_counter() - started_at, exc_type is None)
+
+    def on_page_action(self, page_class: str, action: str, duration: float, ok: bool):
+        self.write("action", f"{page_class}.{action}", duration, ok, page=page_class)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("timings", "Замеры длительности шагов")
+    group.addoption("--timings-dir", default=".timings", help="Каталог для JSONL с длительностями шагов")
+    group.addoption("--timings-top", type=int, default=15, help="Сколько самых медленных шагов показать в конце сессии")
+
+
+def _is_xdist_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+def pytest_configure(config):
+    directory = Path(config.getoption("--timings-dir"))
+    directory.mkdir(parents=True, exist_ok=True)
+    if not _is_xdist_worker(config):
+        # Контроллер (или единственный процесс) очищает результаты прошлого запуска до старта воркеров
+        for old in directory.glob("steps_*.jsonl"):
+            old.unlink()
+    timer = StepTimer(directory / f"steps_{get_worker_id()}.jsonl")
+    allure_commons.plugin_manager.register(timer)
+    add_timing_listener(timer.on_page_action)
+    config._step_timer = timer
+
+
+def pytest_unconfigure(config):
+    timer = getattr(config, "_step_timer", None)
+    if timer is None:
+        return
+    remove_timing_listener(timer.on_page_action)
+    allure_commons.plugin_manager.unregister(timer)
+    timer.close()
+
+
+def pytest_runtest_setup(item):
+    item.config._step_timer.test_id = item.nodeid
+
+
+def pytest_runtest_teardown(item):
+    item.config._step_timer._file.flush()
+
+
+def load_records(directory: Path) -> list:
+    records = []
+    for path in sorted(directory.glob("steps_*.jsonl")):
+        with path.open(encoding="utf-8") as f:
+            records.extend(json.loads(line) for line in f if line.strip())
+    return records
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if _is_xdist_worker(config):
+        return
+    config._step_timer._file.flush()
+    records = load_records(Path(config.getoption("--timings-dir")))
+    if not records:
+        return
+    top = config.getoption("--timings-top")
+    write = terminalreporter.write_line
+
+    terminalreporter.section(f"Самые медленные шаги (top {top})")
+    for record in sorted((r for r in records if r["kind"] == "step"), key=lambda r: r["duration"], reverse=True)[:top]:
+        status = "ok" if record["ok"] else "FAIL"
+        write(f"{record['duration']:9.3f}s  {status:4}  {record['name'][:80]:80}  {record['test']}")
+
+    actions = defaultdict(list)
+    pages = defaultdict(list)
+    for record in records:
+        if record["kind"] == "action":
+            actions[record["name"]].append(record["duration"])
+            pages[record["page"]].append(record["duration"])
+    if not actions:
+        return
+    _write_percentiles(terminalreporter, "Страницы: перцентили действий, с", "страница", pages)
+    _write_percentiles(terminalreporter, "Действия страниц: перцентили, с", "действие", actions)
+
+
+def _write_percentiles(terminalreporter, title: str, label: str, groups: dict):
+    write = terminalreporter.write_line
+    terminalreporter.section(title)
+    write(f"{label:50} {'n':>6} {'p50':>8} {'p90':>8} {'p95':>8} {'max':>8} {'всего':>9}")
+    rows = [(name, summarize(durations), sum(durations)) for name, durations in groups.items()]
+    for name, summary, total in sorted(rows, key=lambda row: row[2], reverse=True):
+        write(f"{name[:50]:50} {summary['count']:6d} {summary['p50']:8.3f} {summary['p90']:8.3f} "
+              f"{summary['p95']:8.3f} {summary['max']:8.3f} {total:9.3f}")
@@ -0,0 +1,183 @@
+# utils/token_cache.py
+import base64
+import json
+import os
+import time
+import requests
+from pathlib import Path
+from utils.logger import logger
+from utils.workers import AUTH_DIR
+
+# Токен считается непригодным, если до истечения осталось меньше этого запаса (секунды)
+DEFAULT_MIN_TTL = 300
+
+
+def decode_jwt_exp(token: str):
+    # Подпись не проверяем: нужен только срок действия из payload
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+
+
+class FileLock:
+    """Межпроцессная блокировка через lock-файл, создаваемый атомарно (O_EXCL)."""
+
+    def __init__(self, path: Path, timeout: float = 30, poll_interval: float = 0.05):
+        self.path = Path(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, str(os.getpid()).encode())
+                return self
+            except FileExistsError:
+                if self._is_stale():
+                    logger.warning(f"Удаление зависшей блокировки {self.path}")
+                    self._remove()
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Не удалось получить блокировку {self.path} за {self.timeout} с")
+                time.sleep(self.poll_interval)
+
+    def __exit__(self, exc_type, exc, tb):
+        os.close(self._fd)
+        self._fd = None
+        self._remove()
+
+    def _is_stale(self) -> bool:
+        try:
+            return time.time() - self.path.stat().st_mtime > self.timeout
+        except FileNotFoundError:
+            return False
+
+    def _remove(self):
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class TokenCache:
+    """Кэш токенов на диске с ключом (API_URL, EMAIL).
+
+    Токен переиспользуется, пока до его истечения (claim exp) остаётся больше
+    min_ttl секунд. Истёкший токен обновляется через /refresh/token по refresh-cookie,
+    полный логин выполняется только если обновить не удалось.
+    """
+
+    def __init__(self, path: Path = None, min_ttl: int = DEFAULT_MIN_TTL, timeout: int = 10):
+        self.path = Path(path) if path else AUTH_DIR / "token_cache.json"
+        self.lock_path = self.path.with_suffix(".lock")
+        self.min_ttl = min_ttl
+        self.timeout = timeout
+
+    @staticmethod
+    def key(api_url: str, email: str) -> str:
+        return f"{api_url.rstrip('/')}|{email}"
+
+    def is_fresh(self, token: str) -> bool:
+        exp = decode_jwt_exp(token)
+        return exp is not None and exp - time.time() > self.min_ttl
+
+    def get_or_login(self, api_url: str, email: str, password: str) -> dict:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        key = self.key(api_url, email)
+        with FileLock(self.lock_path):
+            entries = self._load()
+            entry = entries.get(key)
+            if entry and self.is_fresh(entry["token"]):
+                logger.info(f"Используется кэшированный токен для {email}")
+                return entry
+            entry = self._refresh(api_url, entry) if entry else None
+            if entry is None:
+                entry = self._login(api_url, email, password)
+            entries[key] = entry
+            self._save(entries)
+            return entry
+
+    def signup(self, api_url: str, email: str, password: str, username: str) -> dict:
+        """Регистрирует пользователя через API и логинит его; одноразовые пользователи в кэш не попадают."""
+        logger.info(f"Регистрация через API: {email}")
+        response = requests.post(
+            f"{api_url}/auth/signup",
+            json={"username": username, "email": email, "password": password},
+            headers={"Content-Type": "application/json"},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        return self._login(api_url, email, password)
+
+    def invalidate(self, api_url: str, email: str):
+        with FileLock(self.lock_path):
+            entries = self._load()
+            if entries.pop(self.key(api_url, email), None) is not None:
+                self._save(entries)
+
+    def invalidate_api(self, api_url: str):
+        # Все токены одного API, например mock-сервера, который при каждом старте подписывает токены новым ключом
+        prefix = self.key(api_url, "")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with FileLock(self.lock_path):
+            entries = self._load()
+            stale = [key for key in entries if key.startswith(prefix)]
+            for key in stale:
+                del entries[key]
+            if stale:
+                self._save(entries)
+
+    def _refresh(self, api_url: str, entry: dict):
+        refresh_token = entry.get("refresh_token")
+        if not refresh_token or not self.is_fresh(refresh_token):
+            return None
+        try:
+            response = requests.get(
+                f"{api_url}/refresh/token",
+                cookies={"jwt": refresh_token},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            token = response.json().get("accessToken")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.warning(f"Не удалось обновить токен, выполняется полный логин: {e}")
+            return None
+        if not token:
+            return None
+        logger.info("Токен обновлён через refresh-токен")
+        return {**entry, "token": token}
+
+    def _login(self, api_url: str, email: str, password: str) -> dict:
+        logger.info(f"Логин через API для {email}")
+        response = requests.post(
+            f"{api_url}/auth/login",
+            json={"email": email, "password": password},
+            headers={"Content-Type": "application/json"},
+            timeout=self.timeout
+        )
+        response.raise_for_status()
+        response_data = response.json()
+        token = response_data.get("token")
+        user = response_data.get("user")
+        if not token or not user:
+            logger.error("Нет токена или данных пользователя в ответе API")
+            raise AssertionError("Нет токена или данных пользователя в ответе API")
+        return {"token": token, "user": user, "refresh_token": response.cookies.get("jwt")}
+
+    def _load(self) -> dict:
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _save(self, entries: dict):
+        # Запись через временный файл, чтобы читатели не увидели половину JSON
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.path)
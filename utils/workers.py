@@ -0,0 +1,24 @@
+# utils/workers.py
+import os
+from pathlib import Path
+
+# Каталог для файлов состояния авторизации (по одному на воркер pytest-xdist)
+AUTH_DIR = Path(__file__).resolve().parent.parent / ".auth"
+
+
+def get_worker_id() -> str:
+    # Без pytest-xdist переменная не задана — считаем процесс единственным воркером
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+def get_worker_count() -> int:
+    return int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+
+def is_parallel() -> bool:
+    return get_worker_id() != "master"
+
+
+def storage_state_path(worker_id: str = None) -> Path:
+    AUTH_DIR.mkdir(exist_ok=True)
+    return AUTH_DIR / f"state_{worker_id or get_worker_id()}.json"